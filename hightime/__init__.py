@@ -8,6 +8,26 @@ The classes defined in this package are:
 * :any:`hightime.timedelta`: A subclass of :any:`datetime.timedelta` with sub-microsecond
   capabilities.
 
+* :any:`hightime.TimedeltaAccumulator`: A mutable, exact running total of durations.
+
+* :any:`hightime.DatetimeArray`: A compact, immutable sequence of exact datetimes.
+
+* :any:`hightime.TimedeltaArray`: A compact, immutable sequence of exact durations.
+
+* :any:`hightime.Stopwatch`: Records the durations of repeated operations, for profiling.
+
+* :any:`hightime.MonotonicStamper`: Returns unique, strictly increasing timestamps.
+
+* :any:`hightime.SampleClock`: The exact sample times of a regularly sampled waveform.
+
+* :any:`hightime.TickTimebase`: Maps a wrapping hardware tick counter to exact datetimes.
+
+The functions defined in this package are:
+
+* :any:`hightime.merge`: Merges sorted streams of timestamped items.
+
+* :any:`hightime.timer`: Returns a :any:`hightime.Stopwatch` for timing one operation.
+
 .. note::
    Due to floating point arithmetic inaccuracies, the ability to specify
    sub-microsecond values in terms of much larger units (weeks, days, seconds) has been
@@ -16,40 +36,68 @@ The classes defined in this package are:
 
 import datetime as _std_datetime
 
+from hightime._accumulator import TimedeltaAccumulator
+from hightime._array import DatetimeArray, TimedeltaArray
 from hightime._datetime import datetime
+from hightime._merge import merge
+from hightime._sampleclock import SampleClock
+from hightime._stamper import MonotonicStamper
+from hightime._stopwatch import Stopwatch, timer
+from hightime._ticktimebase import TickTimebase
 from hightime._timedelta import timedelta
 
-__all__ = ["datetime", "timedelta"]
+__all__ = [
+    "datetime",
+    "timedelta",
+    "DatetimeArray",
+    "MonotonicStamper",
+    "SampleClock",
+    "Stopwatch",
+    "TickTimebase",
+    "TimedeltaAccumulator",
+    "TimedeltaArray",
+    "merge",
+    "timer",
+]
 
 # Hide that it was defined in a helper file
 datetime.__module__ = __name__
 timedelta.__module__ = __name__
+DatetimeArray.__module__ = __name__
+MonotonicStamper.__module__ = __name__
+SampleClock.__module__ = __name__
+Stopwatch.__module__ = __name__
+TickTimebase.__module__ = __name__
+TimedeltaAccumulator.__module__ = __name__
+TimedeltaArray.__module__ = __name__
+merge.__module__ = __name__
+timer.__module__ = __name__
 
 
-datetime.min = datetime(
-    year=_std_datetime.datetime.min.year,
-    month=_std_datetime.datetime.min.month,
-    day=_std_datetime.datetime.min.day,
+# These are built directly from their fields or exact yoctosecond counts, so that
+# importing hightime does not have to run the general-purpose constructors.
+datetime.min = datetime._new_impl(
+    _std_datetime.datetime.min.year,
+    _std_datetime.datetime.min.month,
+    _std_datetime.datetime.min.day,
 )
-datetime.max = datetime(
-    year=_std_datetime.datetime.max.year,
-    month=_std_datetime.datetime.max.month,
-    day=_std_datetime.datetime.max.day,
-    hour=_std_datetime.datetime.max.hour,
-    minute=_std_datetime.datetime.max.minute,
-    second=_std_datetime.datetime.max.second,
-    microsecond=_std_datetime.datetime.max.microsecond,
-    femtosecond=999999999,
-    yoctosecond=999999999,
+datetime.max = datetime._new_impl(
+    _std_datetime.datetime.max.year,
+    _std_datetime.datetime.max.month,
+    _std_datetime.datetime.max.day,
+    _std_datetime.datetime.max.hour,
+    _std_datetime.datetime.max.minute,
+    _std_datetime.datetime.max.second,
+    _std_datetime.datetime.max.microsecond,
+    999999999,
+    999999999,
 )
-datetime.resolution = timedelta(yoctoseconds=1)
-
-timedelta.min = timedelta(days=_std_datetime.timedelta.min.days)
-timedelta.max = timedelta(
-    days=_std_datetime.timedelta.max.days,
-    seconds=_std_datetime.timedelta.max.seconds,
-    microseconds=_std_datetime.timedelta.max.microseconds,
-    femtoseconds=999999999,
-    yoctoseconds=999999999,
+datetime.resolution = timedelta._from_ys(1)
+
+timedelta.min = timedelta._from_ys(timedelta._as_ys(_std_datetime.timedelta.min))
+timedelta.max = timedelta._from_ys(
+    timedelta._as_ys(_std_datetime.timedelta.max)
+    + timedelta._as_ys(_std_datetime.timedelta.resolution)
+    - 1
 )
-timedelta.resolution = timedelta(yoctoseconds=1)
+timedelta.resolution = timedelta._from_ys(1)
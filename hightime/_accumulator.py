@@ -0,0 +1,122 @@
+import datetime as std_datetime
+
+import hightime
+from hightime._timedelta import _divide_and_round
+
+
+def _check_timedelta(value):
+    if not isinstance(value, std_datetime.timedelta):
+        raise TypeError("a timedelta is required (got type %s)" % type(value).__name__)
+    return hightime.timedelta._as_ys(value)
+
+
+class TimedeltaAccumulator:
+    """A mutable running total of durations.
+
+    Unlike :any:`hightime.timedelta`, the accumulator is updated in place and keeps its total as
+    an exact integer number of yoctoseconds, so adding to it in a tight loop does not allocate or
+    re-normalize a new object on every step. Call :meth:`freeze` to get the total as a
+    :any:`hightime.timedelta`.
+
+    Both :any:`hightime.timedelta` and :any:`datetime.timedelta` values are accepted.
+
+    >>> import datetime
+    >>> acc = TimedeltaAccumulator()
+    >>> for _ in range(3):
+    ...     acc += timedelta(femtoseconds=1)
+    >>> acc.add(datetime.timedelta(microseconds=2)).scale(2)
+    hightime.TimedeltaAccumulator(hightime.timedelta(microseconds=4, femtoseconds=6))
+    >>> acc.freeze()
+    hightime.timedelta(microseconds=4, femtoseconds=6)
+    """
+
+    __slots__ = ("_yoctoseconds",)
+
+    def __init__(self, initial=None):
+        """Initialize the accumulator, optionally starting from ``initial``."""
+        self._yoctoseconds = 0 if initial is None else _check_timedelta(initial)
+
+    # Public properties
+
+    @property
+    def yoctoseconds(self):
+        """Exact total in yoctoseconds."""
+        return self._yoctoseconds
+
+    # Public methods
+
+    def add(self, other):
+        """Add ``other`` to the total in place and return self."""
+        self._yoctoseconds += _check_timedelta(other)
+        return self
+
+    def sub(self, other):
+        """Subtract ``other`` from the total in place and return self."""
+        self._yoctoseconds -= _check_timedelta(other)
+        return self
+
+    def scale(self, factor):
+        """Multiply the total by ``factor`` in place and return self.
+
+        Integer factors are exact. Other factors (``float``, :any:`fractions.Fraction`,
+        :any:`decimal.Decimal`) are applied as exact ratios and rounded half to even to the
+        nearest yoctosecond.
+        """
+        if isinstance(factor, int):
+            self._yoctoseconds *= factor
+        else:
+            numerator, denominator = factor.as_integer_ratio()
+            self._yoctoseconds = _divide_and_round(self._yoctoseconds * numerator, denominator)
+        return self
+
+    def reset(self):
+        """Reset the total to zero and return self."""
+        self._yoctoseconds = 0
+        return self
+
+    def freeze(self):
+        """Return the total as a :any:`hightime.timedelta`."""
+        return hightime.timedelta._from_ys(self._yoctoseconds)
+
+    # In-place operators
+
+    def __iadd__(self, other):
+        """Implement self+=other."""
+        if not isinstance(other, std_datetime.timedelta):
+            return NotImplemented
+        return self.add(other)
+
+    def __isub__(self, other):
+        """Implement self-=other."""
+        if not isinstance(other, std_datetime.timedelta):
+            return NotImplemented
+        return self.sub(other)
+
+    def __imul__(self, other):
+        """Implement self*=other."""
+        if not hasattr(other, "as_integer_ratio"):
+            return NotImplemented
+        return self.scale(other)
+
+    # Other operators
+
+    def __bool__(self):
+        """Return bool(self)."""
+        return self._yoctoseconds != 0
+
+    def __eq__(self, other):
+        """Return self==other."""
+        if isinstance(other, TimedeltaAccumulator):
+            return self._yoctoseconds == other._yoctoseconds
+        elif isinstance(other, std_datetime.timedelta):
+            return self._yoctoseconds == hightime.timedelta._as_ys(other)
+        return NotImplemented
+
+    # Mutable, so not hashable
+    __hash__ = None
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return "{}.{}({!r})".format(
+            self.__class__.__module__, self.__class__.__qualname__, self.freeze()
+        )
@@ -0,0 +1,23 @@
+import datetime as std_datetime
+from typing import ClassVar, Optional, SupportsFloat, Union
+
+import hightime
+
+_Factor = Union[int, SupportsFloat]
+
+class TimedeltaAccumulator:
+    __hash__: ClassVar[None]  # type: ignore[assignment]
+    def __init__(self, initial: Optional[std_datetime.timedelta] = ...) -> None: ...
+    def __bool__(self) -> bool: ...
+    def __eq__(self, other: object, /) -> bool: ...
+    def __iadd__(self, other: std_datetime.timedelta, /) -> TimedeltaAccumulator: ...
+    def __imul__(self, other: _Factor, /) -> TimedeltaAccumulator: ...
+    def __isub__(self, other: std_datetime.timedelta, /) -> TimedeltaAccumulator: ...
+    def __repr__(self) -> str: ...
+    def add(self, other: std_datetime.timedelta, /) -> TimedeltaAccumulator: ...
+    def freeze(self) -> hightime.timedelta: ...
+    def reset(self) -> TimedeltaAccumulator: ...
+    def scale(self, factor: _Factor, /) -> TimedeltaAccumulator: ...
+    def sub(self, other: std_datetime.timedelta, /) -> TimedeltaAccumulator: ...
+    @property
+    def yoctoseconds(self) -> int: ...
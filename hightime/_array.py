@@ -0,0 +1,402 @@
+import datetime as std_datetime
+
+import hightime
+from hightime._datetime import _byte_view
+from hightime._zonetable import _DAY_YS, _check_policies, _has_table, _zone_table
+
+# Each element is a little-endian signed 128-bit count of yoctoseconds since the Unix epoch, in
+# UTC. That covers the whole hightime.datetime range exactly.
+_RECORD_SIZE = 16
+_BYTEORDER = "little"
+
+
+def _pack_ys(values):
+    try:
+        return b"".join([ys.to_bytes(_RECORD_SIZE, _BYTEORDER, signed=True) for ys in values])
+    except OverflowError:
+        raise OverflowError("value out of range for DatetimeArray") from None
+
+
+class _RecordArray:
+    # Base class of the arrays of packed records, which view a memoryview of records from
+    # _start, taking _length records _step records apart.
+
+    __slots__ = ("_view", "_start", "_length", "_step")
+
+    def _init_view(self, view, start=0, length=None, step=1):
+        self._view = view
+        self._start = start
+        self._length = view.nbytes // _RECORD_SIZE if length is None else length
+        self._step = step
+
+    def _slice_bounds(self, index):
+        # Return (start, length, step) of the records selected by the slice ``index``.
+        start, stop, step = index.indices(self._length)
+        return self._start + start * self._step, len(range(start, stop, step)), self._step * step
+
+    # Public methods
+
+    def tobytes(self):
+        """Return the packed records of the elements as ``bytes``."""
+        if self._step == 1:
+            offset = self._start * _RECORD_SIZE
+            return self._view[offset : offset + self._length * _RECORD_SIZE].tobytes()
+        return _pack_ys(self._iter_ys())
+
+    def tolist(self):
+        """Return the elements as a list."""
+        return list(self)
+
+    # Sequence protocol
+
+    def __len__(self):
+        """Return len(self)."""
+        return self._length
+
+    # Buffer protocol
+
+    def __buffer__(self, flags):
+        """Return a memoryview of the packed records (PEP 688).
+
+        Strided views are packed into a new buffer first; other arrays are viewed without
+        copying. On Python versions before 3.12, use :meth:`tobytes` instead.
+        """
+        if self._step == 1:
+            offset = self._start * _RECORD_SIZE
+            return self._view[offset : offset + self._length * _RECORD_SIZE]
+        return memoryview(self.tobytes())
+
+    def __release_buffer__(self, view):
+        """Release a memoryview returned by :meth:`__buffer__`."""
+        view.release()
+
+    # Immutable but compared by value, like a list
+    __hash__ = None
+
+    # Helper methods
+
+    def _repr_items(self):
+        if self._length <= 6:
+            return ", ".join(repr(value) for value in self)
+        return ", ".join(
+            [repr(self[i]) for i in range(3)] + ["..."] + [repr(self[i]) for i in range(-3, 0)]
+        )
+
+    def _ys(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("{} index out of range".format(type(self).__name__))
+        offset = (self._start + index * self._step) * _RECORD_SIZE
+        return int.from_bytes(self._view[offset : offset + _RECORD_SIZE], _BYTEORDER, signed=True)
+
+    def _iter_ys(self):
+        view = self._view
+        from_bytes = int.from_bytes
+        stride = self._step * _RECORD_SIZE
+        offset = self._start * _RECORD_SIZE
+        for _ in range(self._length):
+            yield from_bytes(view[offset : offset + _RECORD_SIZE], _BYTEORDER, signed=True)
+            offset += stride
+
+
+class DatetimeArray(_RecordArray):
+    """A compact, immutable sequence of :any:`hightime.datetime` values.
+
+    Elements are stored exactly as 16-byte records of yoctoseconds since the Unix epoch in UTC,
+    and are only materialized as :any:`hightime.datetime` objects when accessed. Slicing returns
+    a view that shares the same storage.
+
+    Elements are returned in ``tzinfo``, or as naive UTC datetimes if ``tzinfo`` is ``None``.
+    When building from datetimes, aware values are converted to UTC and naive values are treated
+    as UTC.
+
+    >>> array = DatetimeArray([datetime(2024, 1, 1), datetime(2024, 1, 2, femtosecond=5)])
+    >>> len(array)
+    2
+    >>> array[-1]
+    hightime.datetime(2024, 1, 2, 0, 0, 0, 0, 5)
+    >>> [str(dt) for dt in array[::-1]]
+    ['2024-01-02 00:00:00.000000000000005', '2024-01-01 00:00:00']
+    """
+
+    __slots__ = ("_tzinfo",)
+
+    def __init__(self, datetimes=(), tzinfo=None):
+        """Initialize the array from an iterable of datetimes."""
+        self._init(memoryview(_pack_ys(dt._to_epoch_ys() for dt in datetimes)), tzinfo)
+
+    def _init(self, view, tzinfo, start=0, length=None, step=1):
+        if tzinfo is not None and not isinstance(tzinfo, std_datetime.tzinfo):
+            raise TypeError("tzinfo must be a tzinfo or None, not %s" % type(tzinfo).__name__)
+        self._init_view(view, start, length, step)
+        self._tzinfo = tzinfo
+
+    # Public properties
+
+    @property
+    def tzinfo(self):
+        """The time zone the elements are returned in."""
+        return self._tzinfo
+
+    # Public classmethods
+
+    @classmethod
+    def frombuffer(cls, buffer, tzinfo=None):
+        """Return an array that views ``buffer`` without copying it.
+
+        ``buffer`` is any object supporting the buffer protocol whose bytes are packed 16-byte
+        little-endian signed yoctosecond counts since the Unix epoch in UTC, as produced by
+        :meth:`tobytes`.
+        """
+        self = cls.__new__(cls)
+        self._init(_byte_view(buffer, _RECORD_SIZE), tzinfo)
+        return self
+
+    # Public methods
+
+    def searchsorted(self, value, side="left"):
+        """Return the index where ``value`` would be inserted to keep a sorted array sorted.
+
+        With ``side="left"``, the index is before any elements equal to ``value``; with
+        ``side="right"``, it is after them. ``value`` is compared as an instant; a naive
+        ``value`` is treated as UTC. The array must be sorted in ascending order.
+        """
+        if side not in ("left", "right"):
+            raise ValueError("side must be 'left' or 'right'", side)
+        target = value._to_epoch_ys()
+        ys = self._ys
+        low = 0
+        high = self._length
+        if side == "left":
+            while low < high:
+                middle = (low + high) // 2
+                if ys(middle) < target:
+                    low = middle + 1
+                else:
+                    high = middle
+        else:
+            while low < high:
+                middle = (low + high) // 2
+                if target < ys(middle):
+                    high = middle
+                else:
+                    low = middle + 1
+        return low
+
+    def tz_convert(self, tz):
+        """Return a view of the same instants that returns its elements in ``tz``.
+
+        ``tz`` is a tzinfo, or ``None`` for naive UTC datetimes. The records are not copied.
+        """
+        result = type(self).__new__(type(self))
+        result._init(self._view, tz, self._start, self._length, self._step)
+        return result
+
+    def tz_localize(self, tz, ambiguous="raise", nonexistent="raise"):
+        """Return an array of the local times of this naive array, interpreted in ``tz``.
+
+        Each element's fields are taken as a wall clock time in ``tz``, and the result holds the
+        corresponding instants in ``tz``. If ``tz`` is ``None``, this array must be aware, and the
+        result holds its wall clock times as naive datetimes instead.
+
+        ``ambiguous`` selects the instant for a wall clock time that occurs twice, such as when
+        daylight saving time ends: ``"raise"`` raises :any:`ValueError`, and ``"earliest"`` and
+        ``"latest"`` select the first or second occurrence. ``nonexistent`` handles a wall clock
+        time that is skipped, such as when daylight saving time starts: ``"raise"`` raises
+        :any:`ValueError`, ``"shift_forward"`` selects the instant of the transition, and
+        ``"shift_backward"`` selects the last yoctosecond before it.
+
+        Fixed offsets and :any:`zoneinfo.ZoneInfo` zones are resolved with a table of the zone's
+        transitions over the array's time range, which is cached; the table is searched again
+        only when the next element falls in a different interval. Other tzinfo implementations
+        are called for each element with ``fold=0``, and ``ambiguous`` and ``nonexistent`` do
+        not apply.
+
+        >>> import zoneinfo
+        >>> eastern = zoneinfo.ZoneInfo("America/New_York")
+        >>> array = DatetimeArray([datetime(2024, 3, 10, 1, 30), datetime(2024, 3, 10, 2, 30)])
+        >>> [str(dt) for dt in array.tz_localize(eastern, nonexistent="shift_forward")]
+        ['2024-03-10 01:30:00-05:00', '2024-03-10 03:00:00-04:00']
+        """
+        _check_policies(ambiguous, nonexistent)
+        if tz is None:
+            if self._tzinfo is None:
+                raise ValueError("array is already naive")
+            table = self._window_table(self._tzinfo, 0)
+            if table is None:
+                from_epoch_ys = hightime.datetime._from_epoch_ys
+                values = (
+                    from_epoch_ys(ys, self._tzinfo).replace(tzinfo=None)._to_epoch_ys()
+                    for ys in self._iter_ys()
+                )
+            else:
+                values = (wall for wall, _ in table.iter_wall(self._iter_ys()))
+            return self._from_ys(values)
+
+        if self._tzinfo is not None:
+            raise ValueError("array is already aware; use tz_convert to change time zones")
+        if not _has_table(tz):
+            from_wall_ys = hightime.datetime._from_wall_ys
+            values = (from_wall_ys(wall, tz)._to_epoch_ys() for wall in self._iter_ys())
+            return self._from_ys(values, tz)
+
+        # An instant is within a day of its wall clock time, and localize looks a day further.
+        margin = 2 * _DAY_YS
+        table = self._window_table(tz, margin)
+        if table is None:
+            # The elements are too far apart for one table, so use a table around each one.
+            values = (
+                _zone_table(tz, wall - margin, wall + margin, 1).localize(
+                    wall, ambiguous, nonexistent
+                )
+                for wall in self._iter_ys()
+            )
+        else:
+            localize = table.localize
+            values = (localize(wall, ambiguous, nonexistent) for wall in self._iter_ys())
+        return self._from_ys(values, tz)
+
+    # Sequence protocol
+
+    def __getitem__(self, index):
+        """Return self[index]."""
+        if isinstance(index, slice):
+            result = type(self).__new__(type(self))
+            result._init(self._view, self._tzinfo, *self._slice_bounds(index))
+            return result
+        return hightime.datetime._from_epoch_ys(self._ys(index), self._tzinfo)
+
+    def __iter__(self):
+        """Implement iter(self)."""
+        tzinfo = self._tzinfo
+        # The table starts a day early, to tell whether the first elements are in a fold.
+        table = None if tzinfo is None else self._window_table(tzinfo, _DAY_YS)
+        if table is None:
+            from_epoch_ys = hightime.datetime._from_epoch_ys
+            for ys in self._iter_ys():
+                yield from_epoch_ys(ys, tzinfo)
+        else:
+            from_wall_ys = hightime.datetime._from_wall_ys
+            for wall, fold in table.iter_wall(self._iter_ys()):
+                yield from_wall_ys(wall, tzinfo, fold)
+
+    # Other operators
+
+    def __eq__(self, other):
+        """Return self==other."""
+        if not isinstance(other, DatetimeArray):
+            return NotImplemented
+        return (
+            self._length == other._length
+            and self._tzinfo == other._tzinfo
+            and all(a == b for a, b in zip(self._iter_ys(), other._iter_ys()))
+        )
+
+    def __repr__(self):
+        """Return repr(self)."""
+        items = self._repr_items()
+        tzinfo = "" if self._tzinfo is None else ", tzinfo={!r}".format(self._tzinfo)
+        return "{}.{}([{}]{})".format(
+            self.__class__.__module__, self.__class__.__qualname__, items, tzinfo
+        )
+
+    # Helper methods
+
+    @classmethod
+    def _from_ys(cls, values, tzinfo=None):
+        # Build an array from an iterable of yoctoseconds since the Unix epoch.
+        self = cls.__new__(cls)
+        self._init(memoryview(_pack_ys(values)), tzinfo)
+        return self
+
+    def _window_table(self, tzinfo, margin):
+        # Return the zone table for tzinfo covering the elements, widened by ``margin``
+        # yoctoseconds on each side, or None if tzinfo is to be called for each element.
+        if not self._length:
+            return None
+        low = min(self._iter_ys())
+        high = max(self._iter_ys())
+        return _zone_table(tzinfo, low - margin, high + margin, self._length)
+
+
+class TimedeltaArray(_RecordArray):
+    """A compact, immutable sequence of :any:`hightime.timedelta` values.
+
+    Elements are stored exactly as 16-byte records of yoctoseconds, the same layout as
+    :any:`DatetimeArray`, and are only materialized as :any:`hightime.timedelta` objects when
+    accessed. Slicing returns a view that shares the same storage.
+
+    >>> array = TimedeltaArray([timedelta(seconds=1), timedelta(yoctoseconds=5)])
+    >>> array[1]
+    hightime.timedelta(yoctoseconds=5)
+    >>> array.sum()
+    hightime.timedelta(seconds=1, yoctoseconds=5)
+    """
+
+    __slots__ = ()
+
+    def __init__(self, timedeltas=()):
+        """Initialize the array from an iterable of timedeltas."""
+        as_ys = hightime.timedelta._as_ys
+        self._init_view(memoryview(_pack_ys(as_ys(td) for td in timedeltas)))
+
+    # Public classmethods
+
+    @classmethod
+    def frombuffer(cls, buffer):
+        """Return an array that views ``buffer`` without copying it.
+
+        ``buffer`` is any object supporting the buffer protocol whose bytes are packed 16-byte
+        little-endian signed yoctosecond counts, as produced by :meth:`tobytes`.
+        """
+        self = cls.__new__(cls)
+        self._init_view(_byte_view(buffer, _RECORD_SIZE))
+        return self
+
+    # Public methods
+
+    def sum(self):
+        """Return the exact sum of the elements."""
+        return hightime.timedelta._from_ys(sum(self._iter_ys()))
+
+    # Sequence protocol
+
+    def __getitem__(self, index):
+        """Return self[index]."""
+        if isinstance(index, slice):
+            result = type(self).__new__(type(self))
+            result._init_view(self._view, *self._slice_bounds(index))
+            return result
+        return hightime.timedelta._from_ys(self._ys(index))
+
+    def __iter__(self):
+        """Implement iter(self)."""
+        from_ys = hightime.timedelta._from_ys
+        for ys in self._iter_ys():
+            yield from_ys(ys)
+
+    # Other operators
+
+    def __eq__(self, other):
+        """Return self==other."""
+        if not isinstance(other, TimedeltaArray):
+            return NotImplemented
+        return self._length == other._length and all(
+            a == b for a, b in zip(self._iter_ys(), other._iter_ys())
+        )
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return "{}.{}([{}])".format(
+            self.__class__.__module__, self.__class__.__qualname__, self._repr_items()
+        )
+
+    # Helper methods
+
+    @classmethod
+    def _from_ys(cls, values):
+        # Build an array from an iterable of yoctoseconds.
+        self = cls.__new__(cls)
+        self._init_view(memoryview(_pack_ys(values)))
+        return self
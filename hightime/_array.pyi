@@ -0,0 +1,75 @@
+import datetime as std_datetime
+from typing import ClassVar, Iterable, Iterator, Literal, Optional, Union, overload
+
+from _typeshed import ReadableBuffer
+
+import hightime
+from hightime._zonetable import _FixedTable, _ZoneTable
+
+class _RecordArray:
+    __hash__: ClassVar[None]  # type: ignore[assignment]
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+    def __len__(self) -> int: ...
+    def __release_buffer__(self, view: memoryview, /) -> None: ...
+    def _init_view(
+        self, view: memoryview, start: int = ..., length: Optional[int] = ..., step: int = ..., /
+    ) -> None: ...
+    def _iter_ys(self) -> Iterator[int]: ...
+    def _repr_items(self) -> str: ...
+    def _slice_bounds(self, index: slice, /) -> tuple[int, int, int]: ...
+    def _ys(self, index: int, /) -> int: ...
+    def tobytes(self) -> bytes: ...
+
+class DatetimeArray(_RecordArray):
+    def __init__(
+        self,
+        datetimes: Iterable[hightime.datetime] = ...,
+        tzinfo: Optional[std_datetime.tzinfo] = ...,
+    ) -> None: ...
+    def __eq__(self, other: object, /) -> bool: ...
+    @overload
+    def __getitem__(self, index: int, /) -> hightime.datetime: ...
+    @overload
+    def __getitem__(self, index: slice, /) -> DatetimeArray: ...
+    def __iter__(self) -> Iterator[hightime.datetime]: ...
+    def __repr__(self) -> str: ...
+    @classmethod
+    def _from_ys(
+        cls, values: Iterable[int], tzinfo: Optional[std_datetime.tzinfo] = ..., /
+    ) -> DatetimeArray: ...
+    def _window_table(
+        self, tzinfo: std_datetime.tzinfo, margin: int, /
+    ) -> Optional[Union[_FixedTable, _ZoneTable]]: ...
+    @classmethod
+    def frombuffer(
+        cls, buffer: ReadableBuffer, tzinfo: Optional[std_datetime.tzinfo] = ...
+    ) -> DatetimeArray: ...
+    def searchsorted(
+        self, value: hightime.datetime, side: Literal["left", "right"] = ...
+    ) -> int: ...
+    def tolist(self) -> list[hightime.datetime]: ...
+    def tz_convert(self, tz: Optional[std_datetime.tzinfo]) -> DatetimeArray: ...
+    def tz_localize(
+        self,
+        tz: Optional[std_datetime.tzinfo],
+        ambiguous: Literal["raise", "earliest", "latest"] = ...,
+        nonexistent: Literal["raise", "shift_forward", "shift_backward"] = ...,
+    ) -> DatetimeArray: ...
+    @property
+    def tzinfo(self) -> Optional[std_datetime.tzinfo]: ...
+
+class TimedeltaArray(_RecordArray):
+    def __init__(self, timedeltas: Iterable[std_datetime.timedelta] = ...) -> None: ...
+    def __eq__(self, other: object, /) -> bool: ...
+    @overload
+    def __getitem__(self, index: int, /) -> hightime.timedelta: ...
+    @overload
+    def __getitem__(self, index: slice, /) -> TimedeltaArray: ...
+    def __iter__(self) -> Iterator[hightime.timedelta]: ...
+    def __repr__(self) -> str: ...
+    @classmethod
+    def _from_ys(cls, values: Iterable[int], /) -> TimedeltaArray: ...
+    @classmethod
+    def frombuffer(cls, buffer: ReadableBuffer) -> TimedeltaArray: ...
+    def sum(self) -> hightime.timedelta: ...
+    def tolist(self) -> list[hightime.timedelta]: ...
@@ -1,8 +1,40 @@
 import datetime as std_datetime
-from collections import OrderedDict
+import struct
 from itertools import dropwhile
 
 import hightime
+from hightime._timedelta import (
+    _YS_PER_DAY,
+    _YS_PER_FS,
+    _YS_PER_S,
+    _YS_PER_US,
+    _decode_sort_key,
+    _divide_and_round,
+    _encode_sort_key,
+)
+from hightime.timescales import (
+    _GPS_MINUS_TAI_YS,
+    _tai_to_utc_ys,
+    _tai_to_utc_ys_many,
+    _utc_to_tai_ys,
+    _utc_to_tai_ys_many,
+)
+
+_UNIX_EPOCH_ORDINAL = std_datetime.date(1970, 1, 1).toordinal()
+_MAX_ORDINAL = std_datetime.date.max.toordinal()
+
+# LabVIEW timestamps count 2**-64 second units since 1904-01-01 00:00:00 UTC.
+_LV_EPOCH_OFFSET_YS = (
+    std_datetime.date(1970, 1, 1).toordinal() - std_datetime.date(1904, 1, 1).toordinal()
+) * _YS_PER_DAY
+_LV_FRACTION_PER_S = 2**64
+
+# Packed LabVIEW timestamp records: native little-endian memory layout (fraction, seconds), or
+# the big-endian flattened layout (seconds, fraction).
+_LV_STRUCTS = {
+    "<": struct.Struct("<Qq"),
+    ">": struct.Struct(">qQ"),
+}
 
 
 # Mostly ripped from `datetime`'s
@@ -24,6 +56,180 @@ def _check_arg(name, value):
     return value
 
 
+# Ordered from finest to coarsest; isoformat relies on this order.
+_ISOFORMAT_SPECS = {
+    "yoctoseconds": "{:06d}{:018d}",
+    "zeptoseconds": "{:06d}{:015d}",
+    "attoseconds": "{:06d}{:012d}",
+    "femtoseconds": "{:06d}{:09d}",
+    "picoseconds": "{:06d}{:06d}",
+    "nanoseconds": "{:06d}{:03d}",
+}
+
+
+def _byte_view(buffer, itemsize):
+    """Return a flat, unsigned byte memoryview of ``buffer`` holding whole ``itemsize`` records."""
+    view = memoryview(buffer)
+    if view.ndim != 1 or view.format != "B":
+        view = view.cast("B")
+    if view.nbytes % itemsize:
+        raise ValueError(
+            "buffer size must be a multiple of {} bytes, not {}".format(itemsize, view.nbytes)
+        )
+    return view
+
+
+def _get_lv_struct(byteorder):
+    lv_struct = _LV_STRUCTS.get(byteorder)
+    if lv_struct is None:
+        raise ValueError("byteorder must be '<' or '>', not {!r}".format(byteorder))
+    return lv_struct
+
+
+def _lv_from_timestamp_ys(ys):
+    seconds, ys = divmod(ys + _LV_EPOCH_OFFSET_YS, _YS_PER_S)
+    fraction = _divide_and_round(ys * _LV_FRACTION_PER_S, _YS_PER_S)
+    if fraction == _LV_FRACTION_PER_S:
+        seconds += 1
+        fraction = 0
+    return seconds, fraction
+
+
+# Compiled strftime/strptime formats, keyed by format string. See _compile_strftime and
+# _compile_strptime.
+_STRFTIME_CACHE = {}
+_STRPTIME_CACHE = {}
+_FORMAT_CACHE_SIZE = 256
+
+_FRACTION_DIGITS = 24
+_FRACTION_GROUP = "hightime_fraction"
+
+
+def _split_fraction_directives(fmt):
+    """Split a format string on its ``%<N>f`` directives.
+
+    Returns a list of format substrings and ints (the digit count of each ``%<N>f``), or None
+    if the format has no extended directives.
+    """
+    parts = []
+    start = 0
+    index = fmt.find("%")
+    while index != -1:
+        end = index + 1
+        while end < len(fmt) and fmt[end].isdigit():
+            end += 1
+        if end > index + 1 and end < len(fmt) and fmt[end] == "f":
+            digits = int(fmt[index + 1 : end])
+            if not 1 <= digits <= _FRACTION_DIGITS:
+                raise ValueError(
+                    "fractional second digits must be in 1..{}".format(_FRACTION_DIGITS), digits
+                )
+            if start < index:
+                parts.append(fmt[start:index])
+            parts.append(digits)
+            start = end + 1
+            index = fmt.find("%", start)
+        else:
+            # Skip over the directive (including "%%") so "%%9f" stays a literal "%9f".
+            index = fmt.find("%", index + 2)
+    if not parts:
+        return None
+    if start < len(fmt):
+        parts.append(fmt[start:])
+    return parts
+
+
+def _compile_strftime(fmt):
+    """Split a strftime format into literal, standard, and fractional-second parts.
+
+    Returns a tuple of ``(kind, value)`` pairs, where kind is one of "literal" (copied as-is),
+    "strftime" (formatted by the standard library), or "fraction" (``value`` digits of the
+    fractional second). Returns None if the format has no extended directives.
+    """
+    parts = _split_fraction_directives(fmt)
+    if parts is None:
+        return None
+
+    compiled = []
+    for part in parts:
+        if isinstance(part, int):
+            compiled.append(("fraction", part))
+        elif "%" in part:
+            compiled.append(("strftime", part))
+        else:
+            compiled.append(("literal", part))
+    return tuple(compiled)
+
+
+# Patterns for the directives that may be combined with %<N>f. They are all numeric, so parsing
+# does not depend on the locale.
+_STRPTIME_PATTERNS = {
+    "d": r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "j": r"(?P<j>36[0-6]|3[0-5]\d|[12]\d\d|0[1-9]\d|00[1-9]|[1-9]\d|0[1-9]|[1-9])",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    "y": r"(?P<y>\d\d)",
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "z": r"(?P<z>[+-]\d\d:?[0-5]\d(?::?[0-5]\d(?:\.\d{1,6})?)?|(?-i:Z))",
+}
+
+
+def _compile_strptime(fmt):
+    """Compile a strptime format with a ``%<N>f`` directive.
+
+    Returns a regex that matches the whole format, with one named group per directive, from
+    which :meth:`datetime._strptime` builds the datetime. Returns None if the format has no
+    extended directives.
+    """
+    parts = _split_fraction_directives(fmt)
+    if parts is None:
+        return None
+    if sum(isinstance(part, int) for part in parts) > 1:
+        raise ValueError("at most one fractional second directive is allowed", fmt)
+
+    import re
+
+    def escape(text):
+        # As in datetime.datetime.strptime, whitespace matches any amount of whitespace.
+        return r"\s+".join(re.escape(chunk) for chunk in re.split(r"\s+", text))
+
+    pattern = []
+    seen = set()
+    for part in parts:
+        if isinstance(part, int):
+            pattern.append(r"(?P<{}>\d{{1,{}}})".format(_FRACTION_GROUP, part))
+            continue
+        literal = []
+        index = 0
+        while index < len(part):
+            char = part[index]
+            if char != "%":
+                literal.append(char)
+                index += 1
+                continue
+            if index + 1 == len(part):
+                raise ValueError("stray % in format {!r}".format(fmt))
+            directive = part[index + 1]
+            index += 2
+            if directive == "%":
+                literal.append("%")
+                continue
+            if directive not in _STRPTIME_PATTERNS:
+                raise ValueError(
+                    "'%{}' cannot be combined with a fractional second directive".format(directive)
+                )
+            if directive in seen:
+                raise ValueError("'%{}' is repeated in format {!r}".format(directive, fmt))
+            seen.add(directive)
+            pattern.append(escape("".join(literal)))
+            pattern.append(_STRPTIME_PATTERNS[directive])
+            literal = []
+        pattern.append(escape("".join(literal)))
+    return re.compile("".join(pattern), re.IGNORECASE)
+
+
 class datetime(std_datetime.datetime):  # noqa: N801 - class name should use CapWords convention
     """A datetime represents a point in time.
 
@@ -136,6 +342,163 @@ class datetime(std_datetime.datetime):  # noqa: N801 - class name should use Cap
 
     # Public classmethods
 
+    @classmethod
+    def from_lv_timestamp(cls, seconds, fraction, tz=std_datetime.timezone.utc):
+        """Return a datetime corresponding to a LabVIEW/NI PrecisionTimestamp.
+
+        The timestamp is a signed number of ``seconds`` since 1904-01-01 00:00:00 UTC plus an
+        unsigned 64-bit ``fraction`` in units of ``2**-64`` seconds. The fraction is rounded
+        half to even to the nearest yoctosecond.
+
+        The result is in ``tz``, which defaults to UTC. As with :meth:`fromtimestamp`, passing
+        ``tz=None`` returns a naive datetime in local time.
+
+        >>> datetime.from_lv_timestamp(3786912000, 2**63)
+        hightime.datetime(2024, 1, 1, 0, 0, 0, 500000, tzinfo=datetime.timezone.utc)
+        """
+        if not 0 <= fraction < _LV_FRACTION_PER_S:
+            raise ValueError("fraction must be in 0..2**64-1", fraction)
+        ys = seconds * _YS_PER_S + _divide_and_round(fraction * _YS_PER_S, _LV_FRACTION_PER_S)
+        return cls._from_timestamp_ys(ys - _LV_EPOCH_OFFSET_YS, tz)
+
+    @classmethod
+    def from_lv_timestamps(cls, buffer, tz=std_datetime.timezone.utc, byteorder="<"):
+        """Return a list of datetimes from a buffer of packed 16-byte LabVIEW timestamps.
+
+        ``buffer`` is any object supporting the buffer protocol, such as ``bytes`` or a NumPy
+        array. With ``byteorder="<"`` (the default), each record is the little-endian in-memory
+        layout ``(uint64 fraction, int64 seconds)``. With ``byteorder=">"``, each record is the
+        big-endian flattened layout ``(int64 seconds, uint64 fraction)``.
+
+        See :meth:`from_lv_timestamp` for the rounding and ``tz`` behavior.
+        """
+        lv_struct = _get_lv_struct(byteorder)
+        view = _byte_view(buffer, lv_struct.size)
+        from_timestamp_ys = cls._from_timestamp_ys
+        result = []
+        for first, second in lv_struct.iter_unpack(view):
+            seconds, fraction = (second, first) if byteorder == "<" else (first, second)
+            ys = seconds * _YS_PER_S + _divide_and_round(fraction * _YS_PER_S, _LV_FRACTION_PER_S)
+            result.append(from_timestamp_ys(ys - _LV_EPOCH_OFFSET_YS, tz))
+        return result
+
+    @classmethod
+    def to_lv_timestamps(cls, datetimes, byteorder="<", out=None):
+        """Pack datetimes into 16-byte LabVIEW timestamp records.
+
+        Returns ``bytes``, or writes into the writable buffer ``out`` and returns it. See
+        :meth:`from_lv_timestamps` for the record layouts and :meth:`to_lv_timestamp` for the
+        rounding behavior.
+        """
+        lv_struct = _get_lv_struct(byteorder)
+        size = lv_struct.size
+        records = [_lv_from_timestamp_ys(dt._timestamp_ys()) for dt in datetimes]
+        if out is None:
+            out = bytearray(size * len(records))
+            result = None
+        else:
+            result = out
+        view = _byte_view(out, size)
+        if view.nbytes < size * len(records):
+            raise ValueError("out is too small for {} records".format(len(records)))
+        pack_into = lv_struct.pack_into
+        for index, (seconds, fraction) in enumerate(records):
+            if byteorder == "<":
+                pack_into(view, index * size, fraction, seconds)
+            else:
+                pack_into(view, index * size, seconds, fraction)
+        return bytes(out) if result is None else result
+
+    @classmethod
+    def from_tai(cls, dt, tz=std_datetime.timezone.utc):
+        """Return the UTC datetime for ``dt``, a naive datetime in TAI.
+
+        The result is in ``tz``, which defaults to UTC. Passing ``tz=None`` returns a naive
+        datetime in UTC. A TAI instant inside a leap second maps to the repeated 23:59:59 UTC
+        second. See :mod:`hightime.timescales` for the leap-second table.
+
+        >>> datetime.from_tai(datetime(2024, 1, 1, 0, 0, 37))
+        hightime.datetime(2024, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)
+        """
+        return cls._from_epoch_ys(_tai_to_utc_ys(dt._to_epoch_ys()), tz)
+
+    @classmethod
+    def from_gps(cls, dt, tz=std_datetime.timezone.utc):
+        """Return the UTC datetime for ``dt``, a naive datetime in GPS time.
+
+        See :meth:`from_tai` for ``tz`` and leap-second handling.
+        """
+        return cls._from_epoch_ys(_tai_to_utc_ys(dt._to_epoch_ys() - _GPS_MINUS_TAI_YS), tz)
+
+    @classmethod
+    def to_tai_many(cls, datetimes):
+        """Return a list of naive TAI datetimes for ``datetimes``. See :meth:`to_tai`.
+
+        The leap-second lookup is shared between consecutive values in the same interval, so
+        sorted input is converted without a table search per value.
+        """
+        from_epoch_ys = cls._from_epoch_ys
+        return [
+            from_epoch_ys(ys) for ys in _utc_to_tai_ys_many(dt._to_epoch_ys() for dt in datetimes)
+        ]
+
+    @classmethod
+    def from_tai_many(cls, datetimes, tz=std_datetime.timezone.utc):
+        """Return a list of UTC datetimes for naive TAI ``datetimes``. See :meth:`from_tai`."""
+        from_epoch_ys = cls._from_epoch_ys
+        return [
+            from_epoch_ys(ys, tz)
+            for ys in _tai_to_utc_ys_many(dt._to_epoch_ys() for dt in datetimes)
+        ]
+
+    @classmethod
+    def to_gps_many(cls, datetimes):
+        """Return a list of naive GPS datetimes for ``datetimes``. See :meth:`to_gps`."""
+        from_epoch_ys = cls._from_epoch_ys
+        return [
+            from_epoch_ys(ys + _GPS_MINUS_TAI_YS)
+            for ys in _utc_to_tai_ys_many(dt._to_epoch_ys() for dt in datetimes)
+        ]
+
+    @classmethod
+    def from_gps_many(cls, datetimes, tz=std_datetime.timezone.utc):
+        """Return a list of UTC datetimes for naive GPS ``datetimes``. See :meth:`from_gps`."""
+        from_epoch_ys = cls._from_epoch_ys
+        return [
+            from_epoch_ys(ys, tz)
+            for ys in _tai_to_utc_ys_many(dt._to_epoch_ys() - _GPS_MINUS_TAI_YS for dt in datetimes)
+        ]
+
+    @classmethod
+    def from_sort_key(cls, key, tz=None):
+        """Return the datetime for a key returned by :meth:`to_sort_key`.
+
+        The result is in ``tz``, or a naive datetime in UTC if ``tz`` is ``None``.
+        """
+        return cls._from_epoch_ys(_decode_sort_key(key), tz)
+
+    @classmethod
+    def from_sort_keys(cls, keys, tz=None):
+        """Return a list of datetimes for keys returned by :meth:`to_sort_key`.
+
+        See :meth:`from_sort_key`.
+        """
+        from_epoch_ys = cls._from_epoch_ys
+        return [from_epoch_ys(_decode_sort_key(key), tz) for key in keys]
+
+    @classmethod
+    def to_sort_keys(cls, datetimes):
+        """Return a list of :meth:`to_sort_key` values for ``datetimes``.
+
+        A :any:`hightime.DatetimeArray` is encoded from its packed values without creating
+        datetime objects.
+        """
+        if isinstance(datetimes, hightime.DatetimeArray):
+            values = datetimes._iter_ys()
+        else:
+            values = (dt._to_epoch_ys() for dt in datetimes)
+        return [_encode_sort_key(ys) for ys in values]
+
     @classmethod
     def fromtimestamp(cls, t, tz=None):
         """Return a datetime corresponding to a POSIX timestamp with the provided time zone.
@@ -156,6 +519,40 @@ class datetime(std_datetime.datetime):  # noqa: N801 - class name should use Cap
         result = std_datetime.datetime.utcfromtimestamp(t)
         return cls._from_base(result)
 
+    @classmethod
+    def strptime(cls, date_string, format):
+        """Return a datetime corresponding to ``date_string``, parsed according to ``format``.
+
+        In addition to the directives supported by :any:`datetime.datetime.strptime`, ``%<N>f``
+        parses up to ``N`` digits (1-24) of the fractional second. At most one ``%<N>f`` is
+        allowed per format, and it may only be combined with ``%Y``, ``%y``, ``%m``, ``%d``,
+        ``%j``, ``%H``, ``%M``, ``%S``, ``%z`` and ``%%``, so that parsing does not depend on the
+        locale.
+
+        >>> datetime.strptime("2024-01-02 03:04:05.123456789012", "%Y-%m-%d %H:%M:%S.%12f")
+        hightime.datetime(2024, 1, 2, 3, 4, 5, 123456, 789012000)
+
+        Each format string is compiled once and cached.
+        """
+        return cls._strptime(date_string, format, cls._get_strptime(format))
+
+    @classmethod
+    def strptime_many(cls, date_strings, format):
+        """Return a list of datetimes parsed from ``date_strings`` according to ``format``.
+
+        ``date_strings`` is either an iterable of strings or a single ``str``/bytes-like buffer
+        of newline-separated timestamps. The format is compiled once for all of them.
+        See :meth:`strptime` for the supported directives.
+        """
+        if isinstance(date_strings, (bytes, bytearray, memoryview)):
+            date_strings = str(date_strings, "utf-8")
+        if isinstance(date_strings, str):
+            date_strings = date_strings.splitlines()
+
+        compiled = cls._get_strptime(format)
+        parse = cls._strptime
+        return [parse(date_string, format, compiled) for date_string in date_strings]
+
     # Public methods
 
     def astimezone(self, tz=None):
@@ -169,19 +566,56 @@ class datetime(std_datetime.datetime):  # noqa: N801 - class name should use Cap
             .replace(femtosecond=self.femtosecond, yoctosecond=self.yoctosecond)
         )
 
+    def to_lv_timestamp(self):
+        """Return the LabVIEW/NI PrecisionTimestamp ``(seconds, fraction)`` for this datetime.
+
+        See :meth:`from_lv_timestamp` for the format. The fraction is rounded half to even to the
+        nearest ``2**-64`` seconds (about 54 zeptoseconds). As with :meth:`timestamp`, naive
+        datetimes are assumed to be in local time.
+
+        >>> datetime.from_lv_timestamp(3786912000, 2**63).to_lv_timestamp()
+        (3786912000, 9223372036854775808)
+        """
+        return _lv_from_timestamp_ys(self._timestamp_ys())
+
+    def to_tai(self):
+        """Return this instant as a naive datetime in TAI (International Atomic Time).
+
+        Aware datetimes are converted from UTC; naive datetimes are treated as UTC. See
+        :mod:`hightime.timescales` for the leap-second table.
+
+        >>> datetime(2024, 1, 1).to_tai()
+        hightime.datetime(2024, 1, 1, 0, 0, 37)
+        """
+        return self._from_epoch_ys(_utc_to_tai_ys(self._to_epoch_ys()))
+
+    def to_gps(self):
+        """Return this instant as a naive datetime in GPS time (TAI - 19 seconds).
+
+        See :meth:`to_tai` for how the input is interpreted.
+
+        >>> datetime(2024, 1, 1).to_gps()
+        hightime.datetime(2024, 1, 1, 0, 0, 18)
+        """
+        return self._from_epoch_ys(_utc_to_tai_ys(self._to_epoch_ys()) + _GPS_MINUS_TAI_YS)
+
+    def to_sort_key(self):
+        """Return a 16-byte key whose byte-wise order matches chronological order.
+
+        The key is the exact number of yoctoseconds since the Unix epoch in UTC, as a big-endian
+        128-bit integer with its sign bit flipped. Aware datetimes are converted to UTC and naive
+        datetimes are treated as UTC, so keys for both can be compared with each other. Use it
+        for key-value store keys, or directly as a key function:
+        ``sorted(datetimes, key=hightime.datetime.to_sort_key)``.
+
+        >>> datetime(1970, 1, 1, yoctosecond=1).to_sort_key().hex()
+        '80000000000000000000000000000001'
+        """
+        return _encode_sort_key(self._to_epoch_ys())
+
     def isoformat(self, sep="T", timespec="auto"):
         """Return a string representing the time in ISO 8601 format."""
-        specs = OrderedDict(
-            [
-                ("yoctoseconds", "{:06d}{:018d}"),
-                ("zeptoseconds", "{:06d}{:015d}"),
-                ("attoseconds", "{:06d}{:012d}"),
-                ("femtoseconds", "{:06d}{:09d}"),
-                ("picoseconds", "{:06d}{:06d}"),
-                ("nanoseconds", "{:06d}{:03d}"),
-            ]
-        )
-
+        specs = _ISOFORMAT_SPECS
         if timespec == "auto":
             for spec in specs:
                 if getattr(self, spec[:-1], 0) != 0:
@@ -203,6 +637,49 @@ class datetime(std_datetime.datetime):  # noqa: N801 - class name should use Cap
         iso_strs[0] += "." + fmt.format(self.microsecond, value)
         return "+".join(iso_strs)
 
+    def strftime(self, format):
+        """Return a string representing the time, controlled by an explicit format string.
+
+        In addition to the directives supported by :any:`datetime.datetime.strftime`, ``%<N>f``
+        formats the first ``N`` digits (1-24) of the fractional second, truncating the rest. For
+        example, ``%9f`` formats nanoseconds and ``%24f`` formats yoctoseconds.
+
+        >>> dt = datetime(2020, 1, 2, 3, 4, 5, 123456, 789012345, 678901234)
+        >>> dt.strftime("%H:%M:%S.%9f")
+        '03:04:05.123456789'
+        >>> f"{dt:%S.%24f}"
+        '05.123456789012345678901234'
+
+        Each format string is parsed once and cached, so repeated formatting with the same format
+        only runs the standard directives through :any:`datetime.datetime.strftime`.
+        """
+        compiled = _STRFTIME_CACHE.get(format, False)
+        if compiled is False:
+            if not isinstance(format, str):
+                raise TypeError("strftime() argument 1 must be str, not %s" % type(format).__name__)
+            compiled = _compile_strftime(format)
+            if len(_STRFTIME_CACHE) >= _FORMAT_CACHE_SIZE:
+                _STRFTIME_CACHE.clear()
+            _STRFTIME_CACHE[format] = compiled
+
+        if compiled is None:
+            return super().strftime(format)
+
+        fraction = None
+        result = []
+        for kind, value in compiled:
+            if kind == "literal":
+                result.append(value)
+            elif kind == "strftime":
+                result.append(super().strftime(value))
+            else:
+                if fraction is None:
+                    fraction = "{:06d}{:09d}{:09d}".format(
+                        self.microsecond, self._femtosecond, self._yoctosecond
+                    )
+                result.append(fraction[:value])
+        return "".join(result)
+
     def replace(
         self,
         year=None,
@@ -288,6 +765,14 @@ class datetime(std_datetime.datetime):  # noqa: N801 - class name should use Cap
 
     __str__ = std_datetime.datetime.__str__
 
+    def __format__(self, fmt):
+        """Return format(self, fmt)."""
+        if not isinstance(fmt, str):
+            raise TypeError("must be str, not %s" % type(fmt).__name__)
+        if fmt:
+            return self.strftime(fmt)
+        return str(self)
+
     # Comparison operators
 
     def __eq__(self, other):
@@ -484,6 +969,146 @@ class datetime(std_datetime.datetime):  # noqa: N801 - class name should use Cap
         else:
             return NotImplemented
 
+    @classmethod
+    def _get_strptime(cls, format):
+        compiled = _STRPTIME_CACHE.get(format, False)
+        if compiled is False:
+            if not isinstance(format, str):
+                raise TypeError("strptime() argument 2 must be str, not %s" % type(format).__name__)
+            compiled = _compile_strptime(format)
+            if len(_STRPTIME_CACHE) >= _FORMAT_CACHE_SIZE:
+                _STRPTIME_CACHE.clear()
+            _STRPTIME_CACHE[format] = compiled
+        return compiled
+
+    @classmethod
+    def _strptime(cls, date_string, format, compiled):
+        if compiled is None:
+            return cls._from_base(std_datetime.datetime.strptime(date_string, format))
+
+        if not isinstance(date_string, str):
+            raise TypeError(
+                "strptime() argument 1 must be str, not %s" % type(date_string).__name__
+            )
+        match = compiled.match(date_string)
+        if match is None or match.end() != len(date_string):
+            raise ValueError("time data %r does not match format %r" % (date_string, format))
+
+        # Build the datetime directly from the groups, with the same defaults as
+        # datetime.datetime.strptime.
+        groups = match.groupdict()
+        if groups.get("Y") is not None:
+            year = int(groups["Y"])
+        elif groups.get("y") is not None:
+            year = int(groups["y"])
+            year += 2000 if year <= 68 else 1900
+        else:
+            year = 1900
+        if groups.get("j") is not None:
+            date = std_datetime.date.fromordinal(
+                std_datetime.date(year, 1, 1).toordinal() + int(groups["j"]) - 1
+            )
+            year, month, day = date.year, date.month, date.day
+        else:
+            month = int(groups.get("m") or 1)
+            day = int(groups.get("d") or 1)
+        tzinfo = None
+        offset = groups.get("z")
+        if offset is not None:
+            offset = offset.replace(":", "")
+            if offset == "Z":
+                offset = "+0000"
+            delta = std_datetime.timedelta(
+                hours=int(offset[1:3]),
+                minutes=int(offset[3:5]),
+                seconds=int(offset[5:7] or 0),
+                microseconds=int(offset[8:].ljust(6, "0")),
+            )
+            tzinfo = std_datetime.timezone(-delta if offset[0] == "-" else delta)
+        digits = groups[_FRACTION_GROUP].ljust(_FRACTION_DIGITS, "0")
+        return cls(
+            year,
+            month,
+            day,
+            int(groups.get("H") or 0),
+            int(groups.get("M") or 0),
+            int(groups.get("S") or 0),
+            int(digits[:6]),
+            int(digits[6:15]),
+            int(digits[15:]),
+            tzinfo=tzinfo,
+        )
+
+    def _to_epoch_ys(self):
+        # Yoctoseconds since the Unix epoch, adjusted to UTC. Naive datetimes are treated as UTC.
+        ys = (
+            (
+                (self.toordinal() - _UNIX_EPOCH_ORDINAL) * 86400
+                + self.hour * 3600
+                + self.minute * 60
+                + self.second
+            )
+            * _YS_PER_S
+            + self.microsecond * _YS_PER_US
+            + self._femtosecond * _YS_PER_FS
+            + self._yoctosecond
+        )
+        offset = self.utcoffset()
+        if offset is not None:
+            ys -= hightime.timedelta._as_ys(offset)
+        return ys
+
+    def _timestamp_ys(self):
+        # Like timestamp(), but exact. Naive datetimes are treated as local time.
+        if self.utcoffset() is None:
+            return self.astimezone()._to_epoch_ys()
+        return self._to_epoch_ys()
+
+    @classmethod
+    def _from_epoch_ys(cls, ys, tzinfo=None):
+        # Inverse of _to_epoch_ys. If tzinfo is not None, the result is converted to it.
+        utc = std_datetime.timezone.utc
+        self = cls._from_wall_ys(ys, None if tzinfo is None else utc)
+        if tzinfo is not None and tzinfo is not utc:
+            self = self.astimezone(tzinfo)
+        return self
+
+    @classmethod
+    def _from_wall_ys(cls, ys, tzinfo=None, fold=0):
+        # Return the datetime whose fields are ys after 1970-01-01 00:00:00, with tzinfo.
+        days, ys = divmod(ys, _YS_PER_DAY)
+        seconds, ys = divmod(ys, _YS_PER_S)
+        microsecond, ys = divmod(ys, _YS_PER_US)
+        femtosecond, yoctosecond = divmod(ys, _YS_PER_FS)
+        ordinal = days + _UNIX_EPOCH_ORDINAL
+        if not 1 <= ordinal <= _MAX_ORDINAL:
+            raise OverflowError("result out of range")
+        date = std_datetime.date.fromordinal(ordinal)
+        hour, seconds = divmod(seconds, 3600)
+        minute, second = divmod(seconds, 60)
+        return cls(
+            date.year,
+            date.month,
+            date.day,
+            hour,
+            minute,
+            second,
+            microsecond,
+            femtosecond,
+            yoctosecond,
+            tzinfo=tzinfo,
+            fold=fold,
+        )
+
+    @classmethod
+    def _from_timestamp_ys(cls, ys, tz):
+        # Like fromtimestamp(), but exact. If tz is None, the result is naive local time.
+        if tz is None:
+            return (
+                cls._from_epoch_ys(ys, std_datetime.timezone.utc).astimezone().replace(tzinfo=None)
+            )
+        return cls._from_epoch_ys(ys, tz)
+
     @classmethod
     def _from_base(cls, base_datetime):
         return cls(
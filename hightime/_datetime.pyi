@@ -1,14 +1,30 @@
 import datetime as std_datetime
-from typing import Any, ClassVar, Optional, SupportsIndex, overload
+import re
+from typing import (
+    Any,
+    ClassVar,
+    Iterable,
+    Literal,
+    Optional,
+    SupportsIndex,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from _typeshed import ReadableBuffer, WriteableBuffer
 
 import hightime
 
+_WritableBufferT = TypeVar("_WritableBufferT", bound=WriteableBuffer)
+
 class datetime(std_datetime.datetime):
     min: ClassVar[datetime]
     max: ClassVar[datetime]
     resolution: ClassVar[hightime.timedelta]
     def __add__(self, other: std_datetime.timedelta, /) -> datetime: ...
     def __eq__(self, other: object, /) -> bool: ...
+    def __format__(self, fmt: str, /) -> str: ...
     def __ge__(self, other: std_datetime.date, /) -> bool: ...
     def __gt__(self, other: std_datetime.date, /) -> bool: ...
     def __hash__(self) -> int: ...
@@ -70,11 +86,68 @@ class datetime(std_datetime.datetime):
     def __sub__(self, value: std_datetime.timedelta, /) -> datetime: ...
     def _cmp(self, other: std_datetime.datetime, /) -> int: ...
     @classmethod
+    def _get_strptime(cls, format: str, /) -> Optional[re.Pattern[str]]: ...
+    @classmethod
+    def _strptime(
+        cls,
+        date_string: str,
+        format: str,
+        compiled: Optional[re.Pattern[str]],
+        /,
+    ) -> datetime: ...
+    @classmethod
     def _from_base(cls, base_datetime: std_datetime.datetime, /) -> datetime: ...
+    @classmethod
+    def _from_epoch_ys(
+        cls, ys: int, tzinfo: Optional[std_datetime._TzInfo] = ..., /
+    ) -> datetime: ...
+    @classmethod
+    def _from_timestamp_ys(cls, ys: int, tz: Optional[std_datetime._TzInfo], /) -> datetime: ...
+    @classmethod
+    def _from_wall_ys(
+        cls, ys: int, tzinfo: Optional[std_datetime._TzInfo] = ..., fold: int = ..., /
+    ) -> datetime: ...
+    def _timestamp_ys(self) -> int: ...
+    def _to_epoch_ys(self) -> int: ...
     def astimezone(self, tz: Optional[std_datetime._TzInfo] = ...) -> datetime: ...
     @property
     def femtosecond(self) -> int: ...
     @classmethod
+    def from_gps(
+        cls, dt: datetime, tz: Optional[std_datetime._TzInfo] = ...
+    ) -> datetime: ...
+    @classmethod
+    def from_gps_many(
+        cls, datetimes: Iterable[datetime], tz: Optional[std_datetime._TzInfo] = ...
+    ) -> list[datetime]: ...
+    @classmethod
+    def from_lv_timestamp(
+        cls, seconds: int, fraction: int, tz: Optional[std_datetime._TzInfo] = ...
+    ) -> datetime: ...
+    @classmethod
+    def from_lv_timestamps(
+        cls,
+        buffer: ReadableBuffer,
+        tz: Optional[std_datetime._TzInfo] = ...,
+        byteorder: Literal["<", ">"] = ...,
+    ) -> list[datetime]: ...
+    @classmethod
+    def from_sort_key(
+        cls, key: ReadableBuffer, tz: Optional[std_datetime._TzInfo] = ...
+    ) -> datetime: ...
+    @classmethod
+    def from_sort_keys(
+        cls, keys: Iterable[ReadableBuffer], tz: Optional[std_datetime._TzInfo] = ...
+    ) -> list[datetime]: ...
+    @classmethod
+    def from_tai(
+        cls, dt: datetime, tz: Optional[std_datetime._TzInfo] = ...
+    ) -> datetime: ...
+    @classmethod
+    def from_tai_many(
+        cls, datetimes: Iterable[datetime], tz: Optional[std_datetime._TzInfo] = ...
+    ) -> list[datetime]: ...
+    @classmethod
     def fromtimestamp(
         cls, t: float, tz: Optional[std_datetime._TzInfo] = ...
     ) -> datetime: ...
@@ -94,6 +167,49 @@ class datetime(std_datetime.datetime):
         *,
         fold: int = ...,
     ) -> datetime: ...
+    def strftime(self, format: str) -> str: ...
+    @classmethod
+    def strptime(cls, date_string: str, format: str, /) -> datetime: ...
+    @classmethod
+    def strptime_many(
+        cls, date_strings: Union[Iterable[str], str, bytes, bytearray, memoryview], format: str, /
+    ) -> list[datetime]: ...
+    def to_gps(self) -> datetime: ...
+    @classmethod
+    def to_gps_many(cls, datetimes: Iterable[datetime]) -> list[datetime]: ...
+    def to_lv_timestamp(self) -> tuple[int, int]: ...
+    @overload
+    @classmethod
+    def to_lv_timestamps(
+        cls,
+        datetimes: Iterable[datetime],
+        byteorder: Literal["<", ">"] = ...,
+        out: None = ...,
+    ) -> bytes: ...
+    @overload
+    @classmethod
+    def to_lv_timestamps(
+        cls,
+        datetimes: Iterable[datetime],
+        byteorder: Literal["<", ">"],
+        out: _WritableBufferT,
+    ) -> _WritableBufferT: ...
+    @overload
+    @classmethod
+    def to_lv_timestamps(
+        cls,
+        datetimes: Iterable[datetime],
+        *,
+        out: _WritableBufferT,
+    ) -> _WritableBufferT: ...
+    def to_sort_key(self) -> bytes: ...
+    @classmethod
+    def to_sort_keys(
+        cls, datetimes: Union[Iterable[datetime], hightime.DatetimeArray]
+    ) -> list[bytes]: ...
+    def to_tai(self) -> datetime: ...
+    @classmethod
+    def to_tai_many(cls, datetimes: Iterable[datetime]) -> list[datetime]: ...
     @classmethod
     def utcfromtimestamp(cls, t: float, /) -> datetime: ...
     @property
@@ -0,0 +1,64 @@
+from heapq import heapify, heappop, heapreplace
+
+import hightime
+
+
+def merge(streams, offsets=None, key=None):
+    """Merge sorted streams of timestamped items, yielding ``(key, item)`` in time order.
+
+    Each stream is an iterable of items sorted by time. ``key`` is a function returning an
+    item's :any:`hightime.datetime`; by default the items are the datetimes themselves. Aware
+    datetimes are converted to UTC and naive datetimes are treated as UTC.
+
+    ``offsets`` is a sequence with one :any:`hightime.timedelta` clock correction per stream,
+    which is added to the times of that stream's items. The yielded ``key`` is the corrected
+    time as an integer count of yoctoseconds since the Unix epoch, so that items are compared
+    as integers rather than as datetimes; ``datetime(1970, 1, 1) + timedelta(yoctoseconds=key)``
+    converts it back. Items with equal keys are yielded in stream order.
+
+    Streams are consumed lazily, and only one item per stream is held at a time. Raises
+    :any:`ValueError` if a stream is found to be out of order.
+
+    >>> from hightime import datetime, timedelta
+    >>> node_a = [datetime(2024, 1, 1, 0, 0, 1), datetime(2024, 1, 1, 0, 0, 3)]
+    >>> node_b = [datetime(2024, 1, 1, 0, 0, 4)]
+    >>> for key, item in merge([node_a, node_b], offsets=[timedelta(), timedelta(seconds=-2)]):
+    ...     print(datetime(1970, 1, 1) + timedelta(yoctoseconds=key), item)
+    2024-01-01 00:00:01 2024-01-01 00:00:01
+    2024-01-01 00:00:02 2024-01-01 00:00:04
+    2024-01-01 00:00:03 2024-01-01 00:00:03
+    """
+    iterators = [iter(stream) for stream in streams]
+    if offsets is None:
+        offsets = [0] * len(iterators)
+    else:
+        as_ys = hightime.timedelta._as_ys
+        offsets = [as_ys(offset) for offset in offsets]
+        if len(offsets) != len(iterators):
+            raise ValueError("offsets must have one value per stream")
+
+    # Heap entries are [key, stream index, item, iterator, offset]. The stream index breaks
+    # ties, so items are never compared.
+    heap = []
+    for index, (iterator, offset) in enumerate(zip(iterators, offsets)):
+        for item in iterator:
+            value = item if key is None else key(item)
+            heap.append([value._to_epoch_ys() + offset, index, item, iterator, offset])
+            break
+    heapify(heap)
+
+    while heap:
+        entry = heap[0]
+        current, index, item, iterator, offset = entry
+        yield current, item
+        for item in iterator:
+            value = item if key is None else key(item)
+            ys = value._to_epoch_ys() + offset
+            if ys < current:
+                raise ValueError("stream {} is not sorted".format(index))
+            entry[0] = ys
+            entry[2] = item
+            heapreplace(heap, entry)
+            break
+        else:
+            heappop(heap)
@@ -0,0 +1,19 @@
+import datetime as std_datetime
+from typing import Callable, Iterable, Iterator, Optional, Sequence, TypeVar, overload
+
+import hightime
+
+_T = TypeVar("_T")
+
+@overload
+def merge(
+    streams: Iterable[Iterable[hightime.datetime]],
+    offsets: Optional[Sequence[std_datetime.timedelta]] = ...,
+    key: None = ...,
+) -> Iterator[tuple[int, hightime.datetime]]: ...
+@overload
+def merge(
+    streams: Iterable[Iterable[_T]],
+    offsets: Optional[Sequence[std_datetime.timedelta]] = ...,
+    key: Callable[[_T], hightime.datetime] = ...,
+) -> Iterator[tuple[int, _T]]: ...
@@ -0,0 +1,189 @@
+import datetime as std_datetime
+from math import gcd
+
+import hightime
+from hightime._array import DatetimeArray
+from hightime._timedelta import _YS_PER_S, _divide_and_round
+
+_ROUNDINGS = ("nearest", "floor", "ceil", "exact")
+
+
+class SampleClock:
+    """The sample times of a regularly sampled waveform: ``t0 + n * dt``.
+
+    The sample period is kept as an exact ratio of yoctoseconds, and each sample time is
+    computed directly from ``n`` rather than by repeated addition, so no rounding error
+    accumulates however large ``n`` gets. Sample times are rounded half to even to the nearest
+    yoctosecond.
+
+    Specify either the sample period ``dt`` (a :any:`datetime.timedelta`) or the sample
+    ``rate`` in hertz. The rate may be an ``int``, :any:`fractions.Fraction`,
+    :any:`decimal.Decimal`, or ``float``; non-integer rates are applied as exact ratios.
+
+    >>> import fractions
+    >>> clock = SampleClock(datetime(2024, 1, 1), rate=fractions.Fraction(3))
+    >>> clock.time_of(10**10)
+    hightime.datetime(2129, 8, 18, 5, 55, 33, 333333, 333333333, 333333333)
+    >>> clock.index_of(datetime(2024, 1, 1, 0, 0, 1), rounding="floor")
+    3
+    """
+
+    __slots__ = ("_t0", "_t0_ys", "_numerator", "_denominator")
+
+    def __init__(self, t0, dt=None, *, rate=None):
+        """Initialize the clock from its first sample time and its period or rate."""
+        if not isinstance(t0, hightime.datetime):
+            raise TypeError("t0 must be a hightime.datetime, not %s" % type(t0).__name__)
+        if (dt is None) == (rate is None):
+            raise TypeError("exactly one of dt and rate must be specified")
+        if dt is not None:
+            if not isinstance(dt, std_datetime.timedelta):
+                raise TypeError("dt must be a timedelta, not %s" % type(dt).__name__)
+            numerator, denominator = hightime.timedelta._as_ys(dt), 1
+        else:
+            if isinstance(rate, int):
+                rate_numerator, rate_denominator = rate, 1
+            else:
+                rate_numerator, rate_denominator = rate.as_integer_ratio()
+            if rate_numerator <= 0:
+                raise ValueError("rate must be positive", rate)
+            numerator, denominator = _YS_PER_S * rate_denominator, rate_numerator
+        if numerator <= 0:
+            raise ValueError("dt must be positive", dt)
+        divisor = gcd(numerator, denominator)
+        self._t0 = t0
+        self._t0_ys = t0._to_epoch_ys()
+        self._numerator = numerator // divisor
+        self._denominator = denominator // divisor
+
+    # Public properties
+
+    @property
+    def t0(self):
+        """The time of sample 0."""
+        return self._t0
+
+    @property
+    def dt(self):
+        """The sample period, rounded half to even to the nearest yoctosecond."""
+        return hightime.timedelta._from_ys(_divide_and_round(self._numerator, self._denominator))
+
+    @property
+    def rate(self):
+        """The exact sample rate in hertz, as a :any:`fractions.Fraction`."""
+        from fractions import Fraction
+
+        return Fraction(_YS_PER_S * self._denominator, self._numerator)
+
+    # Public methods
+
+    def time_of(self, n):
+        """Return the time of sample ``n``."""
+        return hightime.datetime._from_epoch_ys(self._ys_of(n), self._t0.tzinfo)
+
+    def index_of(self, t, rounding="nearest"):
+        """Return the index of the sample at time ``t``.
+
+        ``rounding`` selects the sample when ``t`` falls between samples:
+
+        * ``"nearest"``: the nearest sample, with ties going to the even index.
+        * ``"floor"``: the last sample at or before ``t``.
+        * ``"ceil"``: the first sample at or after ``t``.
+        * ``"exact"``: raise :any:`ValueError` unless ``t`` is exactly a sample time.
+        """
+        if rounding not in _ROUNDINGS:
+            raise ValueError("rounding must be one of {}".format(", ".join(_ROUNDINGS)), rounding)
+        offset = t._to_epoch_ys() - self._t0_ys
+        if rounding == "nearest":
+            return _divide_and_round(offset * self._denominator, self._numerator)
+
+        # Sample times are rounded to the nearest yoctosecond, so step the unrounded estimate
+        # to match the rounded times actually returned by time_of().
+        n = (offset * self._denominator) // self._numerator
+        ys_of = self._ys_of
+        t_ys = offset + self._t0_ys
+        while ys_of(n + 1) <= t_ys:
+            n += 1
+        while ys_of(n) > t_ys:
+            n -= 1
+        if rounding == "floor":
+            return n
+        if ys_of(n) == t_ys:
+            return n
+        if rounding == "ceil":
+            return n + 1
+        raise ValueError("t is not a sample time", t)
+
+    def times(self, start, stop):
+        """Return the times of samples ``start`` through ``stop - 1`` as a DatetimeArray."""
+        return DatetimeArray._from_ys(self._iter_ys(start, stop), self._t0.tzinfo)
+
+    def iter_times(self, start=0, stop=None):
+        """Yield the times of samples ``start`` through ``stop - 1``, or forever."""
+        from_epoch_ys = hightime.datetime._from_epoch_ys
+        tzinfo = self._t0.tzinfo
+        for ys in self._iter_ys(start, stop):
+            yield from_epoch_ys(ys, tzinfo)
+
+    # Other operators
+
+    def __eq__(self, other):
+        """Return self==other."""
+        if not isinstance(other, SampleClock):
+            return NotImplemented
+        return (self._t0, self._numerator, self._denominator) == (
+            other._t0,
+            other._numerator,
+            other._denominator,
+        )
+
+    def __hash__(self):
+        """Return hash(self)."""
+        return hash((self._t0, self._numerator, self._denominator))
+
+    def __repr__(self):
+        """Return repr(self)."""
+        if self._denominator == 1:
+            period = "dt={!r}".format(self.dt)
+        else:
+            period = "rate={!r}".format(self.rate)
+        return "{}.{}({!r}, {})".format(
+            self.__class__.__module__, self.__class__.__qualname__, self._t0, period
+        )
+
+    # Helper methods
+
+    def _ys_of(self, n):
+        return self._t0_ys + _divide_and_round(n * self._numerator, self._denominator)
+
+    def _iter_ys(self, start, stop):
+        # Step the exact offset with an integer quotient and remainder instead of multiplying
+        # n * numerator for every sample.
+        t0_ys = self._t0_ys
+        numerator = self._numerator
+        denominator = self._denominator
+        if denominator == 1:
+            if stop is None:
+                ys = t0_ys + start * numerator
+                while True:
+                    yield ys
+                    ys += numerator
+            yield from range(t0_ys + start * numerator, t0_ys + stop * numerator, numerator)
+            return
+
+        step, step_remainder = divmod(numerator, denominator)
+        quotient, remainder = divmod(start * numerator, denominator)
+        n = start
+        while stop is None or n < stop:
+            # Round half to even, as _divide_and_round does.
+            twice = 2 * remainder
+            if twice > denominator or (twice == denominator and quotient & 1):
+                yield t0_ys + quotient + 1
+            else:
+                yield t0_ys + quotient
+            quotient += step
+            remainder += step_remainder
+            if remainder >= denominator:
+                quotient += 1
+                remainder -= denominator
+            n += 1
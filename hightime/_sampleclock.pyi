@@ -0,0 +1,34 @@
+import datetime as std_datetime
+from fractions import Fraction
+from typing import Iterator, Literal, Optional, SupportsFloat, Union
+
+import hightime
+
+_Rate = Union[int, SupportsFloat]
+_Rounding = Literal["nearest", "floor", "ceil", "exact"]
+
+class SampleClock:
+    def __init__(
+        self,
+        t0: hightime.datetime,
+        dt: Optional[std_datetime.timedelta] = ...,
+        *,
+        rate: Optional[_Rate] = ...,
+    ) -> None: ...
+    def __eq__(self, other: object, /) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __repr__(self) -> str: ...
+    def _iter_ys(self, start: int, stop: Optional[int], /) -> Iterator[int]: ...
+    def _ys_of(self, n: int, /) -> int: ...
+    @property
+    def dt(self) -> hightime.timedelta: ...
+    def index_of(self, t: hightime.datetime, rounding: _Rounding = ...) -> int: ...
+    def iter_times(
+        self, start: int = ..., stop: Optional[int] = ...
+    ) -> Iterator[hightime.datetime]: ...
+    @property
+    def rate(self) -> Fraction: ...
+    @property
+    def t0(self) -> hightime.datetime: ...
+    def time_of(self, n: int) -> hightime.datetime: ...
+    def times(self, start: int, stop: int) -> hightime.DatetimeArray: ...
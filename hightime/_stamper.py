@@ -0,0 +1,71 @@
+import time
+
+import hightime
+
+_YS_PER_NS = 10**15
+
+
+class MonotonicStamper:
+    """Returns unique, strictly increasing :any:`hightime.datetime` stamps, across threads.
+
+    Stamps are read from ``clock``, a function returning integer nanoseconds since the Unix
+    epoch in UTC. When the clock has not advanced since the previous stamp, or has gone back,
+    the previous stamp plus one yoctosecond is returned instead, so the sub-nanosecond fields
+    act as a tiebreak counter and stamps never repeat. The clock is read outside the lock,
+    which is only held to compare and store the previous stamp, so it is safe to share one
+    stamper between threads, including on free-threaded builds.
+
+    Stamps are returned in ``tzinfo``, or as naive UTC datetimes if ``tzinfo`` is ``None``.
+
+    >>> stamper = MonotonicStamper(clock=lambda: 1_700_000_000_000_000_000)
+    >>> [str(stamper.now()) for _ in range(2)]
+    ['2023-11-14 22:13:20', '2023-11-14 22:13:20.000000000000000000000001']
+    """
+
+    __slots__ = ("_lock", "_last", "_clock", "_tzinfo")
+
+    def __init__(self, tzinfo=None, clock=time.time_ns):
+        """Initialize the stamper."""
+        # The threading module imports collections, so it is imported on first use.
+        import threading
+
+        self._lock = threading.Lock()
+        self._last = None
+        self._clock = clock
+        self._tzinfo = tzinfo
+
+    # Public properties
+
+    @property
+    def tzinfo(self):
+        """The time zone the stamps are returned in."""
+        return self._tzinfo
+
+    # Public methods
+
+    def now(self):
+        """Return the next stamp as a :any:`hightime.datetime`."""
+        return hightime.datetime._from_epoch_ys(self._next_ys(1), self._tzinfo)
+
+    def now_many(self, count):
+        """Return the next ``count`` stamps as a :any:`hightime.DatetimeArray`.
+
+        The stamps are reserved with a single acquisition of the lock, and are consecutive
+        yoctoseconds from the current clock reading.
+        """
+        if count < 0:
+            raise ValueError("count must not be negative", count)
+        start = self._next_ys(count)
+        return hightime.DatetimeArray._from_ys(range(start, start + count), self._tzinfo)
+
+    # Helper methods
+
+    def _next_ys(self, count):
+        # Reserve ``count`` consecutive stamps and return the first.
+        ys = self._clock() * _YS_PER_NS
+        with self._lock:
+            last = self._last
+            if last is not None and ys <= last:
+                ys = last + 1
+            self._last = ys + count - 1
+        return ys
@@ -0,0 +1,14 @@
+import datetime as std_datetime
+from typing import Callable, Optional
+
+import hightime
+
+class MonotonicStamper:
+    def __init__(
+        self, tzinfo: Optional[std_datetime.tzinfo] = ..., clock: Callable[[], int] = ...
+    ) -> None: ...
+    def _next_ys(self, count: int, /) -> int: ...
+    def now(self) -> hightime.datetime: ...
+    def now_many(self, count: int) -> hightime.DatetimeArray: ...
+    @property
+    def tzinfo(self) -> Optional[std_datetime.tzinfo]: ...
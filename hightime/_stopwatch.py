@@ -0,0 +1,232 @@
+import time
+
+import hightime
+from hightime._timedelta import _divide_and_round
+
+_YS_PER_NS = 10**15
+_PERCENTILES = (50, 90, 99)
+_SUMMARY_KEYS = ("total", "min", "max", "mean", "stdev") + tuple(
+    "p{}".format(p) for p in _PERCENTILES
+)
+
+
+class Stopwatch:
+    """Records the durations of repeated operations, for profiling.
+
+    Durations are read from ``clock``, a function returning integer nanoseconds, and the most
+    recent ``capacity`` of them are kept as integers in a preallocated ring buffer, so recording
+    does not allocate :any:`hightime.timedelta` objects. They are converted when reported.
+
+    A stopwatch is a context manager that times its body, and a decorator that times each call
+    of the decorated function. A stopwatch is not thread-safe.
+
+    >>> stopwatch = Stopwatch(clock=iter(range(0, 1000, 7)).__next__)
+    >>> for _ in range(3):
+    ...     with stopwatch:
+    ...         pass
+    >>> [str(lap) for lap in stopwatch.laps()]
+    ['0:00:00.000000007000000', '0:00:00.000000007000000', '0:00:00.000000007000000']
+    """
+
+    __slots__ = ("_laps", "_capacity", "_count", "_start", "_clock")
+
+    def __init__(self, capacity=1024, clock=time.perf_counter_ns):
+        """Initialize an empty stopwatch that keeps the last ``capacity`` laps."""
+        if capacity < 1:
+            raise ValueError("capacity must be positive", capacity)
+        # The array module imports collections, so it is imported on first use.
+        from array import array
+
+        self._laps = array("q", bytes(8 * capacity))
+        self._capacity = capacity
+        self._count = 0
+        self._start = None
+        self._clock = clock
+
+    # Public properties
+
+    @property
+    def capacity(self):
+        """The number of laps kept."""
+        return self._capacity
+
+    @property
+    def count(self):
+        """The number of laps recorded since the last :meth:`reset`, including dropped ones."""
+        return self._count
+
+    @property
+    def last(self):
+        """The most recent lap as a :any:`hightime.timedelta`, or ``None`` if there is none."""
+        if not self._count:
+            return None
+        return hightime.timedelta._from_ys(
+            self._laps[(self._count - 1) % self._capacity] * _YS_PER_NS
+        )
+
+    # Public methods
+
+    def start(self):
+        """Start timing a lap."""
+        self._start = self._clock()
+
+    def stop(self):
+        """Stop timing the lap started by :meth:`start`, and record it."""
+        if self._start is None:
+            raise RuntimeError("stopwatch was not started")
+        self.record_ns(self._clock() - self._start)
+        self._start = None
+
+    def record_ns(self, nanoseconds):
+        """Record a lap of ``nanoseconds``, measured elsewhere."""
+        self._laps[self._count % self._capacity] = nanoseconds
+        self._count += 1
+
+    def reset(self):
+        """Discard the recorded laps."""
+        self._count = 0
+        self._start = None
+
+    def laps(self):
+        """Return the kept laps, oldest first, as a :any:`hightime.TimedeltaArray`."""
+        return hightime.TimedeltaArray._from_ys(ns * _YS_PER_NS for ns in self._iter_ns())
+
+    def summary(self):
+        """Return statistics of the kept laps as a dict.
+
+        The keys are ``"count"``, the number of laps, and ``"total"``, ``"min"``, ``"max"``,
+        ``"mean"``, ``"stdev"`` (population standard deviation), ``"p50"``, ``"p90"`` and
+        ``"p99"`` (nearest-rank percentiles), which are :any:`hightime.timedelta` values, or
+        ``None`` if there are no laps.
+        """
+        laps = sorted(self._iter_ns())
+        count = len(laps)
+        result = {"count": count}
+        if not count:
+            result.update(dict.fromkeys(_SUMMARY_KEYS))
+            return result
+
+        from math import isqrt
+
+        from_ys = hightime.timedelta._from_ys
+        total = sum(laps)
+        # Variance in ys**2, so that the square root is exact to the yoctosecond.
+        variance = _divide_and_round(
+            (count * sum(ns * ns for ns in laps) - total * total) * _YS_PER_NS**2, count * count
+        )
+        result["total"] = from_ys(total * _YS_PER_NS)
+        result["min"] = from_ys(laps[0] * _YS_PER_NS)
+        result["max"] = from_ys(laps[-1] * _YS_PER_NS)
+        result["mean"] = from_ys(_divide_and_round(total * _YS_PER_NS, count))
+        result["stdev"] = from_ys(isqrt(variance))
+        for p in _PERCENTILES:
+            rank = max(-(-p * count // 100), 1)
+            result["p{}".format(p)] = from_ys(laps[rank - 1] * _YS_PER_NS)
+        return result
+
+    def histogram(self, bins=10):
+        """Return ``(low, high, count)`` for ``bins`` equal-width bins over the kept laps.
+
+        ``low`` and ``high`` are :any:`hightime.timedelta` bounds; each bin counts the laps with
+        ``low <= lap < high``, except the last, which also counts laps equal to its ``high``.
+        Returns an empty list if there are no laps.
+        """
+        if bins < 1:
+            raise ValueError("bins must be positive", bins)
+        laps = list(self._iter_ns())
+        if not laps:
+            return []
+        low = min(laps)
+        width = max(-(-(max(laps) - low) // bins), 1)
+        counts = [0] * bins
+        for ns in laps:
+            counts[min((ns - low) // width, bins - 1)] += 1
+        from_ys = hightime.timedelta._from_ys
+        return [
+            (
+                from_ys((low + i * width) * _YS_PER_NS),
+                from_ys((low + (i + 1) * width) * _YS_PER_NS),
+                count,
+            )
+            for i, count in enumerate(counts)
+        ]
+
+    def report(self, bins=10, width=40):
+        """Return a text report of :meth:`summary` and :meth:`histogram`.
+
+        Histogram bars are scaled so the largest bin is ``width`` characters long.
+        """
+        summary = self.summary()
+        lines = ["count: {}".format(summary.pop("count"))]
+        lines.extend("{}: {}".format(key, value) for key, value in summary.items())
+        histogram = self.histogram(bins)
+        if histogram:
+            largest = max(count for _, _, count in histogram)
+            for low, high, count in histogram:
+                bar = "#" * _divide_and_round(count * width, largest)
+                lines.append("[{}, {}) {:>8} {}".format(low, high, count, bar).rstrip())
+        return "\n".join(lines)
+
+    # Context manager and decorator
+
+    def __enter__(self):
+        """Start timing a lap and return self."""
+        self._start = self._clock()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop timing the lap and record it."""
+        end = self._clock()
+        self.record_ns(end - self._start)
+        self._start = None
+
+    def __call__(self, function):
+        """Return a wrapper of ``function`` that records the duration of each call."""
+        from functools import wraps
+
+        clock = self._clock
+        record_ns = self.record_ns
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record_ns(clock() - start)
+
+        return wrapper
+
+    # Sequence protocol
+
+    def __len__(self):
+        """Return the number of laps kept."""
+        return min(self._count, self._capacity)
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return "{}.{}(capacity={}, count={})".format(
+            self.__class__.__module__, self.__class__.__qualname__, self._capacity, self._count
+        )
+
+    # Helper methods
+
+    def _iter_ns(self):
+        laps = self._laps
+        if self._count <= self._capacity:
+            return iter(laps[: self._count])
+        index = self._count % self._capacity
+        return iter(laps[index:] + laps[:index])
+
+
+def timer(clock=time.perf_counter_ns):
+    """Return a :any:`Stopwatch` for timing a single operation.
+
+    Use it as a context manager and read :attr:`Stopwatch.last` afterwards.
+
+    >>> with timer(clock=iter([100, 1600]).__next__) as t:
+    ...     pass
+    >>> t.last
+    hightime.timedelta(microseconds=1, femtoseconds=500000000)
+    """
+    return Stopwatch(1, clock)
@@ -0,0 +1,32 @@
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union
+
+import hightime
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+class Stopwatch:
+    def __init__(self, capacity: int = ..., clock: Callable[[], int] = ...) -> None: ...
+    def __call__(self, function: _F, /) -> _F: ...
+    def __enter__(self) -> Stopwatch: ...
+    def __exit__(self, *exc_info: object) -> None: ...
+    def __len__(self) -> int: ...
+    def __repr__(self) -> str: ...
+    def _iter_ns(self) -> Iterator[int]: ...
+    @property
+    def capacity(self) -> int: ...
+    @property
+    def count(self) -> int: ...
+    def histogram(
+        self, bins: int = ...
+    ) -> list[tuple[hightime.timedelta, hightime.timedelta, int]]: ...
+    def laps(self) -> hightime.TimedeltaArray: ...
+    @property
+    def last(self) -> Optional[hightime.timedelta]: ...
+    def record_ns(self, nanoseconds: int, /) -> None: ...
+    def report(self, bins: int = ..., width: int = ...) -> str: ...
+    def reset(self) -> None: ...
+    def start(self) -> None: ...
+    def stop(self) -> None: ...
+    def summary(self) -> dict[str, Union[int, Optional[hightime.timedelta]]]: ...
+
+def timer(clock: Callable[[], int] = ...) -> Stopwatch: ...
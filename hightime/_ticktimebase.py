@@ -0,0 +1,174 @@
+import operator
+from bisect import bisect_right
+
+import hightime
+from hightime._array import DatetimeArray
+from hightime._sampleclock import SampleClock
+
+
+class TickTimebase:
+    """Maps a hardware tick counter to exact datetimes.
+
+    The counter runs at ``rate`` ticks per second and wraps around every ``2**counter_bits``
+    ticks. The tick with counter value ``anchor_tick`` occurred at ``anchor_time``.
+
+    Tick values passed to :meth:`convert`, :meth:`convert_many`, :meth:`unwrap`, and
+    :meth:`unwrap_many` are raw counter values read in order from a stream. Each is unwrapped
+    relative to the previous one into a monotonic tick count, assuming the counter moved by less
+    than half its range in between. Values that went backwards by less than half the range are
+    treated as late, not as a rollover. :meth:`time_of` converts an already unwrapped tick count
+    without touching the stream state.
+
+    When a new sync point arrives, :meth:`reanchor` starts a new segment from that tick on; ticks
+    before it keep using the earlier segments.
+
+    >>> timebase = TickTimebase(datetime(2024, 1, 1), 0xFFFFFFF0, rate=10**6, counter_bits=32)
+    >>> timebase.convert(0x10)
+    hightime.datetime(2024, 1, 1, 0, 0, 0, 32)
+    """
+
+    __slots__ = ("_bits", "_modulus", "_last_raw", "_last_tick", "_ticks", "_clocks", "_tzinfo")
+
+    def __init__(self, anchor_time, anchor_tick, rate, counter_bits=64):
+        """Initialize the timebase from its first sync point."""
+        if not isinstance(counter_bits, int) or counter_bits <= 0:
+            raise ValueError("counter_bits must be a positive int", counter_bits)
+        self._bits = counter_bits
+        self._modulus = 1 << counter_bits
+        anchor_tick = self._as_raw(anchor_tick)
+        self._last_raw = anchor_tick
+        self._last_tick = anchor_tick
+        self._ticks = [anchor_tick]
+        self._clocks = [SampleClock(anchor_time, rate=rate)]
+        self._tzinfo = anchor_time.tzinfo
+
+    # Public properties
+
+    @property
+    def counter_bits(self):
+        """The width of the tick counter in bits."""
+        return self._bits
+
+    @property
+    def segments(self):
+        """The sync points as a list of ``(unwrapped_tick, anchor_time, rate)`` tuples."""
+        return [(tick, clock.t0, clock.rate) for tick, clock in zip(self._ticks, self._clocks)]
+
+    # Public methods
+
+    def reanchor(self, anchor_time, anchor_tick, rate=None):
+        """Start a new segment: the raw counter value ``anchor_tick`` occurred at ``anchor_time``.
+
+        ``anchor_tick`` is unwrapped like the other stream values and must come after the previous
+        sync point. ``rate`` defaults to the previous segment's rate.
+        """
+        # Validate everything before consuming anchor_tick from the stream.
+        raw = self._as_raw(anchor_tick)
+        tick = self._last_tick + self._delta(raw)
+        if tick <= self._ticks[-1]:
+            raise ValueError("anchor_tick must be after the previous sync point", anchor_tick)
+        if rate is None:
+            clock = SampleClock(anchor_time, rate=self._clocks[-1].rate)
+        else:
+            clock = SampleClock(anchor_time, rate=rate)
+        self._last_raw = raw
+        self._last_tick = tick
+        self._ticks.append(tick)
+        self._clocks.append(clock)
+
+    def unwrap(self, tick):
+        """Return the unwrapped tick count for the next raw counter value in the stream."""
+        raw = self._as_raw(tick)
+        self._last_tick += self._delta(raw)
+        self._last_raw = raw
+        return self._last_tick
+
+    def unwrap_many(self, ticks):
+        """Return a list of unwrapped tick counts for the next raw counter values in the stream.
+
+        ``ticks`` is any iterable of ints, such as a list, :any:`array.array`, or NumPy array.
+        """
+        as_raw = self._as_raw
+        modulus = self._modulus
+        mask = modulus - 1
+        half = modulus >> 1
+        last_raw = self._last_raw
+        last_tick = self._last_tick
+        result = []
+        append = result.append
+        try:
+            for raw in ticks:
+                raw = as_raw(raw)
+                delta = (raw - last_raw) & mask
+                if delta >= half:
+                    delta -= modulus
+                last_raw = raw
+                last_tick += delta
+                append(last_tick)
+        finally:
+            self._last_raw = last_raw
+            self._last_tick = last_tick
+        return result
+
+    def time_of(self, tick):
+        """Return the time of the unwrapped tick count ``tick``."""
+        index = max(bisect_right(self._ticks, tick) - 1, 0)
+        ys = self._clocks[index]._ys_of(tick - self._ticks[index])
+        return hightime.datetime._from_epoch_ys(ys, self._tzinfo)
+
+    def convert(self, tick):
+        """Return the time of the next raw counter value in the stream."""
+        return self.time_of(self.unwrap(tick))
+
+    def convert_many(self, ticks):
+        """Return the times of the next raw counter values in the stream as a DatetimeArray."""
+        return DatetimeArray._from_ys(self._iter_ys(self.unwrap_many(ticks)), self._tzinfo)
+
+    # Other operators
+
+    def __repr__(self):
+        """Return repr(self)."""
+        clock = self._clocks[0]
+        return "{}.{}({!r}, {!r}, rate={!r}, counter_bits={!r})".format(
+            self.__class__.__module__,
+            self.__class__.__qualname__,
+            clock.t0,
+            self._ticks[0] & (self._modulus - 1),
+            clock.rate,
+            self._bits,
+        )
+
+    # Helper methods
+
+    def _as_raw(self, tick):
+        # Integer types such as NumPy's are accepted, but floats are not truncated.
+        try:
+            raw = operator.index(tick)
+        except TypeError:
+            raise TypeError("tick must be an int, not %s" % type(tick).__name__) from None
+        if not 0 <= raw < self._modulus:
+            raise ValueError("tick must be in 0..2**{}-1".format(self._bits), tick)
+        return raw
+
+    def _delta(self, raw):
+        # The signed distance from the previous raw value, assuming less than half a wrap.
+        delta = (raw - self._last_raw) & (self._modulus - 1)
+        if delta >= self._modulus >> 1:
+            delta -= self._modulus
+        return delta
+
+    def _iter_ys(self, ticks):
+        # Consecutive ticks usually fall in the same segment, so only search the segment list
+        # when a tick leaves the current one.
+        segment_ticks = self._ticks
+        clocks = self._clocks
+        last = len(segment_ticks) - 1
+        low = high = None
+        for tick in ticks:
+            if low is None or not low <= tick < high:
+                index = max(bisect_right(segment_ticks, tick) - 1, 0)
+                low = segment_ticks[index] if index else float("-inf")
+                high = segment_ticks[index + 1] if index < last else float("inf")
+                origin = segment_ticks[index]
+                ys_of = clocks[index]._ys_of
+            yield ys_of(tick - origin)
@@ -0,0 +1,31 @@
+from fractions import Fraction
+from typing import Iterable, Iterator, Optional, SupportsFloat, SupportsIndex, SupportsInt, Union
+
+import hightime
+
+_Rate = Union[int, SupportsFloat]
+
+class TickTimebase:
+    def __init__(
+        self,
+        anchor_time: hightime.datetime,
+        anchor_tick: int,
+        rate: _Rate,
+        counter_bits: int = ...,
+    ) -> None: ...
+    def __repr__(self) -> str: ...
+    def _as_raw(self, tick: SupportsIndex, /) -> int: ...
+    def _delta(self, raw: int, /) -> int: ...
+    def _iter_ys(self, ticks: Iterable[int], /) -> Iterator[int]: ...
+    def convert(self, tick: int) -> hightime.datetime: ...
+    def convert_many(self, ticks: Iterable[SupportsInt]) -> hightime.DatetimeArray: ...
+    @property
+    def counter_bits(self) -> int: ...
+    def reanchor(
+        self, anchor_time: hightime.datetime, anchor_tick: int, rate: Optional[_Rate] = ...
+    ) -> None: ...
+    @property
+    def segments(self) -> list[tuple[int, hightime.datetime, Fraction]]: ...
+    def time_of(self, tick: int) -> hightime.datetime: ...
+    def unwrap(self, tick: int) -> int: ...
+    def unwrap_many(self, ticks: Iterable[SupportsInt]) -> list[int]: ...
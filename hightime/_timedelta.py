@@ -1,7 +1,4 @@
 import datetime as std_datetime
-import decimal
-from decimal import Decimal
-from fractions import Fraction
 
 _YS_PER_S = 10**24
 _YS_PER_US = 10**18
@@ -13,6 +10,79 @@ _US_PER_WEEK = 7 * _US_PER_DAY
 _NS_PER_HOUR = 60 * 60 * (10**9)
 _PS_PER_MINUTE = 60 * (10**12)
 
+# Multiplier to convert each constructor argument to yoctoseconds, in signature order.
+_YS_PER_ARG = (
+    _YS_PER_DAY,  # days
+    _YS_PER_S,  # seconds
+    _YS_PER_US,  # microseconds
+    10**21,  # milliseconds
+    60 * _YS_PER_S,  # minutes
+    60 * 60 * _YS_PER_S,  # hours
+    7 * _YS_PER_DAY,  # weeks
+    10**15,  # nanoseconds
+    10**12,  # picoseconds
+    _YS_PER_FS,  # femtoseconds
+    10**6,  # attoseconds
+    10**3,  # zeptoseconds
+    1,  # yoctoseconds
+)
+
+# Number of fractional second digits for each isoformat timespec.
+_ISOFORMAT_DIGITS = {
+    "seconds": 0,
+    "milliseconds": 3,
+    "microseconds": 6,
+    "nanoseconds": 9,
+    "picoseconds": 12,
+    "femtoseconds": 15,
+    "attoseconds": 18,
+    "zeptoseconds": 21,
+    "yoctoseconds": 24,
+}
+
+# Yoctoseconds per ISO 8601 duration designator
+_YS_PER_DESIGNATOR = {
+    "W": 7 * _YS_PER_DAY,
+    "D": _YS_PER_DAY,
+    "H": 60 * 60 * _YS_PER_S,
+    "M": 60 * _YS_PER_S,
+    "S": _YS_PER_S,
+}
+
+# Created lazily, see _ys_to_decimal_seconds
+_DECIMAL_CONTEXT = None
+
+# Compiled lazily, see _get_regex
+_REGEXES = {}
+_REGEX_PATTERNS = {
+    "isoformat": (
+        r"([-+])?P(?!$)(?:(\d+(?:[.,]\d+)?)W)?(?:(\d+(?:[.,]\d+)?)D)?"
+        r"(?:T(?!$)(?:(\d+(?:[.,]\d+)?)H)?(?:(\d+(?:[.,]\d+)?)M)?(?:(\d+(?:[.,]\d+)?)S)?)?"
+    ),
+    "str": r"(?:(-?\d+) days?, )?(\d+):([0-5]\d):([0-5]\d)(?:\.(\d{1,24}))?",
+    "format_spec": (
+        r"(?:(?P<fill>.)?(?P<align>[<>=^]))?(?P<sign>[-+ ])?(?P<zero>0)?(?P<width>\d+)?"
+        r"(?:\.(?P<precision>\d+))?(?P<unit>[munpfazy]?s)?(?P<notation>[fe])?"
+    ),
+}
+
+# Power of ten dividing a yoctosecond count to get each __format__ unit.
+_UNIT_EXPONENTS = {
+    "s": 24,
+    "ms": 21,
+    "us": 18,
+    "ns": 15,
+    "ps": 12,
+    "fs": 9,
+    "as": 6,
+    "zs": 3,
+    "ys": 0,
+}
+
+# Parsed __format__ specs, keyed by spec string. See _parse_format_spec.
+_FORMAT_SPEC_CACHE = {}
+_FORMAT_SPEC_CACHE_SIZE = 256
+
 _FIELD_NAMES = [
     "days",
     "seconds",
@@ -21,6 +91,11 @@ _FIELD_NAMES = [
     "yoctoseconds",
 ]
 
+# Sort keys are big-endian 128-bit yoctosecond counts with the sign bit flipped, so that
+# byte-wise comparison matches numeric order.
+_SORT_KEY_SIZE = 16
+_SORT_KEY_BIAS = 1 << 127
+
 
 # Ripped from standard library's datetime.py
 def _divide_and_round(a, b):
@@ -33,10 +108,206 @@ def _divide_and_round(a, b):
     return q
 
 
+def _encode_sort_key(ys):
+    try:
+        return (ys + _SORT_KEY_BIAS).to_bytes(_SORT_KEY_SIZE, "big")
+    except OverflowError:
+        raise OverflowError("value out of range for a sort key") from None
+
+
+def _decode_sort_key(key):
+    if len(key) != _SORT_KEY_SIZE:
+        raise ValueError("sort keys are {} bytes, not {}".format(_SORT_KEY_SIZE, len(key)))
+    return int.from_bytes(key, "big") - _SORT_KEY_BIAS
+
+
 def _cmp(x, y):
     return 0 if x == y else 1 if x > y else -1
 
 
+def _get_regex(name):
+    regex = _REGEXES.get(name)
+    if regex is None:
+        # Imported lazily to keep `import hightime` fast.
+        import re
+
+        regex = _REGEXES[name] = re.compile(_REGEX_PATTERNS[name])
+    return regex
+
+
+def _ys_to_decimal_seconds(ys):
+    global _DECIMAL_CONTEXT
+    if _DECIMAL_CONTEXT is None:
+        # Imported lazily to keep `import hightime` fast.
+        import decimal
+
+        _DECIMAL_CONTEXT = decimal.Context(prec=64)
+    ctx = _DECIMAL_CONTEXT
+
+    seconds, remainder = divmod(ys, _YS_PER_S)
+    if not remainder:
+        return ctx.create_decimal(seconds)
+    # Scale in one exact step, then drop trailing zeros so the result has the same exponent as
+    # the equivalent sum of per-field quotients.
+    return ctx.create_decimal(ys).scaleb(-24, ctx).normalize(ctx)
+
+
+def _split_lines(strings):
+    if isinstance(strings, (bytes, bytearray, memoryview)):
+        strings = str(strings, "utf-8")
+    if isinstance(strings, str):
+        strings = strings.splitlines()
+    return strings
+
+
+def _parse_decimal(value, scale):
+    """Return the decimal string ``value`` (with "." or "," separator) times ``scale``.
+
+    The result is rounded half to even to an integer.
+    """
+    integer, _, fraction = value.replace(",", ".").partition(".")
+    result = int(integer) * scale
+    if fraction:
+        result += _divide_and_round(int(fraction) * scale, 10 ** len(fraction))
+    return result
+
+
+def _parse_isoformat(duration_string):
+    if not isinstance(duration_string, str):
+        raise TypeError(
+            "fromisoformat: argument must be str, not %s" % type(duration_string).__name__
+        )
+    match = _get_regex("isoformat").fullmatch(duration_string)
+    if match is None:
+        raise ValueError("Invalid isoformat duration string: %r" % duration_string)
+
+    sign, *values = match.groups()
+    ys = 0
+    for value, scale in zip(values, _YS_PER_DESIGNATOR.values()):
+        if value is not None:
+            ys += _parse_decimal(value, scale)
+    return -ys if sign == "-" else ys
+
+
+def _format_isoformat(ys, timespec):
+    if timespec == "auto":
+        digits = None
+    else:
+        digits = _ISOFORMAT_DIGITS.get(timespec)
+        if digits is None:
+            raise ValueError("Unknown timespec value: %r" % (timespec,))
+
+    sign = "-" if ys < 0 else ""
+    days, ys = divmod(abs(ys), _YS_PER_DAY)
+    hours, ys = divmod(ys, 60 * 60 * _YS_PER_S)
+    minutes, ys = divmod(ys, 60 * _YS_PER_S)
+    seconds, ys = divmod(ys, _YS_PER_S)
+
+    if digits is None:
+        # Use the fewest groups of 3 digits that represent the value exactly.
+        fraction = "{:024d}".format(ys).rstrip("0")
+        fraction = fraction.ljust(-(-len(fraction) // 3) * 3, "0")
+    else:
+        fraction = "{:024d}".format(ys)[:digits]
+
+    s = sign + "P"
+    if days:
+        s += "{}D".format(days)
+    if hours or minutes or seconds or fraction or not days:
+        s += "T"
+        if hours:
+            s += "{}H".format(hours)
+        if minutes:
+            s += "{}M".format(minutes)
+        if seconds or fraction or not (hours or minutes):
+            s += "{}{}S".format(seconds, "." + fraction if fraction else "")
+    return s
+
+
+def _parse_format_spec(format_spec):
+    """Parse a __format__ spec into ``(sign, precision, exponent, engineering, pad)``.
+
+    ``pad`` is ``(fill, align, width)``, or ``None`` if no width is specified. As for
+    :any:`float`, a ``0`` before the width defaults the fill to ``0`` and the alignment to ``=``,
+    which pads between the sign and the digits.
+    """
+    match = _get_regex("format_spec").fullmatch(format_spec)
+    if match is None:
+        raise ValueError("Invalid format specifier %r for object of type 'timedelta'" % format_spec)
+
+    pad = None
+    if match["width"]:
+        fill = match["fill"] or ("0" if match["zero"] else " ")
+        align = match["align"] or ("=" if match["zero"] else ">")
+        pad = (fill, align, int(match["width"]))
+    precision = match["precision"]
+    return (
+        match["sign"] or "-",
+        None if precision is None else int(precision),
+        _UNIT_EXPONENTS[match["unit"] or "s"],
+        match["notation"] == "e",
+        pad,
+    )
+
+
+def _format_fixed(value, exponent, precision):
+    """Format ``value / 10**exponent`` (value >= 0) as a fixed-point decimal string.
+
+    If ``precision`` is None, all significant digits are shown. Otherwise, the result has exactly
+    ``precision`` decimal places and is rounded half to even.
+    """
+    if exponent < 0:
+        value *= 10**-exponent
+        exponent = 0
+    if precision is None:
+        precision = exponent
+        strip = True
+    else:
+        if precision < exponent:
+            value = _divide_and_round(value, 10 ** (exponent - precision))
+        else:
+            value *= 10 ** (precision - exponent)
+        strip = False
+    digits = "{:0{}d}".format(value, precision + 1)
+    integer, fraction = digits[: len(digits) - precision], digits[len(digits) - precision :]
+    if strip:
+        fraction = fraction.rstrip("0")
+    return integer + "." + fraction if fraction else integer
+
+
+def _format_engineering(value, exponent, precision):
+    """Format ``value / 10**exponent`` (value >= 0) in engineering notation.
+
+    The mantissa is in [1, 1000) and the exponent is a multiple of 3.
+    """
+    if value == 0:
+        return _format_fixed(0, 0, precision) + "e+00"
+    eng_exponent = (len(str(value)) - 1 - exponent) // 3 * 3
+    if precision is not None:
+        # Rounding may carry the mantissa up to 1000, in which case use the next exponent.
+        rounded = _divide_and_round(value * 10**precision, 10 ** (exponent + eng_exponent))
+        if rounded >= 1000 * 10**precision:
+            eng_exponent += 3
+    mantissa = _format_fixed(value, exponent + eng_exponent, precision)
+    return "{}e{:+03d}".format(mantissa, eng_exponent)
+
+
+def _parse_str(duration_string):
+    if not isinstance(duration_string, str):
+        raise TypeError("fromstr: argument must be str, not %s" % type(duration_string).__name__)
+    match = _get_regex("str").fullmatch(duration_string)
+    if match is None:
+        raise ValueError("Invalid timedelta string: %r" % duration_string)
+
+    days, hours, minutes, seconds, fraction = match.groups()
+    ys = (int(hours) * 3600 + int(minutes) * 60 + int(seconds)) * _YS_PER_S
+    if days is not None:
+        ys += int(days) * _YS_PER_DAY
+    if fraction is not None:
+        ys += int(fraction.ljust(24, "0"))
+    return ys
+
+
 class timedelta(std_datetime.timedelta):  # noqa: N801 - class name should use CapWords convention
     """A timedelta represents a duration.
 
@@ -98,6 +369,28 @@ class timedelta(std_datetime.timedelta):  # noqa: N801 - class name should use C
         yoctoseconds=0,
     ):
         """Construct a timedelta object."""
+        args = (
+            days,
+            seconds,
+            microseconds,
+            milliseconds,
+            minutes,
+            hours,
+            weeks,
+            nanoseconds,
+            picoseconds,
+            femtoseconds,
+            attoseconds,
+            zeptoseconds,
+            yoctoseconds,
+        )
+        if all(type(arg) is int for arg in args):
+            # Integers are exact, so skip the Fraction machinery below entirely.
+            return cls._from_ys(sum(arg * scale for arg, scale in zip(args, _YS_PER_ARG)))
+
+        # Imported lazily since it is only needed for non-integer arguments.
+        from fractions import Fraction
+
         # Ideally we'd just take care of the sub-microsecond bits, but since the user
         # could specify larger units as a float with a sub-microsecond value,
         # datetime.datetime would round it. Therefore we're responsible for everything.
@@ -171,8 +464,116 @@ class timedelta(std_datetime.timedelta):  # noqa: N801 - class name should use C
         """yoctoseconds"""  # noqa: D403, D415 - timedelta properties have minimal docstrings
         return self._yoctoseconds
 
+    # Public classmethods
+
+    @classmethod
+    def fromisoformat(cls, duration_string):
+        """Return a timedelta corresponding to an ISO 8601 duration string.
+
+        Weeks, days, hours, minutes, and seconds are supported, each with an optional decimal
+        fraction. Years and months are not, since their length varies. A leading ``-`` negates
+        the duration.
+
+        >>> timedelta.fromisoformat("P1DT2H3M4.000000000000000000000005S")
+        hightime.timedelta(days=1, seconds=7384, yoctoseconds=5)
+        >>> timedelta.fromisoformat("-PT0.5S")
+        hightime.timedelta(days=-1, seconds=86399, microseconds=500000)
+
+        Values are exact to the yoctosecond; any finer fraction is rounded half to even.
+        """
+        return cls._from_ys(_parse_isoformat(duration_string))
+
+    @classmethod
+    def fromisoformat_many(cls, duration_strings):
+        """Return a list of timedeltas parsed from ISO 8601 duration strings.
+
+        ``duration_strings`` is either an iterable of strings or a single ``str``/bytes-like
+        buffer of newline-separated durations. See :meth:`fromisoformat`.
+        """
+        from_ys = cls._from_ys
+        return [from_ys(_parse_isoformat(s)) for s in _split_lines(duration_strings)]
+
+    @classmethod
+    def fromstr(cls, duration_string):
+        """Return a timedelta corresponding to a string in the format produced by ``str()``.
+
+        >>> timedelta.fromstr("1 day, 2:03:04.000000000000000000000005")
+        hightime.timedelta(days=1, seconds=7384, yoctoseconds=5)
+        """
+        return cls._from_ys(_parse_str(duration_string))
+
+    @classmethod
+    def fromstr_many(cls, duration_strings):
+        """Return a list of timedeltas parsed from strings in the format produced by ``str()``.
+
+        ``duration_strings`` is either an iterable of strings or a single ``str``/bytes-like
+        buffer of newline-separated durations. See :meth:`fromstr`.
+        """
+        from_ys = cls._from_ys
+        return [from_ys(_parse_str(s)) for s in _split_lines(duration_strings)]
+
+    @classmethod
+    def from_sort_key(cls, key):
+        """Return the timedelta for a key returned by :meth:`to_sort_key`."""
+        return cls._from_ys(_decode_sort_key(key))
+
+    @classmethod
+    def from_sort_keys(cls, keys):
+        """Return a list of timedeltas for keys returned by :meth:`to_sort_key`."""
+        from_ys = cls._from_ys
+        return [from_ys(_decode_sort_key(key)) for key in keys]
+
+    @classmethod
+    def to_sort_keys(cls, timedeltas):
+        """Return a list of :meth:`to_sort_key` values for ``timedeltas``."""
+        as_ys = cls._as_ys
+        return [_encode_sort_key(as_ys(td)) for td in timedeltas]
+
+    @classmethod
+    def precision_total_seconds_many(cls, timedeltas):
+        """Return a list of :meth:`precision_total_seconds` values for ``timedeltas``."""
+        as_ys = cls._as_ys
+        return [_ys_to_decimal_seconds(as_ys(td)) for td in timedeltas]
+
+    @classmethod
+    def isoformat_many(cls, timedeltas, timespec="auto"):
+        """Return a list of ISO 8601 duration strings for ``timedeltas``.
+
+        See :meth:`isoformat`.
+        """
+        as_ys = cls._as_ys
+        return [_format_isoformat(as_ys(td), timespec) for td in timedeltas]
+
     # Public methods
 
+    def isoformat(self, timespec="auto"):
+        """Return a string representing the duration in ISO 8601 format.
+
+        ``timespec`` selects the number of fractional second digits: "auto" uses as many groups of
+        3 digits as needed to be exact, while "seconds", "milliseconds", ..., "yoctoseconds" use a
+        fixed number of digits, truncating the rest. Negative durations have a leading ``-``.
+
+        >>> timedelta(days=1, minutes=2, femtoseconds=3).isoformat()
+        'P1DT2M0.000000000000003S'
+        >>> timedelta(hours=-1).isoformat(timespec="milliseconds")
+        '-PT1H0.000S'
+        >>> timedelta().isoformat()
+        'PT0S'
+        """
+        return _format_isoformat(timedelta._as_ys(self), timespec)
+
+    def to_sort_key(self):
+        """Return a 16-byte key whose byte-wise order matches the order of durations.
+
+        The key is the exact duration in yoctoseconds as a big-endian 128-bit integer with its
+        sign bit flipped. ``hightime.timedelta.to_sort_key`` also accepts
+        :any:`datetime.timedelta` values, so it can be passed directly as a ``sorted()`` key.
+
+        >>> timedelta(yoctoseconds=-1).to_sort_key().hex()
+        '7fffffffffffffffffffffffffffffff'
+        """
+        return _encode_sort_key(timedelta._as_ys(self))
+
     def total_seconds(self):
         """Total seconds in the duration."""
         return (
@@ -189,15 +590,17 @@ class timedelta(std_datetime.timedelta):  # noqa: N801 - class name should use C
         .. note::
             Up to 64 significant digits are used in computation.
         """
-        with decimal.localcontext() as ctx:
-            ctx.prec = 64
-            return Decimal(
-                (self.days * 86400)
-                + self.seconds
-                + Decimal(self.microseconds) / Decimal(10**6)
-                + Decimal(self.femtoseconds) / Decimal(10**15)
-                + Decimal(self.yoctoseconds) / Decimal(10**24)
-            )
+        return _ys_to_decimal_seconds(timedelta._as_ys(self))
+
+    def total_seconds_fraction(self):
+        """Exact total seconds in the duration, as a :any:`fractions.Fraction`.
+
+        >>> timedelta(seconds=1, yoctoseconds=1).total_seconds_fraction()
+        Fraction(1000000000000000000000001, 1000000000000000000000000)
+        """
+        from fractions import Fraction
+
+        return Fraction(timedelta._as_ys(self), _YS_PER_S)
 
     # String operators
 
@@ -228,6 +631,62 @@ class timedelta(std_datetime.timedelta):  # noqa: N801 - class name should use C
 
         return s
 
+    def __format__(self, format_spec):
+        """Return format(self, format_spec).
+
+        An empty ``format_spec`` is the same as ``str(self)``. Otherwise, the duration is
+        formatted as a number using
+        ``[[fill]align][sign][0][width][.precision][unit][notation]``:
+
+        * ``fill``, ``align`` (``<``, ``>``, ``=``, or ``^``), ``sign`` (``+``, ``-``, or space),
+          ``0``, and ``width`` behave as they do for :any:`float`.
+        * ``precision`` is the number of decimal places, rounded half to even. If omitted, all
+          significant digits are shown.
+        * ``unit`` is one of ``s`` (the default), ``ms``, ``us``, ``ns``, ``ps``, ``fs``, ``as``,
+          ``zs``, or ``ys``.
+        * ``notation`` is ``f`` for fixed-point (the default) or ``e`` for engineering notation,
+          where the exponent is a multiple of 3.
+
+        >>> td = timedelta(microseconds=1, femtoseconds=500)
+        >>> f"{td:.13s}"
+        '0.0000010000005'
+        >>> f"{td:ns}"
+        '1000.0005'
+        >>> f"{td:+.3e}"
+        '+1.000e-06'
+
+        Formatting is computed from the exact integer total, so it does not lose precision.
+        """
+        if not isinstance(format_spec, str):
+            raise TypeError("must be str, not %s" % type(format_spec).__name__)
+        if not format_spec:
+            return str(self)
+
+        spec = _FORMAT_SPEC_CACHE.get(format_spec)
+        if spec is None:
+            spec = _parse_format_spec(format_spec)
+            if len(_FORMAT_SPEC_CACHE) >= _FORMAT_SPEC_CACHE_SIZE:
+                _FORMAT_SPEC_CACHE.clear()
+            _FORMAT_SPEC_CACHE[format_spec] = spec
+        sign, precision, exponent, engineering, pad = spec
+
+        ys = timedelta._as_ys(self)
+        if engineering:
+            s = _format_engineering(abs(ys), exponent, precision)
+        else:
+            s = _format_fixed(abs(ys), exponent, precision)
+
+        if ys < 0:
+            sign = "-"
+        elif sign == "-":
+            sign = ""
+        if pad is None:
+            return sign + s
+        fill, align, width = pad
+        if align == "=":
+            return sign + fill * (width - len(sign) - len(s)) + s
+        return format(sign + s, fill + align + str(width))
+
     # Comparison operators
 
     def __eq__(self, other):
@@ -329,6 +788,8 @@ class timedelta(std_datetime.timedelta):  # noqa: N801 - class name should use C
             return NotImplemented
 
         if isinstance(other, std_datetime.timedelta):
+            from fractions import Fraction
+
             return float(Fraction(timedelta._as_ys(self), timedelta._as_ys(other)))
         return timedelta(**{field: getattr(self, field) / other for field in _FIELD_NAMES})
 
@@ -384,6 +845,19 @@ class timedelta(std_datetime.timedelta):  # noqa: N801 - class name should use C
         femtoseconds = (microseconds * 1000000000) + getattr(td, "femtoseconds", 0)
         return (femtoseconds * 1000000000) + getattr(td, "yoctoseconds", 0)
 
+    @classmethod
+    def _from_ys(cls, ys):
+        # Fast path for an exact integer number of yoctoseconds, bypassing the
+        # Fraction-based normalization in __new__.
+        days, ys = divmod(ys, _YS_PER_DAY)
+        seconds, ys = divmod(ys, _YS_PER_S)
+        microseconds, ys = divmod(ys, _YS_PER_US)
+        femtoseconds, ys = divmod(ys, _YS_PER_FS)
+        self = std_datetime.timedelta.__new__(cls, days, seconds, microseconds)
+        self._femtoseconds = femtoseconds
+        self._yoctoseconds = ys
+        return self
+
     @classmethod
     def _as_tuple(cls, td):
         return tuple(getattr(td, field, 0) for field in _FIELD_NAMES)
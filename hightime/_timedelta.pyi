@@ -1,6 +1,11 @@
 import datetime as std_datetime
 from decimal import Decimal
-from typing import ClassVar, overload
+from fractions import Fraction
+from typing import ClassVar, Iterable, Union, overload
+
+from _typeshed import ReadableBuffer
+
+_Lines = Union[Iterable[str], str, bytes, bytearray, memoryview]
 
 class timedelta(std_datetime.timedelta):
     min: ClassVar[timedelta]
@@ -15,6 +20,7 @@ class timedelta(std_datetime.timedelta):
     def __floordiv__(self, other: std_datetime.timedelta, /) -> int: ...
     @overload
     def __floordiv__(self, other: int, /) -> timedelta: ...
+    def __format__(self, format_spec: str, /) -> str: ...
     def __ge__(self, other: std_datetime.timedelta, /) -> bool: ...
     def __gt__(self, other: std_datetime.timedelta, /) -> bool: ...
     def __hash__(self) -> int: ...
@@ -56,9 +62,36 @@ class timedelta(std_datetime.timedelta):
     @classmethod
     def _as_ys(cls, td: std_datetime.timedelta, /) -> int: ...
     def _cmp(self, other: object, /) -> int: ...
+    @classmethod
+    def _from_ys(cls, ys: int, /) -> timedelta: ...
     @property
     def femtoseconds(self) -> int: ...
+    @classmethod
+    def from_sort_key(cls, key: ReadableBuffer, /) -> timedelta: ...
+    @classmethod
+    def from_sort_keys(cls, keys: Iterable[ReadableBuffer], /) -> list[timedelta]: ...
+    @classmethod
+    def fromisoformat(cls, duration_string: str, /) -> timedelta: ...
+    @classmethod
+    def fromisoformat_many(cls, duration_strings: _Lines, /) -> list[timedelta]: ...
+    @classmethod
+    def fromstr(cls, duration_string: str, /) -> timedelta: ...
+    @classmethod
+    def fromstr_many(cls, duration_strings: _Lines, /) -> list[timedelta]: ...
+    def isoformat(self, timespec: str = ...) -> str: ...
+    @classmethod
+    def isoformat_many(
+        cls, timedeltas: Iterable[std_datetime.timedelta], timespec: str = ...
+    ) -> list[str]: ...
     def precision_total_seconds(self) -> Decimal: ...
+    @classmethod
+    def precision_total_seconds_many(
+        cls, timedeltas: Iterable[std_datetime.timedelta], /
+    ) -> list[Decimal]: ...
+    def to_sort_key(self) -> bytes: ...
+    @classmethod
+    def to_sort_keys(cls, timedeltas: Iterable[std_datetime.timedelta], /) -> list[bytes]: ...
     def total_seconds(self) -> float: ...
+    def total_seconds_fraction(self) -> Fraction: ...
     @property
     def yoctoseconds(self) -> int: ...
@@ -0,0 +1,267 @@
+import datetime as std_datetime
+import struct
+from bisect import bisect_right
+
+from hightime._timedelta import _YS_PER_S, _YS_PER_US
+
+_EPOCH = std_datetime.datetime(1970, 1, 1)
+_ONE_US = std_datetime.timedelta(microseconds=1)
+
+_DAY_S = 86400
+_DAY_YS = _DAY_S * _YS_PER_S
+# Tables are limited to where every local time is in range.
+_MIN_S = (std_datetime.datetime(1, 1, 2) - _EPOCH) // std_datetime.timedelta(seconds=1)
+_MAX_S = (std_datetime.datetime(9999, 12, 31) - _EPOCH) // std_datetime.timedelta(seconds=1)
+# Transitions are read from the zone's TZif file. After the last one, the zone follows yearly
+# rules, whose transitions are found by probing the zone once a day and bisecting to the second.
+# A table is only built if that takes at most one probe per value plus _SCAN_DAYS.
+_SCAN_DAYS = 1000
+
+_AMBIGUOUS = ("raise", "earliest", "latest")
+_NONEXISTENT = ("raise", "shift_forward", "shift_backward")
+
+# magic, version, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt (RFC 8536).
+_TZIF_HEADER = struct.Struct(">4sc15x6l")
+
+# The most recently built table of each zone, keyed by tzinfo. See _zone_table.
+_TABLES = {}
+_TABLES_SIZE = 64
+# Transition times read from TZif files, keyed by zone key. See _zone_transitions.
+_TRANSITIONS = {}
+
+
+def _offset_ys(offset):
+    return (offset // _ONE_US) * _YS_PER_US
+
+
+def _check_policies(ambiguous, nonexistent):
+    if ambiguous not in _AMBIGUOUS:
+        raise ValueError("ambiguous must be one of {}".format(", ".join(_AMBIGUOUS)), ambiguous)
+    if nonexistent not in _NONEXISTENT:
+        raise ValueError(
+            "nonexistent must be one of {}".format(", ".join(_NONEXISTENT)), nonexistent
+        )
+
+
+class _FixedTable:
+    # The _ZoneTable interface for a fixed UTC offset.
+
+    __slots__ = ("_offset",)
+
+    def __init__(self, offset):
+        self._offset = offset
+
+    def iter_wall(self, values):
+        offset = self._offset
+        for ys in values:
+            yield ys + offset, 0
+
+    def localize(self, wall, ambiguous="raise", nonexistent="raise"):
+        return wall - self._offset
+
+
+class _ZoneTable:
+    # The UTC offsets of a zone over a window of UTC time, as sorted interval start times and
+    # offsets, both in yoctoseconds. _starts[0] is the start of the window rather than a
+    # transition. Tables are not modified once built, so they can be shared between threads.
+
+    __slots__ = ("_zone", "_starts", "_offsets", "_high")
+
+    def __init__(self, zone, starts, offsets, high):
+        self._zone = zone
+        self._starts = starts
+        self._offsets = offsets
+        # End of the window, inclusive.
+        self._high = high
+
+    def covers(self, low, high):
+        # Whether the window includes the UTC yoctoseconds [low, high].
+        return self._starts[0] <= low and high <= self._high
+
+    def iter_wall(self, values):
+        # Yield (local wall clock yoctoseconds, fold) for each UTC instant in values, only
+        # searching the table when a value leaves the interval of the previous one, so sorted
+        # input needs one search per interval.
+        starts = self._starts
+        offsets = self._offsets
+        low = high = None
+        for ys in values:
+            if low is None or not low <= ys < high:
+                index = max(bisect_right(starts, ys) - 1, 0)
+                low = starts[index]
+                high = starts[index + 1] if index + 1 < len(starts) else self._high + 1
+                offset = offsets[index]
+                if not low <= ys < high:
+                    # Outside the supported range; use the nearest interval.
+                    low, high = ys, ys + 1
+                # Wall times before fold_end were also shown before the transition.
+                fold_end = low + max(offsets[index - 1] if index else offset, offset)
+            wall = ys + offset
+            yield wall, 1 if wall < fold_end else 0
+
+    def localize(self, wall, ambiguous="raise", nonexistent="raise"):
+        # Return the UTC instant for the local wall clock time ``wall``.
+        starts = self._starts
+        offsets = self._offsets
+        count = len(starts)
+        first = max(bisect_right(starts, wall - _DAY_YS) - 1, 0)
+        last = min(bisect_right(starts, wall + _DAY_YS), count)
+        candidates = []
+        for index in range(first, last):
+            ys = wall - offsets[index]
+            if (index == first or starts[index] <= ys) and (
+                index + 1 == count or ys < starts[index + 1]
+            ):
+                candidates.append(ys)
+        if len(candidates) == 1:
+            return candidates[0]
+        if candidates:
+            if ambiguous == "raise":
+                raise ValueError("ambiguous local time in {}".format(self._zone))
+            return min(candidates) if ambiguous == "earliest" else max(candidates)
+
+        if nonexistent == "raise":
+            raise ValueError("nonexistent local time in {}".format(self._zone))
+        for index in range(max(first, 1), last):
+            start = starts[index]
+            if start + offsets[index - 1] <= wall < start + offsets[index]:
+                return start if nonexistent == "shift_forward" else start - 1
+        raise AssertionError("no gap found for a nonexistent time")  # pragma: no cover
+
+
+def _probe(zone, seconds):
+    # The UTC offset of zone at UTC second ``seconds``.
+    utc = (_EPOCH + std_datetime.timedelta(seconds=seconds)).replace(tzinfo=zone)
+    return _offset_ys(zone.fromutc(utc).utcoffset())
+
+
+def _parse_tzif(data):
+    # Return the transition times in UTC seconds from TZif data, or None if it is not valid.
+    try:
+        magic, version, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = (
+            _TZIF_HEADER.unpack_from(data)
+        )
+        if magic != b"TZif":
+            return None
+        if version == b"\0":
+            return struct.unpack_from(">{}l".format(timecnt), data, _TZIF_HEADER.size)
+        # Skip the version 1 data block to the version 2+ one, which has 64-bit times.
+        offset = _TZIF_HEADER.size + (
+            timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt
+        )
+        magic, _, _, _, _, timecnt, _, _ = _TZIF_HEADER.unpack_from(data, offset)
+        if magic != b"TZif":
+            return None
+        return struct.unpack_from(">{}q".format(timecnt), data, offset + _TZIF_HEADER.size)
+    except struct.error:
+        return None
+
+
+def _read_tzif(key):
+    # Read the TZif file for key from the same places as zoneinfo, or return None.
+    import os
+    import zoneinfo
+
+    for root in zoneinfo.TZPATH:
+        path = os.path.join(root, key)
+        if os.path.isfile(path):
+            with open(path, "rb") as file:
+                return file.read()
+    try:
+        from importlib import resources
+
+        package, _, name = ("tzdata/zoneinfo/" + key).rpartition("/")
+        return resources.files(package.replace("/", ".")).joinpath(name).read_bytes()
+    except (ImportError, OSError):
+        return None
+
+
+def _zone_transitions(zone):
+    # Return the transition times of a ZoneInfo in UTC seconds, or None if they cannot be read.
+    # Only the instance returned by ZoneInfo(key) is known to have been loaded from key's file.
+    import zoneinfo
+
+    key = zone.key
+    if key is None:
+        return None
+    try:
+        if zoneinfo.ZoneInfo(key) is not zone:
+            return None
+    except (ValueError, zoneinfo.ZoneInfoNotFoundError):
+        return None
+    transitions = _TRANSITIONS.get(key, False)
+    if transitions is False:
+        data = _read_tzif(key)
+        transitions = None if data is None else _parse_tzif(data)
+        _TRANSITIONS[key] = transitions
+    return transitions
+
+
+def _build_table(zone, low, high, count):
+    # Return a _ZoneTable covering the UTC seconds [low, high], or None if it would take too many
+    # probes to build for ``count`` values.
+    transitions = _zone_transitions(zone)
+    if transitions is None:
+        transitions = ()
+        scan_from = low
+    else:
+        scan_from = max(low, transitions[-1]) if transitions else low
+    if high - scan_from > (count + _SCAN_DAYS) * _DAY_S:
+        return None
+
+    starts = [low * _YS_PER_S]
+    offsets = [_probe(zone, low)]
+
+    def add(seconds, offset):
+        if offset != offsets[-1]:
+            starts.append(seconds * _YS_PER_S)
+            offsets.append(offset)
+
+    for seconds in transitions[bisect_right(transitions, low) : bisect_right(transitions, high)]:
+        add(seconds, _probe(zone, seconds))
+
+    seconds = max(scan_from, low)
+    offset = offsets[-1]
+    while seconds < high:
+        end = min(seconds + _DAY_S, high)
+        if _probe(zone, end) == offset:
+            seconds = end
+            continue
+        # Find the first second with the new offset, then keep scanning from there in case the
+        # offset changed again before ``end``.
+        while end - seconds > 1:
+            middle = (seconds + end) // 2
+            if _probe(zone, middle) == offset:
+                seconds = middle
+            else:
+                end = middle
+        seconds = end
+        offset = _probe(zone, seconds)
+        add(seconds, offset)
+    return _ZoneTable(zone, starts, offsets, high * _YS_PER_S)
+
+
+def _has_table(tzinfo):
+    # Whether _zone_table supports tzinfo.
+    return isinstance(tzinfo, std_datetime.timezone) or type(tzinfo).__module__ == "zoneinfo"
+
+
+def _zone_table(tzinfo, low, high, count):
+    # Return a table for tzinfo covering the UTC yoctoseconds [low, high], which hold ``count``
+    # values. Returns None if tzinfo is not a fixed offset or a ZoneInfo, or if building the table
+    # would cost more than calling tzinfo for each value.
+    if isinstance(tzinfo, std_datetime.timezone):
+        return _FixedTable(_offset_ys(tzinfo.utcoffset(None)))
+    if type(tzinfo).__module__ != "zoneinfo":
+        return None
+    low = min(max(low, _MIN_S * _YS_PER_S), _MAX_S * _YS_PER_S)
+    high = min(max(high, low), _MAX_S * _YS_PER_S)
+    table = _TABLES.get(tzinfo)
+    if table is not None and table.covers(low, high):
+        return table
+    table = _build_table(tzinfo, low // _YS_PER_S, -(-high // _YS_PER_S), count)
+    if table is not None:
+        if len(_TABLES) >= _TABLES_SIZE:
+            _TABLES.clear()
+        _TABLES[tzinfo] = table
+    return table
@@ -0,0 +1,29 @@
+import datetime as std_datetime
+from typing import Iterable, Iterator, Optional, Union
+
+def _build_table(
+    zone: std_datetime.tzinfo, low: int, high: int, count: int, /
+) -> Optional[_ZoneTable]: ...
+def _check_policies(ambiguous: str, nonexistent: str, /) -> None: ...
+def _has_table(tzinfo: std_datetime.tzinfo, /) -> bool: ...
+def _offset_ys(offset: std_datetime.timedelta, /) -> int: ...
+def _parse_tzif(data: bytes, /) -> Optional[tuple[int, ...]]: ...
+def _probe(zone: std_datetime.tzinfo, seconds: int, /) -> int: ...
+def _read_tzif(key: str, /) -> Optional[bytes]: ...
+def _zone_table(
+    tzinfo: std_datetime.tzinfo, low: int, high: int, count: int, /
+) -> Optional[Union[_FixedTable, _ZoneTable]]: ...
+def _zone_transitions(zone: std_datetime.tzinfo, /) -> Optional[tuple[int, ...]]: ...
+
+class _FixedTable:
+    def __init__(self, offset: int, /) -> None: ...
+    def iter_wall(self, values: Iterable[int], /) -> Iterator[tuple[int, int]]: ...
+    def localize(self, wall: int, ambiguous: str = ..., nonexistent: str = ..., /) -> int: ...
+
+class _ZoneTable:
+    def __init__(
+        self, zone: std_datetime.tzinfo, starts: list[int], offsets: list[int], high: int, /
+    ) -> None: ...
+    def covers(self, low: int, high: int, /) -> bool: ...
+    def iter_wall(self, values: Iterable[int], /) -> Iterator[tuple[int, int]]: ...
+    def localize(self, wall: int, ambiguous: str = ..., nonexistent: str = ..., /) -> int: ...
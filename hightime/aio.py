@@ -0,0 +1,191 @@
+"""Sleeping until exact deadlines in :mod:`asyncio`.
+
+:func:`asyncio.sleep` takes a float delay relative to now, so repeatedly sleeping for a period
+accumulates drift and rounding error. :func:`sleep_until` and :func:`ticker` instead compute
+each target as an exact :any:`hightime.datetime` and measure how late it was reached.
+
+Time is read from a :class:`Clock`, which is the monotonic clock calibrated against the
+system's wall clock once, so adjustments to the wall clock do not affect sleeping. Each wait
+sleeps in the event loop until ``spin`` before the target, then yields to the loop until the
+target is reached, which avoids the coarse granularity of the loop's timers without blocking
+other tasks. Pass a :class:`FakeClock` to run code without waiting in real time.
+
+Naive deadlines are treated as UTC, as elsewhere in hightime.
+
+>>> import asyncio
+>>> from hightime import datetime, timedelta
+>>> clock = FakeClock(datetime(2024, 1, 1))
+>>> async def main():
+...     return [deadline async for deadline, _ in ticker(
+...         datetime(2024, 1, 1), timedelta(microseconds=250), count=3, clock=clock)]
+>>> [str(dt) for dt in asyncio.run(main())]
+['2024-01-01 00:00:00', '2024-01-01 00:00:00.000250', '2024-01-01 00:00:00.000500']
+"""
+
+import asyncio
+import datetime as std_datetime
+import time
+
+import hightime
+from hightime._timedelta import _YS_PER_S
+
+__all__ = ["Clock", "FakeClock", "sleep_until", "ticker"]
+
+DEFAULT_SPIN = hightime.timedelta(milliseconds=2)
+
+_YS_PER_NS = 10**15
+_UTC = std_datetime.timezone.utc
+
+
+class Clock:
+    """The system's monotonic clock, calibrated against its wall clock.
+
+    The offset between the two clocks is measured when the clock is created and by
+    :meth:`calibrate`, so :meth:`now` advances steadily even if the wall clock is adjusted.
+    """
+
+    __slots__ = ("_offset_ns",)
+
+    def __init__(self):
+        """Initialize the clock and calibrate it."""
+        self.calibrate()
+
+    def calibrate(self):
+        """Measure the offset between the monotonic clock and the wall clock again."""
+        # Take the wall clock reading between two monotonic readings and use their midpoint.
+        before = time.monotonic_ns()
+        wall = time.time_ns()
+        after = time.monotonic_ns()
+        self._offset_ns = wall - (before + after) // 2
+
+    def now(self):
+        """Return the current time as an aware UTC :any:`hightime.datetime`."""
+        return hightime.datetime._from_epoch_ys(self._now_ys(), _UTC)
+
+    async def sleep(self, delay):
+        """Sleep in the event loop for about ``delay``, a timedelta."""
+        await asyncio.sleep(hightime.timedelta._as_ys(delay) / _YS_PER_S)
+
+    async def spin(self, remaining):
+        """Yield to the event loop once, while waiting out the last ``remaining`` of a sleep."""
+        await asyncio.sleep(0)
+
+    def _now_ys(self):
+        return (time.monotonic_ns() + self._offset_ns) * _YS_PER_NS
+
+
+class FakeClock:
+    """A clock that only advances when slept on or by :meth:`advance`, for testing.
+
+    Each :meth:`sleep` advances the clock by the delay plus ``overshoot``, to simulate timers
+    that wake late, and :meth:`spin` advances it by exactly the remaining time. Both yield to
+    the event loop once.
+    """
+
+    __slots__ = ("_now", "_overshoot")
+
+    def __init__(self, start, overshoot=hightime.timedelta()):
+        """Initialize the clock at ``start``, a datetime."""
+        self._now = start._to_epoch_ys()
+        self._overshoot = hightime.timedelta._as_ys(overshoot)
+
+    def advance(self, delay):
+        """Advance the clock by ``delay``, a timedelta."""
+        self._now += hightime.timedelta._as_ys(delay)
+
+    def now(self):
+        """Return the current time as an aware UTC :any:`hightime.datetime`."""
+        return hightime.datetime._from_epoch_ys(self._now, _UTC)
+
+    async def sleep(self, delay):
+        """Advance the clock by ``delay`` plus the overshoot, and yield to the event loop."""
+        self._now += max(hightime.timedelta._as_ys(delay), 0) + self._overshoot
+        await asyncio.sleep(0)
+
+    async def spin(self, remaining):
+        """Advance the clock by ``remaining``, and yield to the event loop."""
+        self._now += max(hightime.timedelta._as_ys(remaining), 0)
+        await asyncio.sleep(0)
+
+    def _now_ys(self):
+        return self._now
+
+
+_DEFAULT_CLOCK = None
+
+
+def _now_ys(clock):
+    now_ys = getattr(clock, "_now_ys", None)
+    if now_ys is not None:
+        return now_ys()
+    return clock.now()._to_epoch_ys()
+
+
+async def _sleep_until_ys(target, clock, spin):
+    from_ys = hightime.timedelta._from_ys
+    while True:
+        remaining = target - _now_ys(clock)
+        if remaining <= 0:
+            return -remaining
+        if remaining > spin:
+            await clock.sleep(from_ys(remaining - spin))
+        else:
+            await clock.spin(from_ys(remaining))
+
+
+def _resolve(clock, spin):
+    global _DEFAULT_CLOCK
+    if clock is None:
+        if _DEFAULT_CLOCK is None:
+            _DEFAULT_CLOCK = Clock()
+        clock = _DEFAULT_CLOCK
+    spin = hightime.timedelta._as_ys(spin)
+    if spin < 0:
+        raise ValueError("spin must not be negative", spin)
+    return clock, spin
+
+
+async def sleep_until(deadline, clock=None, spin=DEFAULT_SPIN):
+    """Sleep until ``deadline``, and return how late it was reached as a timedelta.
+
+    The task sleeps in the event loop until ``spin`` before ``deadline``, then yields to the
+    loop until ``deadline`` is reached. Returns immediately if ``deadline`` has passed.
+    ``clock`` is a :class:`Clock` or :class:`FakeClock`, or any object with the same
+    :meth:`~Clock.now`, :meth:`~Clock.sleep` and :meth:`~Clock.spin` methods; by default a
+    shared :class:`Clock` is used.
+    """
+    clock, spin = _resolve(clock, spin)
+    lateness = await _sleep_until_ys(deadline._to_epoch_ys(), clock, spin)
+    return hightime.timedelta._from_ys(lateness)
+
+
+async def ticker(start, period, count=None, skip_missed=False, clock=None, spin=DEFAULT_SPIN):
+    """Yield ``(deadline, lateness)`` at ``start``, ``start + period``, ``start + 2 * period``...
+
+    Each deadline is computed exactly from ``start``, so errors in waking up do not
+    accumulate. ``deadline`` is a :any:`hightime.datetime` in the time zone of ``start``, and
+    ``lateness`` is the :any:`hightime.timedelta` by which it was reached late. If ``count``
+    is not ``None``, stops before the deadline ``start + count * period``.
+
+    If a tick is yielded after a later deadline has already passed, the ticks for the passed
+    deadlines follow immediately, unless ``skip_missed`` is true, in which case they are
+    skipped. See :func:`sleep_until` for ``clock`` and ``spin``.
+    """
+    period_ys = hightime.timedelta._as_ys(period)
+    if period_ys <= 0:
+        raise ValueError("period must be positive", period)
+    clock, spin = _resolve(clock, spin)
+    from_epoch_ys = hightime.datetime._from_epoch_ys
+    from_ys = hightime.timedelta._from_ys
+    start_ys = start._to_epoch_ys()
+    tzinfo = start.tzinfo if start.utcoffset() is not None else None
+    index = 0
+    while count is None or index < count:
+        target = start_ys + index * period_ys
+        lateness = await _sleep_until_ys(target, clock, spin)
+        yield from_epoch_ys(target, tzinfo), from_ys(lateness)
+        index += 1
+        if skip_missed:
+            behind = _now_ys(clock) - (start_ys + index * period_ys)
+            if behind > 0:
+                index += -(-behind // period_ys)
@@ -0,0 +1,45 @@
+import datetime as std_datetime
+from typing import AsyncIterator, Optional, Protocol
+
+import hightime
+
+__all__ = ["Clock", "FakeClock", "sleep_until", "ticker"]
+
+DEFAULT_SPIN: hightime.timedelta
+
+class _Clock(Protocol):
+    def now(self) -> hightime.datetime: ...
+    async def sleep(self, delay: std_datetime.timedelta, /) -> None: ...
+    async def spin(self, remaining: std_datetime.timedelta, /) -> None: ...
+
+class Clock:
+    def __init__(self) -> None: ...
+    def _now_ys(self) -> int: ...
+    def calibrate(self) -> None: ...
+    def now(self) -> hightime.datetime: ...
+    async def sleep(self, delay: std_datetime.timedelta) -> None: ...
+    async def spin(self, remaining: std_datetime.timedelta) -> None: ...
+
+class FakeClock:
+    def __init__(
+        self, start: hightime.datetime, overshoot: std_datetime.timedelta = ...
+    ) -> None: ...
+    def _now_ys(self) -> int: ...
+    def advance(self, delay: std_datetime.timedelta) -> None: ...
+    def now(self) -> hightime.datetime: ...
+    async def sleep(self, delay: std_datetime.timedelta) -> None: ...
+    async def spin(self, remaining: std_datetime.timedelta) -> None: ...
+
+async def sleep_until(
+    deadline: hightime.datetime,
+    clock: Optional[_Clock] = ...,
+    spin: std_datetime.timedelta = ...,
+) -> hightime.timedelta: ...
+def ticker(
+    start: hightime.datetime,
+    period: std_datetime.timedelta,
+    count: Optional[int] = ...,
+    skip_missed: bool = ...,
+    clock: Optional[_Clock] = ...,
+    spin: std_datetime.timedelta = ...,
+) -> AsyncIterator[tuple[hightime.datetime, hightime.timedelta]]: ...
@@ -0,0 +1,319 @@
+"""Parallel parsing and formatting of large timestamp text files.
+
+Text is one timestamp per line. The input is split into chunks on line boundaries, and each
+chunk is parsed in a :any:`concurrent.futures.ProcessPoolExecutor` worker. Workers return packed
+:any:`hightime.DatetimeArray` records rather than pickled datetime objects, and the chunks are
+returned in input order. When the input is a file path, only the path and chunk offsets are
+sent to the workers, which map the file themselves.
+
+By default, lines are parsed as ISO 8601 timestamps of the form
+``YYYY-MM-DD[T ]HH:MM:SS[.fraction][Z|+HH:MM[:SS[.ffffff]]]`` with up to 24 fractional digits,
+which includes the output of :meth:`hightime.datetime.isoformat`. Aware values are converted
+to UTC and naive values are treated as UTC. Blank lines are skipped.
+
+>>> text = b"2024-01-01T00:00:00.123456789\\n2024-01-01 00:00:01+01:00\\n"
+>>> [str(dt) for dt in parse_array(text, max_workers=1)]
+['2024-01-01 00:00:00.123456789000000', '2023-12-31 23:00:01']
+"""
+
+import datetime as std_datetime
+import mmap
+import os
+import re
+
+import hightime
+from hightime._array import _RECORD_SIZE, DatetimeArray, _pack_ys
+from hightime._datetime import _UNIX_EPOCH_ORDINAL
+from hightime._timedelta import _YS_PER_DAY, _YS_PER_S, _YS_PER_US
+
+__all__ = ["format_lines", "line_chunks", "parse_array", "parse_chunks", "parse_packed"]
+
+DEFAULT_CHUNK_SIZE = 1 << 24
+DEFAULT_FORMAT_CHUNK_SIZE = 1 << 18
+
+_ISO_RE = re.compile(
+    rb"(\d{4})-(\d\d)-(\d\d)[Tt ](\d\d):(\d\d):(\d\d)(?:[.,](\d{1,24}))?"
+    rb"(?:([Zz])|([+-])(\d\d):?(\d\d)(?::?(\d\d)(?:\.(\d{6}))?)?)?"
+)
+_FRACTION_SCALES = [10 ** (24 - digits) for digits in range(25)]
+
+
+def _source_bytes(data):
+    # Return an object supporting find() and slicing for a bytes-like object.
+    if isinstance(data, (bytes, bytearray, mmap.mmap)):
+        return data
+    return memoryview(data).tobytes()
+
+
+def line_chunks(data, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Return ``(start, stop)`` offsets splitting ``data`` into chunks of whole lines.
+
+    Each chunk is at least ``chunk_size`` bytes long, except the last, and ends just after a
+    newline or at the end of ``data``.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive", chunk_size)
+    data = _source_bytes(data)
+    length = len(data)
+    chunks = []
+    start = 0
+    while start < length:
+        newline = data.find(b"\n", min(start + chunk_size, length) - 1)
+        stop = length if newline == -1 else newline + 1
+        chunks.append((start, stop))
+        start = stop
+    return chunks
+
+
+def _parse_iso_ys(lines):
+    # The date part is converted once per distinct date, since log lines usually share a few.
+    days = {}
+    match_iso = _ISO_RE.fullmatch
+    fraction_scales = _FRACTION_SCALES
+    values = []
+    append = values.append
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        match = match_iso(line)
+        if match is None:
+            text = line.decode("utf-8", "replace")
+            raise ValueError("invalid ISO 8601 timestamp: {!r}".format(text))
+        (
+            year,
+            month,
+            day,
+            hour,
+            minute,
+            second,
+            fraction,
+            _,
+            sign,
+            offset_hour,
+            offset_minute,
+            offset_second,
+            offset_microsecond,
+        ) = match.groups()
+        date = line[:10]
+        ys = days.get(date)
+        if ys is None:
+            try:
+                ordinal = std_datetime.date(int(year), int(month), int(day)).toordinal()
+            except ValueError as e:
+                raise ValueError("{}: {!r}".format(e, line.decode("ascii"))) from None
+            ys = days[date] = (ordinal - _UNIX_EPOCH_ORDINAL) * _YS_PER_DAY
+        hour = int(hour)
+        minute = int(minute)
+        second = int(second)
+        if hour > 23 or minute > 59 or second > 59:
+            raise ValueError("time is out of range: {!r}".format(line.decode("ascii")))
+        ys += (hour * 3600 + minute * 60 + second) * _YS_PER_S
+        if fraction:
+            ys += int(fraction) * fraction_scales[len(fraction)]
+        if sign:
+            offset = (int(offset_hour) * 60 + int(offset_minute)) * 60
+            if offset_second:
+                offset += int(offset_second)
+            if offset >= 86400 or int(offset_minute) > 59:
+                raise ValueError("UTC offset is out of range: {!r}".format(line.decode("ascii")))
+            offset = offset * _YS_PER_S
+            if offset_microsecond:
+                offset += int(offset_microsecond) * _YS_PER_US
+            ys = ys - offset if sign == b"+" else ys + offset
+        append(ys)
+    return values
+
+
+def _parse_format_ys(lines, format):
+    datetime = hightime.datetime
+    compiled = datetime._get_strptime(format)
+    parse = datetime._strptime
+    return [
+        parse(line.decode("utf-8"), format, compiled)._to_epoch_ys()
+        for line in map(bytes.strip, lines)
+        if line
+    ]
+
+
+def _parse_text(data, format):
+    # Return the packed records for a chunk of text.
+    lines = bytes(data).splitlines()
+    if format is None:
+        return _pack_ys(_parse_iso_ys(lines))
+    return _pack_ys(_parse_format_ys(lines, format))
+
+
+def _parse_file_range(path, start, stop, format):
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return _parse_text(data[start:stop], format)
+
+
+def _ordered_map(executor, function, calls, window):
+    # Like executor.map(), but with at most ``window`` calls in flight, so that a consumer that
+    # falls behind does not leave every chunk's result held in memory.
+    from collections import deque
+
+    pending = deque()
+    for args in calls:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(function, *args))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _run(function, calls, executor, max_workers):
+    # Keep two calls in flight per worker.
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    if executor is not None:
+        yield from _ordered_map(executor, function, calls, window)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        yield from _ordered_map(executor, function, calls, window)
+
+
+def parse_packed(
+    source, format=None, chunk_size=DEFAULT_CHUNK_SIZE, executor=None, max_workers=None
+):
+    """Parse the lines of ``source`` in parallel, yielding packed records for each chunk.
+
+    ``source`` is a file path or a bytes-like object of text. Each yielded ``bytes`` object
+    holds the timestamps of one chunk of about ``chunk_size`` bytes of text, in the
+    :any:`hightime.DatetimeArray` record layout.
+
+    ``format`` is a :meth:`hightime.datetime.strptime` format to parse each line with instead
+    of ISO 8601. ``executor`` is an existing :any:`concurrent.futures.ProcessPoolExecutor`; by
+    default a new one with ``max_workers`` workers is created and shut down. At most two chunks
+    per worker are in flight at a time, where the number of workers is ``max_workers`` (by
+    default :any:`os.cpu_count`, also when passing an ``executor``).
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                chunks = line_chunks(data, chunk_size)
+        calls = ((path, start, stop, format) for start, stop in chunks)
+        yield from _run(_parse_file_range, calls, executor, max_workers)
+    else:
+        data = _source_bytes(source)
+        chunks = line_chunks(data, chunk_size)
+        calls = ((data[start:stop], format) for start, stop in chunks)
+        yield from _run(_parse_text, calls, executor, max_workers)
+
+
+def parse_chunks(
+    source,
+    tzinfo=None,
+    format=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    executor=None,
+    max_workers=None,
+):
+    """Parse the lines of ``source`` in parallel, yielding a DatetimeArray for each chunk.
+
+    The arrays view the records returned by the workers without copying them. See
+    :func:`parse_packed` for the other arguments and :any:`hightime.DatetimeArray` for how
+    ``tzinfo`` is applied.
+    """
+    for packed in parse_packed(source, format, chunk_size, executor, max_workers):
+        yield DatetimeArray.frombuffer(packed, tzinfo)
+
+
+def parse_array(
+    source,
+    tzinfo=None,
+    format=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    executor=None,
+    max_workers=None,
+):
+    """Parse the lines of ``source`` in parallel into a single DatetimeArray.
+
+    See :func:`parse_chunks`.
+    """
+    packed = b"".join(parse_packed(source, format, chunk_size, executor, max_workers))
+    return DatetimeArray.frombuffer(packed, tzinfo)
+
+
+def _format_packed(packed, tzinfo, sep, timespec, format):
+    from_epoch_ys = hightime.datetime._from_epoch_ys
+    array = DatetimeArray.frombuffer(packed)
+    if format is None:
+        lines = [from_epoch_ys(ys, tzinfo).isoformat(sep, timespec) for ys in array._iter_ys()]
+    else:
+        lines = [from_epoch_ys(ys, tzinfo).strftime(format) for ys in array._iter_ys()]
+    lines.append("")
+    return "\n".join(lines).encode("utf-8")
+
+
+def _iter_packed(datetimes, chunk_size):
+    if isinstance(datetimes, DatetimeArray):
+        for start in range(0, len(datetimes), chunk_size):
+            yield datetimes[start : start + chunk_size].tobytes()
+        return
+
+    from itertools import islice
+
+    values = (dt._to_epoch_ys() for dt in datetimes)
+    while True:
+        packed = _pack_ys(islice(values, chunk_size))
+        if not packed:
+            return
+        yield packed
+
+
+def format_lines(
+    datetimes,
+    file,
+    tzinfo=None,
+    sep="T",
+    timespec="auto",
+    format=None,
+    chunk_size=DEFAULT_FORMAT_CHUNK_SIZE,
+    executor=None,
+    max_workers=None,
+):
+    """Format ``datetimes`` in parallel, writing one line per timestamp to ``file``.
+
+    ``datetimes`` is an iterable of :any:`hightime.datetime` or a :any:`hightime.DatetimeArray`,
+    and is sent to the workers in packed chunks of ``chunk_size`` timestamps. Values are written
+    in ``tzinfo``, or as naive UTC if ``tzinfo`` is ``None``, using
+    :meth:`hightime.datetime.isoformat` with ``sep`` and ``timespec``, or
+    :meth:`hightime.datetime.strftime` if ``format`` is given. ``file`` is a path or a binary
+    file object. Returns the number of timestamps written.
+
+    See :func:`parse_packed` for ``executor`` and ``max_workers``.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive", chunk_size)
+    if isinstance(file, (str, bytes, os.PathLike)):
+        with open(file, "wb") as output:
+            return format_lines(
+                datetimes,
+                output,
+                tzinfo,
+                sep,
+                timespec,
+                format,
+                chunk_size,
+                executor,
+                max_workers,
+            )
+
+    count = 0
+
+    def counted_calls():
+        nonlocal count
+        for packed in _iter_packed(datetimes, chunk_size):
+            count += len(packed) // _RECORD_SIZE
+            yield packed, tzinfo, sep, timespec, format
+
+    for text in _run(_format_packed, counted_calls(), executor, max_workers):
+        file.write(text)
+    return count
@@ -0,0 +1,52 @@
+import datetime as std_datetime
+from concurrent.futures import Executor
+from os import PathLike
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from _typeshed import ReadableBuffer
+
+import hightime
+
+__all__ = ["format_lines", "line_chunks", "parse_array", "parse_chunks", "parse_packed"]
+
+DEFAULT_CHUNK_SIZE: int
+DEFAULT_FORMAT_CHUNK_SIZE: int
+
+_Path = Union[str, bytes, PathLike[str], PathLike[bytes]]
+_Source = Union[str, PathLike[str], ReadableBuffer]
+
+def format_lines(
+    datetimes: Union[Iterable[hightime.datetime], hightime.DatetimeArray],
+    file: Union[_Path, IO[bytes]],
+    tzinfo: Optional[std_datetime.tzinfo] = ...,
+    sep: str = ...,
+    timespec: str = ...,
+    format: Optional[str] = ...,
+    chunk_size: int = ...,
+    executor: Optional[Executor] = ...,
+    max_workers: Optional[int] = ...,
+) -> int: ...
+def line_chunks(data: ReadableBuffer, chunk_size: int = ...) -> list[tuple[int, int]]: ...
+def parse_array(
+    source: _Source,
+    tzinfo: Optional[std_datetime.tzinfo] = ...,
+    format: Optional[str] = ...,
+    chunk_size: int = ...,
+    executor: Optional[Executor] = ...,
+    max_workers: Optional[int] = ...,
+) -> hightime.DatetimeArray: ...
+def parse_chunks(
+    source: _Source,
+    tzinfo: Optional[std_datetime.tzinfo] = ...,
+    format: Optional[str] = ...,
+    chunk_size: int = ...,
+    executor: Optional[Executor] = ...,
+    max_workers: Optional[int] = ...,
+) -> Iterator[hightime.DatetimeArray]: ...
+def parse_packed(
+    source: _Source,
+    format: Optional[str] = ...,
+    chunk_size: int = ...,
+    executor: Optional[Executor] = ...,
+    max_workers: Optional[int] = ...,
+) -> Iterator[bytes]: ...
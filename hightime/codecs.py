@@ -0,0 +1,405 @@
+"""Exact conversions between external timestamp formats and hightime types.
+
+Each codec converts a raw timestamp value to and from a :any:`hightime.datetime` (an instant)
+or a :any:`hightime.timedelta` (a count since the codec's epoch), and packs or unpacks whole
+buffers of fixed-size binary records.
+
+The built-in codecs are:
+
+* ``"unix_ns"``: :class:`UnixNanosecondsCodec`, a signed count of nanoseconds since
+  1970-01-01.
+* ``"ntp"``: :class:`NTPCodec`, an NTP 32.32 fixed-point timestamp since 1900-01-01.
+* ``"ptp"``: :class:`PTPCodec`, IEEE 1588 PTP 48-bit seconds and 32-bit nanoseconds since
+  1970-01-01 TAI.
+* ``"gps"``: :class:`GPSCodec`, a GPS week number and nanoseconds of the week since
+  1980-01-06 GPS time.
+* ``"lv"``: :class:`LabVIEWCodec`, a LabVIEW/NI PrecisionTimestamp (64.64 fixed point) since
+  1904-01-01.
+
+>>> codec = lookup("ntp")
+>>> codec.decode(0xE93C7F0080000000)
+hightime.datetime(2024, 1, 1, 0, 0, 0, 500000, tzinfo=datetime.timezone.utc)
+>>> hex(codec.encode(codec.decode(0xE93C7F0080000000)))
+'0xe93c7f0080000000'
+
+``"gps"`` and ``"ptp"`` count seconds in their own (GPS and TAI) time scales, which do not
+have leap seconds. Their datetimes are converted to and from UTC with the leap-second table in
+:mod:`hightime.timescales`, as with :any:`hightime.datetime.from_gps` and
+:any:`hightime.datetime.from_tai`. Timedeltas are plain counts since the epoch and are not
+adjusted.
+"""
+
+import abc
+import datetime as std_datetime
+import struct
+
+import hightime
+from hightime._datetime import _byte_view, _lv_from_timestamp_ys
+from hightime._timedelta import _YS_PER_S, _divide_and_round
+from hightime.timescales import (
+    _GPS_MINUS_TAI_YS,
+    _tai_to_utc_ys,
+    _tai_to_utc_ys_many,
+    _utc_to_tai_ys,
+    _utc_to_tai_ys_many,
+)
+
+__all__ = [
+    "Codec",
+    "GPSCodec",
+    "LabVIEWCodec",
+    "NTPCodec",
+    "PTPCodec",
+    "UnixNanosecondsCodec",
+    "lookup",
+    "names",
+    "register",
+]
+
+_YS_PER_NS = 10**15
+_UTC = std_datetime.timezone.utc
+
+# Time scale minus TAI, in yoctoseconds, for the time scales other than UTC.
+_SCALE_MINUS_TAI_YS = {"tai": 0, "gps": _GPS_MINUS_TAI_YS}
+
+
+def _epoch_ys(year, month, day):
+    return hightime.datetime(year, month, day, tzinfo=_UTC)._to_epoch_ys()
+
+
+class Codec(abc.ABC):
+    """Base class for timestamp codecs.
+
+    Subclasses set :attr:`name`, :attr:`epoch_ys` (the codec's epoch, in yoctoseconds since the
+    Unix epoch), :attr:`record` (a :any:`struct.Struct` for one packed value) and, if the values
+    are not UTC, :attr:`timescale` (``"tai"`` or ``"gps"``), and implement :meth:`to_ys` and
+    :meth:`from_ys`. Subclasses whose values are tuples should also override :meth:`_pack` and
+    :meth:`_unpack` if the packed field order differs from the value.
+    """
+
+    name = None
+    epoch_ys = 0
+    record = None
+    timescale = "utc"
+
+    # Methods to implement
+
+    @abc.abstractmethod
+    def to_ys(self, value):
+        """Return ``value`` as an exact number of yoctoseconds since the codec's epoch."""
+
+    @abc.abstractmethod
+    def from_ys(self, ys):
+        """Return the value for ``ys`` yoctoseconds since the codec's epoch."""
+
+    # Scalar conversions
+
+    def decode(self, value, tz=_UTC):
+        """Return the :any:`hightime.datetime` for ``value``.
+
+        The result is in ``tz``, which defaults to UTC. Passing ``tz=None`` returns a naive
+        datetime in local time, as with :any:`datetime.datetime.fromtimestamp`.
+        """
+        ys = self._to_utc_ys(self.epoch_ys + self.to_ys(value))
+        return hightime.datetime._from_timestamp_ys(ys, tz)
+
+    def encode(self, dt):
+        """Return the value for the :any:`hightime.datetime` ``dt``.
+
+        Naive datetimes are assumed to be in local time, as with
+        :any:`datetime.datetime.timestamp`.
+        """
+        return self.from_ys(self._from_utc_ys(dt._timestamp_ys()) - self.epoch_ys)
+
+    def decode_timedelta(self, value):
+        """Return ``value`` as a :any:`hightime.timedelta` since the codec's epoch."""
+        return hightime.timedelta._from_ys(self.to_ys(value))
+
+    def encode_timedelta(self, td):
+        """Return the value for a :any:`datetime.timedelta` ``td`` since the codec's epoch."""
+        return self.from_ys(hightime.timedelta._as_ys(td))
+
+    # Bulk conversions
+
+    def decode_many(self, buffer, tz=_UTC):
+        """Return a list of datetimes from a buffer of packed records.
+
+        ``buffer`` is any object supporting the buffer protocol, such as ``bytes`` or a NumPy
+        array. See :meth:`decode` for ``tz``.
+        """
+        from_timestamp_ys = hightime.datetime._from_timestamp_ys
+        epoch_ys = self.epoch_ys
+        to_ys = self.to_ys
+        unpack = self._unpack
+        values = self._to_utc_ys_many(
+            epoch_ys + to_ys(unpack(fields))
+            for fields in self.record.iter_unpack(_byte_view(buffer, self.record.size))
+        )
+        return [from_timestamp_ys(ys, tz) for ys in values]
+
+    def encode_many(self, datetimes, out=None):
+        """Pack the values for ``datetimes`` into records.
+
+        Returns ``bytes``, or writes into the writable buffer ``out`` and returns it.
+        """
+        epoch_ys = self.epoch_ys
+        from_ys = self.from_ys
+        values = self._from_utc_ys_many(dt._timestamp_ys() for dt in datetimes)
+        return self._pack_many([from_ys(ys - epoch_ys) for ys in values], out)
+
+    def decode_timedelta_many(self, buffer):
+        """Return a list of timedeltas since the codec's epoch from a buffer of packed records."""
+        from_ys = hightime.timedelta._from_ys
+        to_ys = self.to_ys
+        unpack = self._unpack
+        return [
+            from_ys(to_ys(unpack(fields)))
+            for fields in self.record.iter_unpack(_byte_view(buffer, self.record.size))
+        ]
+
+    def encode_timedelta_many(self, timedeltas, out=None):
+        """Pack the values for ``timedeltas`` since the codec's epoch into records.
+
+        Returns ``bytes``, or writes into the writable buffer ``out`` and returns it.
+        """
+        as_ys = hightime.timedelta._as_ys
+        from_ys = self.from_ys
+        return self._pack_many([from_ys(as_ys(td)) for td in timedeltas], out)
+
+    # Helper methods
+
+    def _to_utc_ys(self, ys):
+        # Convert yoctoseconds since the Unix epoch in the codec's time scale to UTC.
+        if self.timescale == "utc":
+            return ys
+        return _tai_to_utc_ys(ys - _SCALE_MINUS_TAI_YS[self.timescale])
+
+    def _from_utc_ys(self, ys):
+        if self.timescale == "utc":
+            return ys
+        return _utc_to_tai_ys(ys) + _SCALE_MINUS_TAI_YS[self.timescale]
+
+    def _to_utc_ys_many(self, values):
+        if self.timescale == "utc":
+            return values
+        offset = _SCALE_MINUS_TAI_YS[self.timescale]
+        return _tai_to_utc_ys_many(ys - offset for ys in values)
+
+    def _from_utc_ys_many(self, values):
+        if self.timescale == "utc":
+            return values
+        offset = _SCALE_MINUS_TAI_YS[self.timescale]
+        return [ys + offset for ys in _utc_to_tai_ys_many(values)]
+
+    def _unpack(self, fields):
+        # Convert a tuple of unpacked record fields to a value.
+        return fields if len(fields) > 1 else fields[0]
+
+    def _pack(self, value):
+        # Convert a value to a tuple of record fields.
+        return value if isinstance(value, tuple) else (value,)
+
+    def _pack_many(self, values, out):
+        size = self.record.size
+        if out is None:
+            result = None
+            out = bytearray(size * len(values))
+        else:
+            result = out
+        view = _byte_view(out, size)
+        if view.nbytes < size * len(values):
+            raise ValueError("out is too small for {} records".format(len(values)))
+
+        pack_into = self.record.pack_into
+        pack = self._pack
+        try:
+            for index, value in enumerate(values):
+                pack_into(view, index * size, *pack(value))
+        except struct.error as e:
+            raise OverflowError(str(e)) from None
+        return bytes(out) if result is None else result
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return "<{}.{} {!r}>".format(
+            self.__class__.__module__, self.__class__.__qualname__, self.name
+        )
+
+
+class UnixNanosecondsCodec(Codec):
+    """A signed 64-bit count of nanoseconds since 1970-01-01 00:00:00 UTC.
+
+    Values are ``int``. Packed records are little-endian ``int64``. Encoding rounds half to
+    even to the nearest nanosecond.
+    """
+
+    name = "unix_ns"
+    epoch_ys = 0
+    record = struct.Struct("<q")
+
+    def to_ys(self, value):
+        """Return ``value`` as an exact number of yoctoseconds since the codec's epoch."""
+        return value * _YS_PER_NS
+
+    def from_ys(self, ys):
+        """Return the value for ``ys`` yoctoseconds since the codec's epoch."""
+        return _divide_and_round(ys, _YS_PER_NS)
+
+
+class NTPCodec(Codec):
+    """An NTP 64-bit timestamp: 32.32 fixed-point seconds since 1900-01-01 00:00:00 UTC.
+
+    Values are the raw 64-bit ``int``, with the seconds in the upper 32 bits and the fraction (in
+    units of ``2**-32`` seconds) in the lower 32 bits. Only NTP era 0 (1900-2036) is supported.
+    Packed records are big-endian, as on the wire. Decoding rounds half to even to the nearest
+    yoctosecond, and encoding to the nearest ``2**-32`` seconds.
+    """
+
+    name = "ntp"
+    epoch_ys = _epoch_ys(1900, 1, 1)
+    record = struct.Struct(">Q")
+
+    def to_ys(self, value):
+        """Return ``value`` as an exact number of yoctoseconds since the codec's epoch."""
+        if not 0 <= value < 2**64:
+            raise ValueError("NTP timestamp must be in 0..2**64-1", value)
+        return _divide_and_round(value * _YS_PER_S, 2**32)
+
+    def from_ys(self, ys):
+        """Return the value for ``ys`` yoctoseconds since the codec's epoch."""
+        value = _divide_and_round(ys * 2**32, _YS_PER_S)
+        if not 0 <= value < 2**64:
+            raise OverflowError("datetime is outside NTP era 0")
+        return value
+
+
+class PTPCodec(Codec):
+    """An IEEE 1588 PTP timestamp: 48-bit seconds and 32-bit nanoseconds since 1970-01-01 TAI.
+
+    Values are ``(seconds, nanoseconds)`` tuples. Packed records are the 10-byte big-endian wire
+    format. Encoding rounds half to even to the nearest nanosecond.
+    """
+
+    name = "ptp"
+    epoch_ys = 0
+    record = struct.Struct(">HII")
+    timescale = "tai"
+
+    def to_ys(self, value):
+        """Return ``value`` as an exact number of yoctoseconds since the codec's epoch."""
+        seconds, nanoseconds = value
+        if not 0 <= seconds < 2**48:
+            raise ValueError("PTP seconds must be in 0..2**48-1", seconds)
+        if not 0 <= nanoseconds < 10**9:
+            raise ValueError("PTP nanoseconds must be in 0..999999999", nanoseconds)
+        return seconds * _YS_PER_S + nanoseconds * _YS_PER_NS
+
+    def from_ys(self, ys):
+        """Return the value for ``ys`` yoctoseconds since the codec's epoch."""
+        seconds, nanoseconds = divmod(_divide_and_round(ys, _YS_PER_NS), 10**9)
+        if not 0 <= seconds < 2**48:
+            raise OverflowError("datetime is outside the PTP range")
+        return seconds, nanoseconds
+
+    def _unpack(self, fields):
+        seconds_high, seconds_low, nanoseconds = fields
+        return (seconds_high << 32) | seconds_low, nanoseconds
+
+    def _pack(self, value):
+        seconds, nanoseconds = value
+        return seconds >> 32, seconds & 0xFFFFFFFF, nanoseconds
+
+
+class GPSCodec(Codec):
+    """A GPS week number and nanoseconds of the week since 1980-01-06 00:00:00 GPS time.
+
+    Values are ``(week, nanoseconds)`` tuples, where ``week`` is the full (not modulo 1024) week
+    number. Packed records are little-endian ``(uint32 week, int64 nanoseconds)``. Encoding
+    rounds half to even to the nearest nanosecond.
+    """
+
+    name = "gps"
+    epoch_ys = _epoch_ys(1980, 1, 6)
+    record = struct.Struct("<Iq")
+    timescale = "gps"
+
+    _NS_PER_WEEK = 7 * 24 * 60 * 60 * 10**9
+
+    def to_ys(self, value):
+        """Return ``value`` as an exact number of yoctoseconds since the codec's epoch."""
+        week, nanoseconds = value
+        if not 0 <= nanoseconds < self._NS_PER_WEEK:
+            raise ValueError("GPS nanoseconds of week must be in 0..604799999999999", nanoseconds)
+        return (week * self._NS_PER_WEEK + nanoseconds) * _YS_PER_NS
+
+    def from_ys(self, ys):
+        """Return the value for ``ys`` yoctoseconds since the codec's epoch."""
+        return divmod(_divide_and_round(ys, _YS_PER_NS), self._NS_PER_WEEK)
+
+
+class LabVIEWCodec(Codec):
+    """A LabVIEW/NI PrecisionTimestamp: 64.64 fixed-point seconds since 1904-01-01 UTC.
+
+    Values are ``(seconds, fraction)`` tuples. Packed records use the little-endian in-memory
+    layout ``(uint64 fraction, int64 seconds)``. See
+    :any:`hightime.datetime.from_lv_timestamp` for the rounding behavior.
+    """
+
+    name = "lv"
+    epoch_ys = _epoch_ys(1904, 1, 1)
+    record = struct.Struct("<Qq")
+
+    def to_ys(self, value):
+        """Return ``value`` as an exact number of yoctoseconds since the codec's epoch."""
+        seconds, fraction = value
+        if not 0 <= fraction < 2**64:
+            raise ValueError("fraction must be in 0..2**64-1", fraction)
+        return seconds * _YS_PER_S + _divide_and_round(fraction * _YS_PER_S, 2**64)
+
+    def from_ys(self, ys):
+        """Return the value for ``ys`` yoctoseconds since the codec's epoch."""
+        return _lv_from_timestamp_ys(self.epoch_ys + ys)
+
+    def _unpack(self, fields):
+        fraction, seconds = fields
+        return seconds, fraction
+
+    def _pack(self, value):
+        seconds, fraction = value
+        return fraction, seconds
+
+
+# Registry
+
+_REGISTRY = {}
+
+
+def register(codec, name=None):
+    """Register ``codec`` under ``name`` (default ``codec.name``), replacing any existing one."""
+    if not isinstance(codec, Codec):
+        raise TypeError("codec must be a Codec, not %s" % type(codec).__name__)
+    name = codec.name if name is None else name
+    if not isinstance(name, str):
+        raise TypeError("codec name must be str, not %s" % type(name).__name__)
+    _REGISTRY[name.lower()] = codec
+
+
+def lookup(name):
+    """Return the codec registered under ``name``.
+
+    Raises :any:`LookupError` if there is no such codec.
+    """
+    try:
+        return _REGISTRY[name.lower()]
+    except KeyError:
+        raise LookupError("unknown timestamp codec: {}".format(name)) from None
+
+
+def names():
+    """Return the names of the registered codecs."""
+    return sorted(_REGISTRY)
+
+
+for _codec in (UnixNanosecondsCodec(), NTPCodec(), PTPCodec(), GPSCodec(), LabVIEWCodec()):
+    register(_codec)
+del _codec
@@ -0,0 +1,92 @@
+import abc
+import datetime as std_datetime
+import struct
+from typing import Any, ClassVar, Generic, Iterable, Optional, TypeVar, overload
+
+from _typeshed import ReadableBuffer, WriteableBuffer
+
+import hightime
+
+__all__ = [
+    "Codec",
+    "GPSCodec",
+    "LabVIEWCodec",
+    "NTPCodec",
+    "PTPCodec",
+    "UnixNanosecondsCodec",
+    "lookup",
+    "names",
+    "register",
+]
+
+_T = TypeVar("_T")
+_WritableBufferT = TypeVar("_WritableBufferT", bound=WriteableBuffer)
+
+class Codec(abc.ABC, Generic[_T]):
+    name: ClassVar[Optional[str]]
+    epoch_ys: ClassVar[int]
+    record: ClassVar[struct.Struct]
+    timescale: ClassVar[str]
+    @abc.abstractmethod
+    def to_ys(self, value: _T, /) -> int: ...
+    @abc.abstractmethod
+    def from_ys(self, ys: int, /) -> _T: ...
+    def decode(
+        self, value: _T, /, tz: Optional[std_datetime.tzinfo] = ...
+    ) -> hightime.datetime: ...
+    def encode(self, dt: hightime.datetime, /) -> _T: ...
+    def decode_timedelta(self, value: _T, /) -> hightime.timedelta: ...
+    def encode_timedelta(self, td: std_datetime.timedelta, /) -> _T: ...
+    def decode_many(
+        self, buffer: ReadableBuffer, /, tz: Optional[std_datetime.tzinfo] = ...
+    ) -> list[hightime.datetime]: ...
+    @overload
+    def encode_many(self, datetimes: Iterable[hightime.datetime], /, out: None = ...) -> bytes: ...
+    @overload
+    def encode_many(
+        self, datetimes: Iterable[hightime.datetime], /, out: _WritableBufferT
+    ) -> _WritableBufferT: ...
+    def decode_timedelta_many(self, buffer: ReadableBuffer, /) -> list[hightime.timedelta]: ...
+    @overload
+    def encode_timedelta_many(
+        self, timedeltas: Iterable[std_datetime.timedelta], /, out: None = ...
+    ) -> bytes: ...
+    @overload
+    def encode_timedelta_many(
+        self, timedeltas: Iterable[std_datetime.timedelta], /, out: _WritableBufferT
+    ) -> _WritableBufferT: ...
+    def _to_utc_ys(self, ys: int, /) -> int: ...
+    def _from_utc_ys(self, ys: int, /) -> int: ...
+    def _to_utc_ys_many(self, values: Iterable[int], /) -> Iterable[int]: ...
+    def _from_utc_ys_many(self, values: Iterable[int], /) -> Iterable[int]: ...
+    def _unpack(self, fields: tuple[Any, ...], /) -> _T: ...
+    def _pack(self, value: _T, /) -> tuple[Any, ...]: ...
+    def _pack_many(self, values: list[_T], out: Optional[WriteableBuffer], /) -> Any: ...
+    def __repr__(self) -> str: ...
+
+class UnixNanosecondsCodec(Codec[int]):
+    def to_ys(self, value: int, /) -> int: ...
+    def from_ys(self, ys: int, /) -> int: ...
+
+class NTPCodec(Codec[int]):
+    def to_ys(self, value: int, /) -> int: ...
+    def from_ys(self, ys: int, /) -> int: ...
+
+class PTPCodec(Codec[tuple[int, int]]):
+    def to_ys(self, value: tuple[int, int], /) -> int: ...
+    def from_ys(self, ys: int, /) -> tuple[int, int]: ...
+
+class GPSCodec(Codec[tuple[int, int]]):
+    _NS_PER_WEEK: ClassVar[int]
+    def to_ys(self, value: tuple[int, int], /) -> int: ...
+    def from_ys(self, ys: int, /) -> tuple[int, int]: ...
+
+class LabVIEWCodec(Codec[tuple[int, int]]):
+    def to_ys(self, value: tuple[int, int], /) -> int: ...
+    def from_ys(self, ys: int, /) -> tuple[int, int]: ...
+
+_REGISTRY: dict[str, Codec[Any]]
+
+def register(codec: Codec[Any], name: Optional[str] = ...) -> None: ...
+def lookup(name: str) -> Codec[Any]: ...
+def names() -> list[str]: ...
@@ -0,0 +1,302 @@
+"""Exact, compact encoding of timestamp series.
+
+Timestamps are stored as yoctoseconds since the Unix epoch in UTC. Each one is encoded as the
+difference between its delta from the previous timestamp and the previous delta (the
+"delta-of-delta"), which is zero for regularly spaced samples. Each value is zig-zag encoded
+and written as an unsigned LEB128 varint, so a regularly sampled series takes about one byte
+per timestamp.
+
+The encoded stream is a sequence of independent blocks, which allows decoding in a streaming
+fashion and random access by block. Each block is:
+
+* a varint with the byte length of the rest of the block,
+* a varint with the number of timestamps ``n`` in the block,
+* the zig-zag varint of the first timestamp, and
+* ``n - 1`` zig-zag varints with the delta-of-delta of the remaining timestamps (the first
+  delta is taken relative to a previous delta of zero).
+
+Blocks can be concatenated, so encoded streams can be appended to.
+
+>>> from hightime import datetime, timedelta
+>>> times = [datetime(2024, 1, 1) + timedelta(milliseconds=i) for i in range(1000)]
+>>> data = b"".join(encode(times))
+>>> len(data)
+1029
+>>> list(decode(data)) == times
+True
+"""
+
+from bisect import bisect_right
+from itertools import islice
+
+import hightime
+from hightime._array import DatetimeArray
+from hightime._datetime import _byte_view
+
+__all__ = [
+    "CompressedDatetimes",
+    "decode",
+    "decode_array",
+    "encode",
+    "encode_bytes",
+]
+
+DEFAULT_BLOCK_SIZE = 4096
+
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+
+
+def _write_varint(out, value):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(value):
+    # 0, -1, 1, -2, 2, ... -> 0, 1, 2, 3, 4, ...
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _encode_block(values):
+    payload = bytearray()
+    write_varint = _write_varint
+    zigzag = _zigzag
+    write_varint(payload, len(values))
+    previous = values[0]
+    write_varint(payload, zigzag(previous))
+    previous_delta = 0
+    for value in islice(values, 1, None):
+        delta = value - previous
+        write_varint(payload, zigzag(delta - previous_delta))
+        previous = value
+        previous_delta = delta
+    header = bytearray()
+    write_varint(header, len(payload))
+    return bytes(header + payload)
+
+
+def _decode_block(payload):
+    # Return the yoctosecond values in one block payload.
+    read_varint = _read_varint
+    unzigzag = _unzigzag
+    try:
+        count, pos = read_varint(payload, 0)
+        if not count:
+            raise ValueError("empty block")
+        value, pos = read_varint(payload, pos)
+        previous = unzigzag(value)
+        values = [previous]
+        append = values.append
+        previous_delta = 0
+        for _ in range(count - 1):
+            value, pos = read_varint(payload, pos)
+            previous_delta += unzigzag(value)
+            previous += previous_delta
+            append(previous)
+    except IndexError:
+        raise ValueError("truncated block") from None
+    if pos != len(payload):
+        raise ValueError("block length does not match its contents")
+    return values
+
+
+def _iter_ys(datetimes):
+    if isinstance(datetimes, DatetimeArray):
+        return datetimes._iter_ys()
+    return (dt._to_epoch_ys() for dt in datetimes)
+
+
+def _iter_payloads(data):
+    # Yield the payload of each block from a bytes-like object or an iterable of chunks.
+    chunks = (data,) if isinstance(data, _BYTES_TYPES) else data
+    buffer = bytearray()
+    pos = 0
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            try:
+                length, start = _read_varint(buffer, pos)
+            except IndexError:
+                break
+            end = start + length
+            if end > len(buffer):
+                break
+            yield bytes(buffer[start:end])
+            pos = end
+        del buffer[:pos]
+        pos = 0
+    if buffer:
+        raise ValueError("truncated block")
+
+
+def encode(datetimes, block_size=DEFAULT_BLOCK_SIZE):
+    """Encode ``datetimes``, yielding one ``bytes`` object per block.
+
+    ``datetimes`` is any iterable of :any:`hightime.datetime`, and is consumed lazily. Aware
+    values are converted to UTC and naive values are treated as UTC. A
+    :any:`hightime.DatetimeArray` is encoded directly from its packed values without creating
+    datetime objects.
+
+    Every timestamp is stored exactly. Sorted, regularly spaced series compress best, but any
+    order is allowed.
+    """
+    if block_size < 1:
+        raise ValueError("block_size must be positive", block_size)
+    values = _iter_ys(datetimes)
+    while True:
+        block = list(islice(values, block_size))
+        if not block:
+            return
+        yield _encode_block(block)
+
+
+def encode_bytes(datetimes, block_size=DEFAULT_BLOCK_SIZE):
+    """Encode ``datetimes`` and return the whole stream as ``bytes``. See :func:`encode`."""
+    return b"".join(encode(datetimes, block_size))
+
+
+def decode(data, tzinfo=None):
+    """Decode an encoded stream, yielding :any:`hightime.datetime` values.
+
+    ``data`` is a bytes-like object or an iterable of bytes-like chunks, which may be split
+    anywhere, such as a file opened in binary mode or a network stream. Values are returned in
+    ``tzinfo``, or as naive UTC datetimes if ``tzinfo`` is ``None``.
+
+    Raises :any:`ValueError` if the stream ends in the middle of a block.
+    """
+    from_epoch_ys = hightime.datetime._from_epoch_ys
+    for payload in _iter_payloads(data):
+        for ys in _decode_block(payload):
+            yield from_epoch_ys(ys, tzinfo)
+
+
+def decode_array(data, tzinfo=None):
+    """Decode an encoded stream into a :any:`hightime.DatetimeArray`. See :func:`decode`.
+
+    This does not create a datetime object per value.
+    """
+    return DatetimeArray._from_ys(
+        (ys for payload in _iter_payloads(data) for ys in _decode_block(payload)), tzinfo
+    )
+
+
+class CompressedDatetimes:
+    """Random access to an encoded stream held in memory.
+
+    Only the block holding a requested element is decoded. The most recently decoded block is
+    cached, so nearby accesses are cheap.
+
+    >>> from hightime import datetime, timedelta
+    >>> times = [datetime(2024, 1, 1) + timedelta(seconds=i) for i in range(10)]
+    >>> compressed = CompressedDatetimes(encode_bytes(times, block_size=4))
+    >>> len(compressed), compressed.block_count
+    (10, 3)
+    >>> compressed[-1]
+    hightime.datetime(2024, 1, 1, 0, 0, 9)
+    """
+
+    __slots__ = ("_data", "_offsets", "_starts", "_tzinfo", "_cached_index", "_cached_values")
+
+    def __init__(self, data, tzinfo=None):
+        """Index the blocks in the bytes-like object ``data``."""
+        self._data = _byte_view(data, 1)
+        self._tzinfo = tzinfo
+        self._offsets = []
+        self._starts = [0]
+        pos = 0
+        try:
+            while pos < len(self._data):
+                length, start = _read_varint(self._data, pos)
+                count, _ = _read_varint(self._data, start)
+                if start + length > len(self._data):
+                    raise IndexError
+                self._offsets.append((start, start + length))
+                self._starts.append(self._starts[-1] + count)
+                pos = start + length
+        except IndexError:
+            raise ValueError("truncated block") from None
+        self._cached_index = None
+        self._cached_values = None
+
+    # Public properties
+
+    @property
+    def block_count(self):
+        """The number of blocks."""
+        return len(self._offsets)
+
+    @property
+    def tzinfo(self):
+        """The time zone the elements are returned in."""
+        return self._tzinfo
+
+    # Public methods
+
+    def block(self, index):
+        """Return block ``index`` as a :any:`hightime.DatetimeArray`."""
+        return DatetimeArray._from_ys(self._block_ys(index), self._tzinfo)
+
+    def to_array(self):
+        """Return all the elements as a :any:`hightime.DatetimeArray`."""
+        return DatetimeArray._from_ys(
+            (ys for index in range(len(self._offsets)) for ys in self._block_ys(index)),
+            self._tzinfo,
+        )
+
+    # Sequence protocol
+
+    def __len__(self):
+        """Return len(self)."""
+        return self._starts[-1]
+
+    def __getitem__(self, index):
+        """Return self[index]. Slices return a :any:`hightime.DatetimeArray`."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            return DatetimeArray._from_ys(
+                (self._ys(i) for i in range(start, stop, step)), self._tzinfo
+            )
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("CompressedDatetimes index out of range")
+        return hightime.datetime._from_epoch_ys(self._ys(index), self._tzinfo)
+
+    def __iter__(self):
+        """Implement iter(self)."""
+        from_epoch_ys = hightime.datetime._from_epoch_ys
+        tzinfo = self._tzinfo
+        for index in range(len(self._offsets)):
+            for ys in self._block_ys(index):
+                yield from_epoch_ys(ys, tzinfo)
+
+    # Helper methods
+
+    def _block_ys(self, index):
+        if index != self._cached_index:
+            start, end = self._offsets[index]
+            self._cached_values = _decode_block(self._data[start:end])
+            self._cached_index = index
+        return self._cached_values
+
+    def _ys(self, index):
+        block = bisect_right(self._starts, index) - 1
+        return self._block_ys(block)[index - self._starts[block]]
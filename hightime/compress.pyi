@@ -0,0 +1,46 @@
+import datetime as std_datetime
+from typing import Iterable, Iterator, Optional, Union, overload
+
+from _typeshed import ReadableBuffer
+
+import hightime
+
+__all__ = [
+    "CompressedDatetimes",
+    "decode",
+    "decode_array",
+    "encode",
+    "encode_bytes",
+]
+
+DEFAULT_BLOCK_SIZE: int
+
+_Data = Union[ReadableBuffer, Iterable[ReadableBuffer]]
+
+def encode(datetimes: Iterable[hightime.datetime], block_size: int = ...) -> Iterator[bytes]: ...
+def encode_bytes(datetimes: Iterable[hightime.datetime], block_size: int = ...) -> bytes: ...
+def decode(
+    data: _Data, tzinfo: Optional[std_datetime.tzinfo] = ...
+) -> Iterator[hightime.datetime]: ...
+def decode_array(
+    data: _Data, tzinfo: Optional[std_datetime.tzinfo] = ...
+) -> hightime.DatetimeArray: ...
+
+class CompressedDatetimes:
+    def __init__(
+        self, data: ReadableBuffer, tzinfo: Optional[std_datetime.tzinfo] = ...
+    ) -> None: ...
+    @overload
+    def __getitem__(self, index: int, /) -> hightime.datetime: ...
+    @overload
+    def __getitem__(self, index: slice, /) -> hightime.DatetimeArray: ...
+    def __iter__(self) -> Iterator[hightime.datetime]: ...
+    def __len__(self) -> int: ...
+    def _block_ys(self, index: int, /) -> list[int]: ...
+    def _ys(self, index: int, /) -> int: ...
+    def block(self, index: int) -> hightime.DatetimeArray: ...
+    @property
+    def block_count(self) -> int: ...
+    def to_array(self) -> hightime.DatetimeArray: ...
+    @property
+    def tzinfo(self) -> Optional[std_datetime.tzinfo]: ...
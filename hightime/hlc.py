@@ -0,0 +1,127 @@
+"""Hybrid logical clock (HLC) timestamps.
+
+A hybrid logical clock timestamp is a physical time plus a logical counter. It orders events
+causally across nodes: a timestamp created after receiving another is always greater than it,
+and otherwise stays close to the physical clock. See Kulkarni et al., "Logical Physical Clocks
+and Consistent Snapshots in Globally Distributed Databases".
+
+Here a timestamp is a naive UTC :any:`hightime.datetime` whose physical time is in whole
+nanoseconds, and whose sub-nanosecond fields hold the counter. Timestamps are therefore
+ordinary datetimes, compare and sort as expected, and are unique per clock. Internally the
+clock works on integer yoctoseconds, and :meth:`Clock.now_key` and :meth:`Clock.update_key`
+work on encoded timestamps without creating datetime objects.
+
+>>> readings = iter([1_700_000_000_000_000_000] * 3)
+>>> clock = Clock(readings.__next__)
+>>> first = clock.now()
+>>> second = clock.update(first + hightime.timedelta(nanoseconds=5))
+>>> split(first), split(second), split(clock.now())
+((1700000000000000000, 0), (1700000000000000005, 1), (1700000000000000005, 2))
+"""
+
+import time
+
+import hightime
+from hightime._timedelta import _decode_sort_key, _encode_sort_key
+
+__all__ = ["Clock", "decode", "encode", "split"]
+
+_YS_PER_NS = 10**15
+
+
+def encode(timestamp):
+    """Return ``timestamp`` as 16 bytes that sort in the same order as the timestamps.
+
+    This is :meth:`hightime.datetime.to_sort_key`.
+    """
+    return timestamp.to_sort_key()
+
+
+def decode(key):
+    """Return the timestamp encoded by :func:`encode`."""
+    return hightime.datetime._from_epoch_ys(_decode_sort_key(key))
+
+
+def split(timestamp):
+    """Return ``(nanoseconds, counter)`` for ``timestamp``.
+
+    ``nanoseconds`` is the physical time in nanoseconds since the Unix epoch, and ``counter``
+    is the logical counter.
+    """
+    return divmod(timestamp._to_epoch_ys(), _YS_PER_NS)
+
+
+class Clock:
+    """A hybrid logical clock.
+
+    ``clock`` is a function returning the physical time as integer nanoseconds since the Unix
+    epoch in UTC. If ``max_offset`` is not ``None``, :meth:`update` raises :any:`ValueError`
+    for a timestamp more than ``max_offset`` ahead of the physical clock, rather than letting a
+    node with a bad clock push this clock forward. A clock is safe to share between threads.
+    """
+
+    __slots__ = ("_lock", "_last", "_clock", "_max_offset")
+
+    def __init__(self, clock=time.time_ns, max_offset=None):
+        """Initialize the clock."""
+        # The threading module imports collections, so it is imported on first use.
+        import threading
+
+        self._lock = threading.Lock()
+        self._last = None
+        self._clock = clock
+        self._max_offset = None if max_offset is None else hightime.timedelta._as_ys(max_offset)
+
+    # Public properties
+
+    @property
+    def last(self):
+        """The most recent timestamp, or ``None`` if there is none."""
+        last = self._last
+        return None if last is None else hightime.datetime._from_epoch_ys(last)
+
+    # Public methods
+
+    def now(self):
+        """Return a timestamp for a local or send event."""
+        return hightime.datetime._from_epoch_ys(self._tick_ys(None))
+
+    def update(self, received):
+        """Return a timestamp for receiving a message stamped ``received``.
+
+        The result is greater than both ``received`` and every earlier timestamp of this clock.
+        """
+        return hightime.datetime._from_epoch_ys(self._tick_ys(received._to_epoch_ys()))
+
+    def now_key(self):
+        """Return :meth:`now` encoded as with :func:`encode`."""
+        return _encode_sort_key(self._tick_ys(None))
+
+    def update_key(self, key):
+        """Return :meth:`update` for the encoded timestamp ``key``, encoded."""
+        return _encode_sort_key(self._tick_ys(_decode_sort_key(key)))
+
+    # Helper methods
+
+    def _tick_ys(self, received):
+        # The physical time has a zero counter, so it wins only when its nanosecond is later
+        # than that of every timestamp seen; otherwise the latest timestamp's counter is
+        # incremented.
+        physical = self._clock() * _YS_PER_NS
+        if (
+            received is not None
+            and self._max_offset is not None
+            and received - physical > self._max_offset
+        ):
+            raise ValueError(
+                "received timestamp is {} ahead of the physical clock".format(
+                    hightime.timedelta._from_ys(received - physical)
+                )
+            )
+        with self._lock:
+            latest = self._last
+            if received is not None and (latest is None or received > latest):
+                latest = received
+            ys = physical if latest is None or physical > latest else latest + 1
+            self._last = ys
+        return ys
@@ -0,0 +1,26 @@
+import datetime as std_datetime
+from typing import Callable, Optional
+
+from _typeshed import ReadableBuffer
+
+import hightime
+
+__all__ = ["Clock", "decode", "encode", "split"]
+
+def decode(key: ReadableBuffer) -> hightime.datetime: ...
+def encode(timestamp: hightime.datetime) -> bytes: ...
+def split(timestamp: hightime.datetime) -> tuple[int, int]: ...
+
+class Clock:
+    def __init__(
+        self,
+        clock: Callable[[], int] = ...,
+        max_offset: Optional[std_datetime.timedelta] = ...,
+    ) -> None: ...
+    def _tick_ys(self, received: Optional[int], /) -> int: ...
+    @property
+    def last(self) -> Optional[hightime.datetime]: ...
+    def now(self) -> hightime.datetime: ...
+    def now_key(self) -> bytes: ...
+    def update(self, received: hightime.datetime) -> hightime.datetime: ...
+    def update_key(self, key: ReadableBuffer) -> bytes: ...
@@ -0,0 +1,277 @@
+"""Memory-mapped timestamp column files.
+
+A column file holds a sequence of exact timestamps as fixed-width records after a small
+header, so it can be appended to and read by index or time range without loading the whole
+file:
+
+* The header is the magic ``b"HIGHTIME"``, then little-endian ``uint16`` format version (1),
+  ``uint16`` header size, ``int128`` epoch and ``int128`` unit (both in yoctoseconds), and
+  ``uint16`` length of the time zone string, then the UTF-8 time zone string, zero-padded to a
+  multiple of 16 bytes.
+* Each record is a little-endian ``int128`` count of units since the epoch, in UTC. Version 1
+  files always use the Unix epoch and a unit of one yoctosecond, which is the
+  :any:`hightime.DatetimeArray` layout, so the records can be viewed without copying.
+* The time zone string is empty for naive timestamps, ``"fixed:<microseconds>"`` for a fixed
+  UTC offset, or ``"zoneinfo:<key>"`` for a :any:`zoneinfo.ZoneInfo` zone.
+
+>>> import os, tempfile
+>>> from hightime import datetime
+>>> path = os.path.join(tempfile.mkdtemp(), "times.htc")
+>>> with TimestampWriter(path) as writer:
+...     writer.extend(datetime(2024, 1, 1, second=i) for i in range(60))
+>>> with TimestampReader(path) as reader:
+...     window = reader.time_slice(datetime(2024, 1, 1, 0, 0, 10), datetime(2024, 1, 1, 0, 0, 20))
+...     print(len(reader), reader[-1], len(window), window[0])
+60 2024-01-01 00:00:59 10 2024-01-01 00:00:10
+"""
+
+import datetime as std_datetime
+import mmap
+import os
+import struct
+
+from hightime._array import _RECORD_SIZE, DatetimeArray, _pack_ys
+
+__all__ = ["TimestampReader", "TimestampWriter"]
+
+_MAGIC = b"HIGHTIME"
+_VERSION = 1
+_EPOCH_YS = 0
+_UNIT_YS = 1
+_HEADER = struct.Struct("<8sHH16s16sH")
+
+
+def _encode_tzinfo(tzinfo):
+    if tzinfo is None:
+        return ""
+    if isinstance(tzinfo, std_datetime.timezone):
+        offset = tzinfo.utcoffset(None)
+        return "fixed:{}".format(offset // std_datetime.timedelta(microseconds=1))
+    key = getattr(tzinfo, "key", None)
+    if type(tzinfo).__module__ == "zoneinfo" and isinstance(key, str):
+        return "zoneinfo:" + key
+    raise ValueError("cannot store time zone {!r}".format(tzinfo))
+
+
+def _decode_tzinfo(text):
+    if not text:
+        return None
+    kind, _, value = text.partition(":")
+    if kind == "fixed":
+        microseconds = int(value)
+        if microseconds == 0:
+            return std_datetime.timezone.utc
+        return std_datetime.timezone(std_datetime.timedelta(microseconds=microseconds))
+    if kind == "zoneinfo":
+        import zoneinfo
+
+        return zoneinfo.ZoneInfo(value)
+    raise ValueError("unsupported time zone in header: {!r}".format(text))
+
+
+def _pack_header(tzinfo):
+    tz_bytes = _encode_tzinfo(tzinfo).encode("utf-8")
+    size = _HEADER.size + len(tz_bytes)
+    size += -size % _RECORD_SIZE
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        size,
+        _EPOCH_YS.to_bytes(16, "little", signed=True),
+        _UNIT_YS.to_bytes(16, "little", signed=True),
+        len(tz_bytes),
+    )
+    return (header + tz_bytes).ljust(size, b"\0")
+
+
+def _unpack_header(data):
+    # Validate the fixed part of a header and return (header size, time zone string length).
+    if len(data) < _HEADER.size:
+        raise ValueError("not a hightime column file: header is truncated")
+    magic, version, size, epoch, unit, tz_length = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("not a hightime column file")
+    if version != _VERSION:
+        raise ValueError("unsupported column file version: {}".format(version))
+    if (
+        int.from_bytes(epoch, "little", signed=True) != _EPOCH_YS
+        or int.from_bytes(unit, "little", signed=True) != _UNIT_YS
+    ):
+        raise ValueError("unsupported column file epoch or unit")
+    if size < _HEADER.size + tz_length:
+        raise ValueError("not a hightime column file: header is truncated")
+    return size, tz_length
+
+
+def _read_header(file):
+    # Return (header size, tzinfo) for an open column file positioned at the start.
+    size, tz_length = _unpack_header(file.read(_HEADER.size))
+    tz_bytes = file.read(tz_length)
+    if len(tz_bytes) < tz_length:
+        raise ValueError("not a hightime column file: header is truncated")
+    return size, _decode_tzinfo(tz_bytes.decode("utf-8"))
+
+
+class TimestampWriter:
+    """Appends timestamps to a column file.
+
+    If ``path`` does not exist, it is created with a header for ``tzinfo``. If it does exist,
+    new timestamps are appended to it; ``tzinfo`` must then be omitted or match the file's. A
+    partial record left at the end of the file by an interrupted write is discarded.
+
+    Aware values are converted to UTC and naive values are treated as UTC. Writes are buffered
+    until :meth:`flush` or :meth:`close`.
+    """
+
+    __slots__ = ("_file", "_tzinfo")
+
+    def __init__(self, path, tzinfo=None):
+        """Open ``path`` for appending."""
+        # Encode the header first, so an unsupported tzinfo does not leave an empty file behind.
+        header = _pack_header(tzinfo)
+        try:
+            file = open(path, "r+b")
+        except FileNotFoundError:
+            file = open(path, "x+b")
+        try:
+            file.seek(0, os.SEEK_END)
+            if file.tell() == 0:
+                file.write(header)
+                self._tzinfo = tzinfo
+            else:
+                file.seek(0)
+                header_size, file_tzinfo = _read_header(file)
+                if tzinfo is not None and tzinfo != file_tzinfo:
+                    raise ValueError(
+                        "tzinfo {!r} does not match the file's {!r}".format(tzinfo, file_tzinfo)
+                    )
+                self._tzinfo = file_tzinfo
+                end = file.seek(0, os.SEEK_END)
+                partial = (end - header_size) % _RECORD_SIZE
+                if partial:
+                    file.truncate(end - partial)
+                file.seek(0, os.SEEK_END)
+        except BaseException:
+            file.close()
+            raise
+        self._file = file
+
+    # Public properties
+
+    @property
+    def tzinfo(self):
+        """The time zone recorded in the file."""
+        return self._tzinfo
+
+    # Public methods
+
+    def append(self, dt):
+        """Append one timestamp."""
+        self._file.write(_pack_ys((dt._to_epoch_ys(),)))
+
+    def extend(self, datetimes):
+        """Append timestamps from an iterable or a :any:`hightime.DatetimeArray`."""
+        if isinstance(datetimes, DatetimeArray):
+            self._file.write(datetimes.tobytes())
+        else:
+            self._file.write(_pack_ys(dt._to_epoch_ys() for dt in datetimes))
+
+    def flush(self):
+        """Flush buffered timestamps to the file."""
+        self._file.flush()
+
+    def close(self):
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self):
+        """Return self."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the file."""
+        self.close()
+
+
+class TimestampReader:
+    """Reads a column file through a read-only memory map.
+
+    :attr:`array` is a :any:`hightime.DatetimeArray` view of the records that does not copy
+    them; :any:`hightime.datetime` objects are only created for the elements accessed. The
+    reader sees the records present when it was opened.
+
+    Arrays obtained from the reader keep the mapping alive, so they stay valid after
+    :meth:`close`; the mapping is released when the last of them is.
+    """
+
+    __slots__ = ("_mmap", "_array")
+
+    def __init__(self, path):
+        """Open and map ``path``."""
+        with open(path, "rb") as file:
+            header_size, tzinfo = _read_header(file)
+            file.seek(0, os.SEEK_END)
+            count = (file.tell() - header_size) // _RECORD_SIZE
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)[header_size : header_size + count * _RECORD_SIZE]
+        self._array = DatetimeArray.frombuffer(view, tzinfo)
+
+    # Public properties
+
+    @property
+    def array(self):
+        """The records as a :any:`hightime.DatetimeArray` view."""
+        return self._array
+
+    @property
+    def tzinfo(self):
+        """The time zone recorded in the file."""
+        return self._array.tzinfo
+
+    # Public methods
+
+    def searchsorted(self, value, side="left"):
+        """Return :meth:`hightime.DatetimeArray.searchsorted` for a sorted file."""
+        return self._array.searchsorted(value, side)
+
+    def time_slice(self, start=None, stop=None):
+        """Return a view of the timestamps ``t`` with ``start <= t < stop`` in a sorted file.
+
+        Either bound may be ``None`` to leave that side open.
+        """
+        array = self._array
+        low = 0 if start is None else array.searchsorted(start)
+        high = len(array) if stop is None else array.searchsorted(stop)
+        return array[low : max(low, high)]
+
+    def close(self):
+        """Close the reader."""
+        self._array = DatetimeArray.frombuffer(b"", self._array.tzinfo)
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Arrays handed out earlier still reference the mapping; it is unmapped when they
+            # are released.
+            pass
+
+    # Sequence protocol
+
+    def __len__(self):
+        """Return len(self)."""
+        return len(self._array)
+
+    def __getitem__(self, index):
+        """Return self[index]. Slices return a :any:`hightime.DatetimeArray` view."""
+        return self._array[index]
+
+    def __iter__(self):
+        """Implement iter(self)."""
+        return iter(self._array)
+
+    def __enter__(self):
+        """Return self."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the reader."""
+        self.close()
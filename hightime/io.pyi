@@ -0,0 +1,53 @@
+import datetime as std_datetime
+from os import PathLike
+from types import TracebackType
+from typing import Iterable, Iterator, Literal, Optional, Union, overload
+
+import hightime
+
+__all__ = ["TimestampReader", "TimestampWriter"]
+
+_Path = Union[str, bytes, PathLike[str], PathLike[bytes]]
+
+class TimestampWriter:
+    def __init__(self, path: _Path, tzinfo: Optional[std_datetime.tzinfo] = ...) -> None: ...
+    def __enter__(self) -> TimestampWriter: ...
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None: ...
+    def append(self, dt: hightime.datetime) -> None: ...
+    def close(self) -> None: ...
+    def extend(self, datetimes: Iterable[hightime.datetime]) -> None: ...
+    def flush(self) -> None: ...
+    @property
+    def tzinfo(self) -> Optional[std_datetime.tzinfo]: ...
+
+class TimestampReader:
+    def __init__(self, path: _Path) -> None: ...
+    def __enter__(self) -> TimestampReader: ...
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None: ...
+    @overload
+    def __getitem__(self, index: int, /) -> hightime.datetime: ...
+    @overload
+    def __getitem__(self, index: slice, /) -> hightime.DatetimeArray: ...
+    def __iter__(self) -> Iterator[hightime.datetime]: ...
+    def __len__(self) -> int: ...
+    @property
+    def array(self) -> hightime.DatetimeArray: ...
+    def close(self) -> None: ...
+    def searchsorted(
+        self, value: hightime.datetime, side: Literal["left", "right"] = ...
+    ) -> int: ...
+    def time_slice(
+        self, start: Optional[hightime.datetime] = ..., stop: Optional[hightime.datetime] = ...
+    ) -> hightime.DatetimeArray: ...
+    @property
+    def tzinfo(self) -> Optional[std_datetime.tzinfo]: ...
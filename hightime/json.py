@@ -0,0 +1,298 @@
+"""JSON encoding and decoding of hightime values, using only the standard library.
+
+Each function takes a ``style`` selecting the representation:
+
+* ``"iso"`` (the default): datetimes as :meth:`hightime.datetime.isoformat` strings and
+  timedeltas as :meth:`hightime.timedelta.isoformat` ISO 8601 duration strings. Exact.
+* ``"ns"``: integer nanoseconds, since the Unix epoch in UTC for datetimes. Values are rounded
+  half to even to the nearest nanosecond.
+* ``"lv"``: LabVIEW 64.64 fixed point ``[seconds, fraction]`` pairs, where ``fraction`` is in
+  units of ``2**-64`` seconds. Datetimes count from 1904-01-01 00:00:00 UTC. Values are rounded
+  half to even to the nearest ``2**-64`` seconds.
+
+For the ``"ns"`` and ``"lv"`` styles, aware datetimes are converted to UTC and naive datetimes
+are treated as UTC. Since numbers do not identify themselves as timestamps, decoding them
+requires naming the keys that hold them.
+
+>>> import json
+>>> from hightime import datetime, timedelta
+>>> text = json.dumps({"t": datetime(2024, 1, 1, femtosecond=5), "dt": timedelta(seconds=1)},
+...                   default=default)
+>>> text
+'{"t": "2024-01-01T00:00:00.000000000000005", "dt": "PT1S"}'
+>>> json.loads(text, object_hook=object_hook)
+{'t': hightime.datetime(2024, 1, 1, 0, 0, 0, 0, 5), 'dt': hightime.timedelta(seconds=1)}
+"""
+
+import datetime as std_datetime
+import json
+import re
+
+import hightime
+from hightime._array import DatetimeArray
+from hightime._datetime import (
+    _LV_EPOCH_OFFSET_YS,
+    _LV_FRACTION_PER_S,
+    _UNIX_EPOCH_ORDINAL,
+    _lv_from_timestamp_ys,
+)
+from hightime._timedelta import _YS_PER_DAY, _YS_PER_FS, _YS_PER_S, _YS_PER_US, _divide_and_round
+from hightime.bulk import _parse_iso_ys
+
+__all__ = ["default", "dumps_many", "loads_many", "make_default", "make_object_hook", "object_hook"]
+
+STYLES = ("iso", "ns", "lv")
+
+_YS_PER_NS = 10**15
+_UTC = std_datetime.timezone.utc
+_OFFSET_RE = re.compile(r"(?:[Zz]|[+-]\d\d:?\d\d(?::?\d\d(?:\.\d{6})?)?)$")
+
+
+def _check_style(style):
+    if style not in STYLES:
+        raise ValueError("style must be one of {}".format(", ".join(STYLES)), style)
+
+
+# Encoding
+
+
+def _lv_duration(ys):
+    seconds, ys = divmod(ys, _YS_PER_S)
+    fraction = _divide_and_round(ys * _LV_FRACTION_PER_S, _YS_PER_S)
+    if fraction == _LV_FRACTION_PER_S:
+        seconds += 1
+        fraction = 0
+    return [seconds, fraction]
+
+
+def _encode_ys(ys, style, is_datetime):
+    if style == "ns":
+        return _divide_and_round(ys, _YS_PER_NS)
+    if is_datetime:
+        return list(_lv_from_timestamp_ys(ys))
+    return _lv_duration(ys)
+
+
+def _isoformat_utc_ys(ys, days_cache):
+    # Equivalent to _from_epoch_ys(ys).isoformat(), without creating a datetime.
+    days, ys = divmod(ys, _YS_PER_DAY)
+    date = days_cache.get(days)
+    if date is None:
+        ordinal = days + _UNIX_EPOCH_ORDINAL
+        date = days_cache[days] = std_datetime.date.fromordinal(ordinal).isoformat() + "T"
+    seconds, fraction = divmod(ys, _YS_PER_S)
+    minutes, seconds = divmod(seconds, 60)
+    text = "{}{:02d}:{:02d}:{:02d}".format(date, minutes // 60, minutes % 60, seconds)
+    if fraction % _YS_PER_FS:
+        return "{}.{:024d}".format(text, fraction)
+    if fraction % _YS_PER_US:
+        return "{}.{:015d}".format(text, fraction // _YS_PER_FS)
+    if fraction:
+        return "{}.{:06d}".format(text, fraction // _YS_PER_US)
+    return text
+
+
+def make_default(style="iso"):
+    """Return a ``default`` function for :func:`json.dumps` that encodes in ``style``."""
+    _check_style(style)
+    datetime = hightime.datetime
+    timedelta = hightime.timedelta
+
+    if style == "iso":
+        return default
+
+    def encode(obj):
+        if isinstance(obj, datetime):
+            return _encode_ys(obj._to_epoch_ys(), style, True)
+        if isinstance(obj, timedelta):
+            return _encode_ys(timedelta._as_ys(obj), style, False)
+        raise TypeError("Object of type {} is not JSON serializable".format(type(obj).__name__))
+
+    return encode
+
+
+def default(obj):
+    """Encode hightime values as ISO 8601 strings, for :func:`json.dumps`."""
+    if isinstance(obj, (hightime.datetime, hightime.timedelta)):
+        return obj.isoformat()
+    raise TypeError("Object of type {} is not JSON serializable".format(type(obj).__name__))
+
+
+def dumps_many(values, style="iso"):
+    """Return a JSON array of ``values``, which are all datetimes or all timedeltas.
+
+    ``values`` may also be a :any:`hightime.DatetimeArray`, which is encoded from its packed
+    values. Naive and UTC datetimes are formatted in ``"iso"`` style without creating datetime
+    objects; the result is the same as :meth:`hightime.datetime.isoformat`.
+    """
+    _check_style(style)
+    if isinstance(values, DatetimeArray):
+        ys_values = values._iter_ys()
+        tzinfo = values.tzinfo
+        if style == "iso" and tzinfo is not None and tzinfo is not _UTC:
+            ys_values = None
+        is_datetime = True
+    else:
+        values = list(values)
+        is_datetime = bool(values) and isinstance(values[0], std_datetime.datetime)
+        if style == "iso" and is_datetime:
+            tzinfo = values[0].tzinfo
+            if any(dt.tzinfo is not tzinfo for dt in values) or tzinfo not in (None, _UTC):
+                return json.dumps([dt.isoformat() for dt in values])
+        if is_datetime:
+            ys_values = (dt._to_epoch_ys() for dt in values)
+        else:
+            as_ys = hightime.timedelta._as_ys
+            ys_values = (as_ys(td) for td in values)
+
+    if style != "iso":
+        return json.dumps([_encode_ys(ys, style, is_datetime) for ys in ys_values])
+    if ys_values is None:
+        return json.dumps([dt.isoformat() for dt in values])
+    if not is_datetime:
+        return json.dumps(hightime.timedelta.isoformat_many(values))
+
+    days_cache = {}
+    suffix = "" if tzinfo is None else "+00:00"
+    return json.dumps([_isoformat_utc_ys(ys, days_cache) + suffix for ys in ys_values])
+
+
+# Decoding
+
+
+def _decode_datetime_ys(value, style):
+    if style == "ns":
+        return value * _YS_PER_NS
+    seconds, fraction = value
+    return (
+        seconds * _YS_PER_S
+        + _divide_and_round(fraction * _YS_PER_S, _LV_FRACTION_PER_S)
+        - _LV_EPOCH_OFFSET_YS
+    )
+
+
+def _decode_timedelta_ys(value, style):
+    if style == "ns":
+        return value * _YS_PER_NS
+    seconds, fraction = value
+    return seconds * _YS_PER_S + _divide_and_round(fraction * _YS_PER_S, _LV_FRACTION_PER_S)
+
+
+def _parse_isoformat(text, tz):
+    (ys,) = _parse_iso_ys([text.encode("ascii")])
+    if tz is None and _OFFSET_RE.search(text):
+        tz = _UTC
+    return hightime.datetime._from_epoch_ys(ys, tz)
+
+
+def _looks_like_datetime(text):
+    return len(text) >= 19 and text[4] == "-" and text[10] in "Tt "
+
+
+def _looks_like_duration(text):
+    return text[:1] == "P" or text[:2] == "-P"
+
+
+def make_object_hook(style="iso", datetime_keys=None, timedelta_keys=None, tz=None):
+    """Return an ``object_hook`` function for :func:`json.loads` that decodes ``style``.
+
+    ``datetime_keys`` and ``timedelta_keys`` are collections of the object keys holding
+    datetimes and timedeltas. With the ``"iso"`` style, they may be omitted to decode every
+    string value that parses as an ISO 8601 datetime or duration; other strings are left as
+    is. The other styles require them.
+
+    Datetimes are returned in ``tz``. If ``tz`` is ``None``, ISO 8601 strings with a UTC offset
+    are returned in UTC, and other values as naive datetimes in UTC.
+    """
+    _check_style(style)
+    datetime_keys = frozenset(datetime_keys or ())
+    timedelta_keys = frozenset(timedelta_keys or ())
+    from_epoch_ys = hightime.datetime._from_epoch_ys
+    from_ys = hightime.timedelta._from_ys
+
+    if style != "iso":
+        if not (datetime_keys or timedelta_keys):
+            raise ValueError("datetime_keys or timedelta_keys is required for style %r" % style)
+
+        def object_hook(obj):
+            for key in datetime_keys.intersection(obj):
+                if obj[key] is not None:
+                    obj[key] = from_epoch_ys(_decode_datetime_ys(obj[key], style), tz)
+            for key in timedelta_keys.intersection(obj):
+                if obj[key] is not None:
+                    obj[key] = from_ys(_decode_timedelta_ys(obj[key], style))
+            return obj
+
+        return object_hook
+
+    fromisoformat = hightime.timedelta.fromisoformat
+    if datetime_keys or timedelta_keys:
+
+        def object_hook(obj):
+            for key in datetime_keys.intersection(obj):
+                if obj[key] is not None:
+                    obj[key] = _parse_isoformat(obj[key], tz)
+            for key in timedelta_keys.intersection(obj):
+                if obj[key] is not None:
+                    obj[key] = fromisoformat(obj[key])
+            return obj
+
+        return object_hook
+
+    def object_hook(obj):
+        for key, value in obj.items():
+            if not isinstance(value, str):
+                continue
+            try:
+                if _looks_like_datetime(value):
+                    obj[key] = _parse_isoformat(value, tz)
+                elif _looks_like_duration(value):
+                    obj[key] = fromisoformat(value)
+            except ValueError:
+                pass
+        return obj
+
+    return object_hook
+
+
+_OBJECT_HOOK = make_object_hook()
+
+
+def object_hook(obj):
+    """Decode ISO 8601 datetime and duration strings, for :func:`json.loads`.
+
+    String values that do not parse as either are left as is. See :func:`make_object_hook`.
+    """
+    return _OBJECT_HOOK(obj)
+
+
+def loads_many(text, kind="datetime", style="iso", tz=None):
+    """Return a list of values decoded from a JSON array, such as one from :func:`dumps_many`.
+
+    ``kind`` is ``"datetime"`` or ``"timedelta"``. Datetimes are returned in ``tz``. If ``tz`` is
+    ``None``, aware ISO 8601 strings are returned in UTC, and other values as naive datetimes in
+    UTC, as with :func:`object_hook`. ISO 8601 datetimes are parsed straight to exact values, as
+    in :mod:`hightime.bulk`.
+    """
+    _check_style(style)
+    if kind not in ("datetime", "timedelta"):
+        raise ValueError("kind must be datetime or timedelta", kind)
+    values = json.loads(text)
+    if not isinstance(values, list):
+        raise ValueError("expected a JSON array")
+    if kind == "timedelta":
+        if style == "iso":
+            return hightime.timedelta.fromisoformat_many(values)
+        from_ys = hightime.timedelta._from_ys
+        return [from_ys(_decode_timedelta_ys(value, style)) for value in values]
+
+    from_epoch_ys = hightime.datetime._from_epoch_ys
+    if style != "iso":
+        return [from_epoch_ys(_decode_datetime_ys(value, style), tz) for value in values]
+    ys_values = _parse_iso_ys([value.encode("ascii") for value in values])
+    if tz is not None:
+        return [from_epoch_ys(ys, tz) for ys in ys_values]
+    search = _OFFSET_RE.search
+    return [
+        from_epoch_ys(ys, _UTC if search(value) else None) for ys, value in zip(ys_values, values)
+    ]
@@ -0,0 +1,32 @@
+import datetime as std_datetime
+from typing import Any, Callable, Collection, Iterable, Literal, Optional, Union
+
+import hightime
+
+__all__ = ["default", "dumps_many", "loads_many", "make_default", "make_object_hook", "object_hook"]
+
+_Style = Literal["iso", "ns", "lv"]
+
+STYLES: tuple[str, ...]
+
+def default(obj: object) -> Any: ...
+def dumps_many(
+    values: Union[
+        Iterable[std_datetime.datetime], Iterable[std_datetime.timedelta], hightime.DatetimeArray
+    ],
+    style: _Style = ...,
+) -> str: ...
+def loads_many(
+    text: Union[str, bytes, bytearray],
+    kind: Literal["datetime", "timedelta"] = ...,
+    style: _Style = ...,
+    tz: Optional[std_datetime.tzinfo] = ...,
+) -> Union[list[hightime.datetime], list[hightime.timedelta]]: ...
+def make_default(style: _Style = ...) -> Callable[[object], Any]: ...
+def make_object_hook(
+    style: _Style = ...,
+    datetime_keys: Optional[Collection[str]] = ...,
+    timedelta_keys: Optional[Collection[str]] = ...,
+    tz: Optional[std_datetime.tzinfo] = ...,
+) -> Callable[[dict[str, Any]], Any]: ...
+def object_hook(obj: dict[str, Any]) -> Any: ...
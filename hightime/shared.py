@@ -0,0 +1,229 @@
+"""DatetimeArrays in shared memory, for passing timestamps between processes without copying.
+
+A shared array lives in a :any:`multiprocessing.shared_memory.SharedMemory` block. Other
+processes attach to it by name and view its records without copying them, and pickling a
+shared array only sends its name. :func:`map_chunks` uses this to fan work out over a process
+pool.
+
+The block holds a little-endian ``uint64`` element count, 8 reserved bytes, a
+:mod:`hightime.io` column header recording the time zone, and then the packed records.
+
+The process that creates an array owns the block and must :meth:`~SharedDatetimeArray.unlink`
+it when done; using the array as a context manager does that.
+"""
+
+import struct
+import sys
+
+from hightime._array import _RECORD_SIZE, DatetimeArray, _pack_ys
+from hightime.io import _HEADER, _decode_tzinfo, _pack_header, _unpack_header
+
+__all__ = ["SharedDatetimeArray", "attach_shared", "create_shared", "map_chunks"]
+
+_PREFIX = struct.Struct("<Q8x")
+
+
+class SharedDatetimeArray:
+    """A :any:`hightime.DatetimeArray` stored in a shared memory block.
+
+    Create one with :func:`create_shared` or attach to an existing one with
+    :func:`attach_shared`. It supports the same sequence operations as
+    :any:`hightime.DatetimeArray`, and :attr:`array` is a zero-copy
+    :any:`hightime.DatetimeArray` view of it.
+
+    Views obtained from the array must be released before :meth:`close` can unmap the block;
+    otherwise the block stays mapped until they are.
+    """
+
+    # _array is listed first so that it is released before _shm when the object is freed.
+    __slots__ = ("_array", "_shm", "_owner")
+
+    def __init__(self, shm, owner):
+        """Wrap the SharedMemory block ``shm``. Use :func:`create_shared` or
+        :func:`attach_shared` instead of calling this directly.
+        """  # noqa: D205, D415 - multi-line summary
+        buf = shm.buf
+        (count,) = _PREFIX.unpack_from(buf)
+        header_size, tz_length = _unpack_header(buf[_PREFIX.size : _PREFIX.size + _HEADER.size])
+        tz_start = _PREFIX.size + _HEADER.size
+        tzinfo = _decode_tzinfo(bytes(buf[tz_start : tz_start + tz_length]).decode("utf-8"))
+        start = _PREFIX.size + header_size
+        self._array = DatetimeArray.frombuffer(buf[start : start + count * _RECORD_SIZE], tzinfo)
+        self._shm = shm
+        self._owner = owner
+
+    # Public properties
+
+    @property
+    def name(self):
+        """The name of the shared memory block, for :func:`attach_shared`."""
+        return self._shm.name
+
+    @property
+    def array(self):
+        """A :any:`hightime.DatetimeArray` view of the elements."""
+        return self._array
+
+    @property
+    def tzinfo(self):
+        """The time zone the elements are returned in."""
+        return self._array.tzinfo
+
+    # Public methods
+
+    def close(self):
+        """Unmap the block from this process."""
+        self._array = DatetimeArray((), self._array.tzinfo)
+        try:
+            self._shm.close()
+        except BufferError:
+            # Views handed out earlier still reference the block; it is unmapped when they
+            # are released.
+            pass
+
+    def unlink(self):
+        """Request that the block be destroyed once every process has closed it."""
+        self._shm.unlink()
+
+    # Sequence protocol
+
+    def __len__(self):
+        """Return len(self)."""
+        return len(self._array)
+
+    def __getitem__(self, index):
+        """Return self[index]. Slices return a zero-copy :any:`hightime.DatetimeArray`."""
+        return self._array[index]
+
+    def __iter__(self):
+        """Implement iter(self)."""
+        return iter(self._array)
+
+    # Buffer protocol
+
+    def __buffer__(self, flags):
+        """Return a memoryview of the packed records (PEP 688)."""
+        return self._array.__buffer__(flags)
+
+    def __release_buffer__(self, view):
+        """Release a memoryview returned by :meth:`__buffer__`."""
+        view.release()
+
+    # Other operators
+
+    def __enter__(self):
+        """Return self."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the block, and unlink it if this array created it."""
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __reduce__(self):
+        """Pickle by name, so that the receiving process attaches instead of copying."""
+        return attach_shared, (self.name,)
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return "<{}.{} {!r}, {} elements>".format(
+            self.__class__.__module__, self.__class__.__qualname__, self.name, len(self)
+        )
+
+
+def create_shared(datetimes, tzinfo=None, name=None):
+    """Return a new :class:`SharedDatetimeArray` holding ``datetimes``.
+
+    ``datetimes`` is an iterable of :any:`hightime.datetime` or a
+    :any:`hightime.DatetimeArray`, which is copied without creating datetime objects. See
+    :any:`hightime.DatetimeArray` for how ``tzinfo`` is applied. ``name`` is the name of the
+    block to create; by default a unique name is chosen.
+    """
+    from multiprocessing import shared_memory
+
+    if isinstance(datetimes, DatetimeArray):
+        records = datetimes.tobytes()
+    else:
+        records = _pack_ys(dt._to_epoch_ys() for dt in datetimes)
+    header = _pack_header(tzinfo)
+    size = _PREFIX.size + len(header) + len(records)
+    shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+    try:
+        buf = shm.buf
+        _PREFIX.pack_into(buf, 0, len(records) // _RECORD_SIZE)
+        start = _PREFIX.size + len(header)
+        buf[_PREFIX.size : start] = header
+        buf[start : start + len(records)] = records
+        del buf
+        return SharedDatetimeArray(shm, owner=True)
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+
+
+def attach_shared(name):
+    """Return a :class:`SharedDatetimeArray` attached to the existing block ``name``.
+
+    On Python 3.13 and later, attaching does not register the block with the
+    :mod:`multiprocessing` resource tracker, so an unrelated process that attaches does not
+    destroy the block when it exits.
+    """
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+    return SharedDatetimeArray(shm, owner=False)
+
+
+def _map_chunk(function, name, start, stop):
+    shared = attach_shared(name)
+    try:
+        return function(shared.array[start:stop])
+    finally:
+        shared.close()
+
+
+def map_chunks(function, datetimes, chunk_size=None, executor=None, max_workers=None):
+    """Return ``[function(chunk) for chunk in chunks]``, computed in a process pool.
+
+    Each chunk is a :any:`hightime.DatetimeArray` view of up to ``chunk_size`` consecutive
+    elements of ``datetimes``, attached in the worker from shared memory. Only the block name
+    and the chunk bounds are sent to the workers. ``function`` must be picklable, such as a
+    module-level function, and should not keep the chunk after returning.
+
+    ``datetimes`` is a :class:`SharedDatetimeArray`, or any other iterable of datetimes, which is
+    copied into a temporary shared block for the duration of the call. ``executor`` is an
+    existing :any:`concurrent.futures.ProcessPoolExecutor`; by default a new one with
+    ``max_workers`` workers is created and shut down. The default ``chunk_size`` gives each of
+    ``max_workers`` workers (by default :any:`os.cpu_count`, also when passing an ``executor``)
+    about four chunks.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    shared = datetimes if isinstance(datetimes, SharedDatetimeArray) else None
+    if shared is None:
+        shared = create_shared(datetimes, getattr(datetimes, "tzinfo", None))
+    try:
+        length = len(shared)
+        if chunk_size is None:
+            workers = max_workers or os.cpu_count() or 1
+            chunk_size = max(1, -(-length // (workers * 4)))
+        elif chunk_size < 1:
+            raise ValueError("chunk_size must be positive", chunk_size)
+        starts = range(0, length, chunk_size)
+        stops = [min(start + chunk_size, length) for start in starts]
+        names = [shared.name] * len(starts)
+        functions = [function] * len(starts)
+        if executor is not None:
+            return list(executor.map(_map_chunk, functions, names, starts, stops))
+        with ProcessPoolExecutor(max_workers) as pool:
+            return list(pool.map(_map_chunk, functions, names, starts, stops))
+    finally:
+        if shared is not datetimes:
+            shared.close()
+            shared.unlink()
@@ -0,0 +1,50 @@
+import datetime as std_datetime
+from concurrent.futures import Executor
+from types import TracebackType
+from typing import Callable, Iterable, Iterator, Optional, TypeVar, Union, overload
+
+import hightime
+
+__all__ = ["SharedDatetimeArray", "attach_shared", "create_shared", "map_chunks"]
+
+_T = TypeVar("_T")
+
+class SharedDatetimeArray:
+    def __buffer__(self, flags: int, /) -> memoryview: ...
+    def __enter__(self) -> SharedDatetimeArray: ...
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None: ...
+    @overload
+    def __getitem__(self, index: int, /) -> hightime.datetime: ...
+    @overload
+    def __getitem__(self, index: slice, /) -> hightime.DatetimeArray: ...
+    def __iter__(self) -> Iterator[hightime.datetime]: ...
+    def __len__(self) -> int: ...
+    def __release_buffer__(self, view: memoryview, /) -> None: ...
+    def __repr__(self) -> str: ...
+    @property
+    def array(self) -> hightime.DatetimeArray: ...
+    def close(self) -> None: ...
+    @property
+    def name(self) -> str: ...
+    @property
+    def tzinfo(self) -> Optional[std_datetime.tzinfo]: ...
+    def unlink(self) -> None: ...
+
+def attach_shared(name: str) -> SharedDatetimeArray: ...
+def create_shared(
+    datetimes: Union[Iterable[hightime.datetime], hightime.DatetimeArray],
+    tzinfo: Optional[std_datetime.tzinfo] = ...,
+    name: Optional[str] = ...,
+) -> SharedDatetimeArray: ...
+def map_chunks(
+    function: Callable[[hightime.DatetimeArray], _T],
+    datetimes: Union[Iterable[hightime.datetime], SharedDatetimeArray],
+    chunk_size: Optional[int] = ...,
+    executor: Optional[Executor] = ...,
+    max_workers: Optional[int] = ...,
+) -> list[_T]: ...
@@ -0,0 +1,146 @@
+"""Storing hightime values in SQLite as exact, order-preserving BLOBs.
+
+:func:`register` installs :mod:`sqlite3` adapters so that :any:`hightime.datetime` and
+:any:`hightime.timedelta` parameters are stored as 16-byte BLOBs, and converters for the
+declared column types ``HIGHTIME`` and ``HIGHTIME_TIMEDELTA``. Each BLOB is the value's
+:meth:`~hightime.datetime.to_sort_key`, so SQLite's byte-wise BLOB comparison orders values
+chronologically and range queries such as ``WHERE ts BETWEEN ? AND ?`` can use an index.
+
+>>> import sqlite3
+>>> from hightime import datetime
+>>> connection = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+>>> register(connection)
+>>> _ = connection.execute("CREATE TABLE results (ts HIGHTIME)")
+>>> executemany(connection, "INSERT INTO results VALUES (?)", hightime.DatetimeArray(
+...     [datetime(2024, 1, 1, femtosecond=i) for i in range(5)]))
+>>> connection.execute(
+...     "SELECT ts FROM results WHERE ts BETWEEN ? AND ?",
+...     (datetime(2024, 1, 1, femtosecond=3), datetime(2024, 1, 2))).fetchall()
+[(hightime.datetime(2024, 1, 1, 0, 0, 0, 0, 3),), (hightime.datetime(2024, 1, 1, 0, 0, 0, 0, 4),)]
+>>> connection.execute("SELECT hightime_isoformat(max(ts)) FROM results").fetchone()
+('2024-01-01T00:00:00.000000000000004',)
+
+Aware datetimes are stored in UTC and naive datetimes are treated as UTC. SQLite integers are
+64-bit, which cannot hold yoctosecond precision over the datetime range, so values are not
+stored as integers.
+"""
+
+import sqlite3
+
+import hightime
+from hightime._array import DatetimeArray
+from hightime._timedelta import _YS_PER_S, _decode_sort_key, _encode_sort_key
+
+__all__ = ["executemany", "fetch_array", "register"]
+
+DATETIME_TYPE = "HIGHTIME"
+TIMEDELTA_TYPE = "HIGHTIME_TIMEDELTA"
+
+
+def _blob_function(function):
+    # Wrap a SQL function so that NULL arguments give NULL, as SQLite's built-in functions do.
+    def wrapper(*args):
+        if any(arg is None for arg in args):
+            return None
+        return function(*args)
+
+    return wrapper
+
+
+def _sql_isoformat(blob):
+    return hightime.datetime._from_epoch_ys(_decode_sort_key(blob)).isoformat()
+
+
+def _sql_from_isoformat(text):
+    from hightime.bulk import _parse_iso_ys
+
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    (ys,) = _parse_iso_ys([text])
+    return _encode_sort_key(ys)
+
+
+def _sql_unix_seconds(blob):
+    return _decode_sort_key(blob) / _YS_PER_S
+
+
+def _sql_add(blob, delta):
+    return _encode_sort_key(_decode_sort_key(blob) + _decode_sort_key(delta))
+
+
+def _sql_diff(left, right):
+    return _encode_sort_key(_decode_sort_key(left) - _decode_sort_key(right))
+
+
+_SQL_FUNCTIONS = {
+    "hightime_isoformat": (1, _sql_isoformat),
+    "hightime_from_isoformat": (1, _sql_from_isoformat),
+    "hightime_unix_seconds": (1, _sql_unix_seconds),
+    "hightime_add": (2, _sql_add),
+    "hightime_diff": (2, _sql_diff),
+}
+
+
+def register(connection=None, tzinfo=None):
+    """Install the hightime adapters and converters, and the SQL functions on ``connection``.
+
+    Adapters and converters are global to the :mod:`sqlite3` module. Converted datetimes are
+    returned in ``tzinfo``, or as naive UTC datetimes if ``tzinfo`` is ``None``; the converters
+    only run for connections opened with ``detect_types=sqlite3.PARSE_DECLTYPES``.
+
+    SQL functions are installed per connection. NULL arguments give NULL.
+
+    * ``hightime_isoformat(ts)``: ``ts`` as naive UTC ISO 8601 text.
+    * ``hightime_from_isoformat(text)``: the BLOB for ISO 8601 ``text``, converted to UTC.
+    * ``hightime_unix_seconds(ts)``: ``ts`` as approximate float seconds since the Unix epoch.
+    * ``hightime_add(ts, delta)``: ``ts`` plus the timedelta BLOB ``delta``.
+    * ``hightime_diff(ts1, ts2)``: the timedelta BLOB ``ts1 - ts2``.
+    """
+    from_sort_key = hightime.datetime.from_sort_key
+
+    def convert_datetime(blob):
+        return from_sort_key(blob, tzinfo)
+
+    sqlite3.register_adapter(hightime.datetime, hightime.datetime.to_sort_key)
+    sqlite3.register_adapter(hightime.timedelta, hightime.timedelta.to_sort_key)
+    sqlite3.register_converter(DATETIME_TYPE, convert_datetime)
+    sqlite3.register_converter(TIMEDELTA_TYPE, hightime.timedelta.from_sort_key)
+    if connection is not None:
+        for name, (arg_count, function) in _SQL_FUNCTIONS.items():
+            connection.create_function(
+                name, arg_count, _blob_function(function), deterministic=True
+            )
+
+
+def executemany(connection, sql, *columns):
+    """Execute ``sql`` once per row, with parameters taken from ``columns``.
+
+    Each column is an iterable with one value per row. :any:`hightime.DatetimeArray` columns are
+    encoded directly from their packed values, without creating datetime objects. Other columns
+    are passed through, so hightime values in them use the adapters installed by
+    :func:`register`. ``connection`` is a :any:`sqlite3.Connection` or :any:`sqlite3.Cursor`.
+    """
+    encoded = [
+        map(_encode_sort_key, column._iter_ys()) if isinstance(column, DatetimeArray) else column
+        for column in columns
+    ]
+    connection.executemany(sql, zip(*encoded))
+
+
+def fetch_array(cursor, tzinfo=None):
+    """Return the first column of the remaining rows of ``cursor`` as a DatetimeArray.
+
+    The column holds hightime BLOBs, or :any:`hightime.datetime` values if a converter already
+    ran. BLOBs are decoded without creating datetime objects. See :any:`hightime.DatetimeArray`
+    for how ``tzinfo`` is applied.
+    """
+
+    def iter_ys():
+        for row in cursor:
+            value = row[0]
+            if isinstance(value, bytes):
+                yield _decode_sort_key(value)
+            else:
+                yield value._to_epoch_ys()
+
+    return DatetimeArray._from_ys(iter_ys(), tzinfo)
@@ -0,0 +1,22 @@
+import datetime as std_datetime
+import sqlite3
+from typing import Any, Iterable, Optional, Union
+
+import hightime
+
+__all__ = ["executemany", "fetch_array", "register"]
+
+DATETIME_TYPE: str
+TIMEDELTA_TYPE: str
+
+def executemany(
+    connection: Union[sqlite3.Connection, sqlite3.Cursor],
+    sql: str,
+    *columns: Union[Iterable[Any], hightime.DatetimeArray],
+) -> None: ...
+def fetch_array(
+    cursor: sqlite3.Cursor, tzinfo: Optional[std_datetime.tzinfo] = ...
+) -> hightime.DatetimeArray: ...
+def register(
+    connection: Optional[sqlite3.Connection] = ..., tzinfo: Optional[std_datetime.tzinfo] = ...
+) -> None: ...
@@ -0,0 +1,184 @@
+"""Leap-second table for conversions between the UTC, TAI and GPS time scales.
+
+The conversions themselves are :any:`hightime.datetime.to_tai`,
+:any:`hightime.datetime.from_tai`, :any:`hightime.datetime.to_gps` and
+:any:`hightime.datetime.from_gps`, plus their ``_many`` forms. This module holds the
+leap-second table they use.
+
+The built-in table covers every leap second through 2017-01-01 (TAI - UTC = 37 s). To pick up
+later leap seconds, load a current IERS ``leap-seconds.list`` file with
+:func:`load_leap_seconds`.
+
+>>> tai_minus_utc(hightime.datetime(2024, 1, 1))
+37
+>>> leap_seconds()[0]
+(hightime.datetime(1972, 1, 1, 0, 0, tzinfo=datetime.timezone.utc), 10)
+"""
+
+import datetime as std_datetime
+from bisect import bisect_right
+
+import hightime
+from hightime._timedelta import _YS_PER_S
+
+__all__ = [
+    "GPS_MINUS_TAI",
+    "leap_seconds",
+    "load_leap_seconds",
+    "reset_leap_seconds",
+    "tai_minus_utc",
+]
+
+GPS_MINUS_TAI = -19
+"""GPS - TAI, in seconds. GPS time has been a fixed offset from TAI since 1980-01-06."""
+
+# Seconds from the NTP epoch (1900-01-01) to the Unix epoch (1970-01-01).
+_NTP_TO_UNIX_S = 2208988800
+
+_GPS_MINUS_TAI_YS = GPS_MINUS_TAI * _YS_PER_S
+
+# (NTP seconds when it takes effect, TAI - UTC in seconds), as in IERS leap-seconds.list.
+_BUILTIN_LEAP_SECONDS = (
+    (2272060800, 10),  # 1972-01-01
+    (2287785600, 11),  # 1972-07-01
+    (2303683200, 12),  # 1973-01-01
+    (2335219200, 13),  # 1974-01-01
+    (2366755200, 14),  # 1975-01-01
+    (2398291200, 15),  # 1976-01-01
+    (2429913600, 16),  # 1977-01-01
+    (2461449600, 17),  # 1978-01-01
+    (2492985600, 18),  # 1979-01-01
+    (2524521600, 19),  # 1980-01-01
+    (2571782400, 20),  # 1981-07-01
+    (2603318400, 21),  # 1982-07-01
+    (2634854400, 22),  # 1983-07-01
+    (2698012800, 23),  # 1985-07-01
+    (2776982400, 24),  # 1988-01-01
+    (2840140800, 25),  # 1990-01-01
+    (2871676800, 26),  # 1991-01-01
+    (2918937600, 27),  # 1992-07-01
+    (2950473600, 28),  # 1993-07-01
+    (2982009600, 29),  # 1994-07-01
+    (3029443200, 30),  # 1996-01-01
+    (3076704000, 31),  # 1997-07-01
+    (3124137600, 32),  # 1999-01-01
+    (3345062400, 33),  # 2006-01-01
+    (3439756800, 34),  # 2009-01-01
+    (3550089600, 35),  # 2012-07-01
+    (3644697600, 36),  # 2015-07-01
+    (3692217600, 37),  # 2017-01-01
+)
+
+# (UTC keys, TAI keys, TAI - UTC offsets), all in yoctoseconds since the Unix epoch. Replaced as
+# a whole so that lookups on other threads always see a consistent table.
+_TABLE = None
+
+
+def _set_table(entries):
+    global _TABLE
+    entries = sorted(entries)
+    if not entries:
+        raise ValueError("leap-second table is empty")
+    utc_keys = []
+    tai_keys = []
+    offsets = []
+    previous = entries[0][1]
+    for ntp_seconds, offset in entries:
+        utc_ys = (ntp_seconds - _NTP_TO_UNIX_S) * _YS_PER_S
+        utc_keys.append(utc_ys)
+        # A TAI instant inside an inserted leap second maps to the repeated 23:59:59 UTC second.
+        tai_keys.append(utc_ys + min(previous, offset) * _YS_PER_S)
+        offsets.append(offset * _YS_PER_S)
+        previous = offset
+    _TABLE = (utc_keys, tai_keys, offsets)
+
+
+def _utc_to_tai_ys(ys):
+    utc_keys, _, offsets = _TABLE
+    return ys + offsets[max(bisect_right(utc_keys, ys) - 1, 0)]
+
+
+def _tai_to_utc_ys(ys):
+    _, tai_keys, offsets = _TABLE
+    return ys - offsets[max(bisect_right(tai_keys, ys) - 1, 0)]
+
+
+def _convert_many(values, keys, offsets, sign):
+    # Convert sorted or nearly sorted runs without a bisect per value: reuse the previous
+    # table interval while the value stays inside it.
+    result = []
+    append = result.append
+    last = len(keys) - 1
+    index = 0
+    low = high = None
+    for ys in values:
+        if low is None or not low <= ys < high:
+            index = max(bisect_right(keys, ys) - 1, 0)
+            low = keys[index] if index else float("-inf")
+            high = keys[index + 1] if index < last else float("inf")
+        append(ys + sign * offsets[index])
+    return result
+
+
+def _utc_to_tai_ys_many(values):
+    utc_keys, _, offsets = _TABLE
+    return _convert_many(values, utc_keys, offsets, 1)
+
+
+def _tai_to_utc_ys_many(values):
+    _, tai_keys, offsets = _TABLE
+    return _convert_many(values, tai_keys, offsets, -1)
+
+
+def tai_minus_utc(dt):
+    """Return TAI - UTC, in whole seconds, at the UTC instant ``dt``.
+
+    Naive datetimes are treated as UTC. Instants before 1972-01-01 use the 1972 offset of
+    10 seconds.
+    """
+    utc_keys, _, offsets = _TABLE
+    ys = dt._to_epoch_ys()
+    return offsets[max(bisect_right(utc_keys, ys) - 1, 0)] // _YS_PER_S
+
+
+def leap_seconds():
+    """Return the leap-second table as a list of ``(utc_datetime, tai_minus_utc)`` tuples."""
+    utc_keys, _, offsets = _TABLE
+    from_epoch_ys = hightime.datetime._from_epoch_ys
+    utc = std_datetime.timezone.utc
+    return [
+        (from_epoch_ys(key, utc), offset // _YS_PER_S) for key, offset in zip(utc_keys, offsets)
+    ]
+
+
+def load_leap_seconds(path):
+    """Replace the leap-second table with the one in an IERS ``leap-seconds.list`` file.
+
+    Returns the file's expiration date as an aware UTC :any:`hightime.datetime`, or ``None`` if
+    the file does not have one. Raises :any:`ValueError` if the file has no entries.
+    """
+    entries = []
+    expiration = None
+    with open(path, encoding="ascii") as file:
+        for line in file:
+            if line.startswith("#@"):
+                expiration = int(line[2:].split()[0])
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            ntp_seconds, offset = line.split()[:2]
+            entries.append((int(ntp_seconds), int(offset)))
+    _set_table(entries)
+    if expiration is None:
+        return None
+    return hightime.datetime._from_epoch_ys(
+        (expiration - _NTP_TO_UNIX_S) * _YS_PER_S, std_datetime.timezone.utc
+    )
+
+
+def reset_leap_seconds():
+    """Restore the built-in leap-second table."""
+    _set_table(_BUILTIN_LEAP_SECONDS)
+
+
+_set_table(_BUILTIN_LEAP_SECONDS)
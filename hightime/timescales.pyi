@@ -0,0 +1,27 @@
+from os import PathLike
+from typing import Iterable, Optional, Union
+
+import hightime
+
+__all__ = [
+    "GPS_MINUS_TAI",
+    "leap_seconds",
+    "load_leap_seconds",
+    "reset_leap_seconds",
+    "tai_minus_utc",
+]
+
+GPS_MINUS_TAI: int
+
+_GPS_MINUS_TAI_YS: int
+
+def _tai_to_utc_ys(ys: int, /) -> int: ...
+def _tai_to_utc_ys_many(values: Iterable[int], /) -> list[int]: ...
+def _utc_to_tai_ys(ys: int, /) -> int: ...
+def _utc_to_tai_ys_many(values: Iterable[int], /) -> list[int]: ...
+def leap_seconds() -> list[tuple[hightime.datetime, int]]: ...
+def load_leap_seconds(
+    path: Union[str, bytes, PathLike[str], PathLike[bytes]],
+) -> Optional[hightime.datetime]: ...
+def reset_leap_seconds() -> None: ...
+def tai_minus_utc(dt: hightime.datetime) -> int: ...
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import datetime
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+import hightime
+from tests.shorthands import timedelta
+
+
+def test_accumulator_default_is_zero() -> None:
+    acc = hightime.TimedeltaAccumulator()
+    assert acc.yoctoseconds == 0
+    assert not acc
+    assert acc.freeze() == timedelta()
+
+
+def test_accumulator_initial_value() -> None:
+    acc = hightime.TimedeltaAccumulator(timedelta(s=1, ys=5))
+    assert acc.yoctoseconds == 10**24 + 5
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([timedelta(ys=1)] * 1000, timedelta(zs=1)),
+        ([timedelta(fs=1), datetime.timedelta(microseconds=1)], timedelta(us=1, fs=1)),
+        (
+            [timedelta(d=1), timedelta(ys=-1)],
+            timedelta(h=23, m=59, s=59, us=999999, fs=999999999, ys=999999999),
+        ),
+        ([timedelta(d=-1), timedelta(d=2)], timedelta(d=1)),
+    ],
+)
+def test_accumulator_add(values: list[datetime.timedelta], expected: hightime.timedelta) -> None:
+    acc = hightime.TimedeltaAccumulator()
+    for value in values:
+        acc += value
+    assert acc.freeze() == expected
+    assert acc == expected
+
+
+def test_accumulator_add_returns_self() -> None:
+    acc = hightime.TimedeltaAccumulator()
+    assert acc.add(timedelta(ys=1)) is acc
+    assert acc.sub(timedelta(ys=1)) is acc
+    assert acc.scale(2) is acc
+    assert acc.reset() is acc
+
+
+def test_accumulator_sub() -> None:
+    acc = hightime.TimedeltaAccumulator(timedelta(us=1))
+    acc -= timedelta(ys=1)
+    acc.sub(datetime.timedelta(microseconds=1))
+    assert acc.freeze() == timedelta(ys=-1)
+
+
+@pytest.mark.parametrize(
+    "factor, expected",
+    [
+        (3, timedelta(ys=30)),
+        (-1, timedelta(ys=-10)),
+        (0.25, timedelta(ys=2)),  # 2.5 rounds half to even
+        (Fraction(1, 3), timedelta(ys=3)),
+        (Decimal("0.35"), timedelta(ys=4)),  # 3.5 rounds half to even
+    ],
+)
+def test_accumulator_scale(
+    factor: int | float | Fraction | Decimal, expected: hightime.timedelta
+) -> None:
+    acc = hightime.TimedeltaAccumulator(timedelta(ys=10))
+    acc *= factor
+    assert acc.freeze() == expected
+
+
+def test_accumulator_freeze_is_exact() -> None:
+    acc = hightime.TimedeltaAccumulator()
+    acc.add(hightime.timedelta.max).sub(hightime.timedelta.max).add(hightime.timedelta.min)
+    frozen = acc.freeze()
+    assert isinstance(frozen, hightime.timedelta)
+    assert frozen == hightime.timedelta.min
+
+
+def test_accumulator_freeze_overflow() -> None:
+    acc = hightime.TimedeltaAccumulator(hightime.timedelta.max)
+    acc += timedelta(ys=1)
+    with pytest.raises(OverflowError):
+        acc.freeze()
+
+
+@pytest.mark.parametrize("other", [1, 1.0, "1s", hightime.datetime(2020, 1, 1)])
+def test_accumulator_add_unrelated_type(other: object) -> None:
+    acc = hightime.TimedeltaAccumulator()
+    with pytest.raises(TypeError):
+        acc.add(other)  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        acc += other  # type: ignore[arg-type]
+
+
+def test_accumulator_is_not_hashable() -> None:
+    with pytest.raises(TypeError):
+        hash(hightime.TimedeltaAccumulator())
+
+
+def test_accumulator_has_no_dict() -> None:
+    acc = hightime.TimedeltaAccumulator()
+    with pytest.raises(AttributeError):
+        acc.foo = 1  # type: ignore[attr-defined]
+
+
+def test_accumulator_repr() -> None:
+    acc = hightime.TimedeltaAccumulator(timedelta(fs=1))
+    assert repr(acc) == "hightime.TimedeltaAccumulator(hightime.timedelta(femtoseconds=1))"
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as std_datetime
+from typing import Any, Coroutine, TypeVar
+
+import pytest
+
+import hightime
+import hightime.aio
+from tests.shorthands import datetime, timedelta
+
+_T = TypeVar("_T")
+_UTC = std_datetime.timezone.utc
+_PLUS_2 = std_datetime.timezone(std_datetime.timedelta(hours=2))
+
+
+def _run(coroutine: Coroutine[Any, Any, _T]) -> _T:
+    return asyncio.run(coroutine)
+
+
+async def _ticks(
+    ticker: Any,
+) -> list[tuple[hightime.datetime, hightime.timedelta]]:
+    return [tick async for tick in ticker]
+
+
+@pytest.mark.parametrize(
+    "overshoot, expected_lateness",
+    [(timedelta(), timedelta()), (timedelta(ms=3), timedelta(ms=1))],
+)
+def test_sleep_until(overshoot: hightime.timedelta, expected_lateness: hightime.timedelta) -> None:
+    clock = hightime.aio.FakeClock(datetime(2024, 1, 1), overshoot)
+    deadline = datetime(2024, 1, 1, 0, 0, 1, ys=7)
+
+    lateness = _run(hightime.aio.sleep_until(deadline, clock, spin=timedelta(ms=2)))
+
+    assert lateness == expected_lateness
+    assert clock.now() == (deadline + expected_lateness).replace(tzinfo=_UTC)
+
+
+def test_sleep_until_past_deadline() -> None:
+    clock = hightime.aio.FakeClock(datetime(2024, 1, 1, 0, 0, 1))
+
+    lateness = _run(hightime.aio.sleep_until(datetime(2024, 1, 1, tzinfo=_PLUS_2), clock))
+
+    assert lateness == timedelta(h=2, s=1)
+    assert clock.now() == datetime(2024, 1, 1, 0, 0, 1, tzinfo=_UTC)
+
+
+def test_sleep_until_yields_to_other_tasks() -> None:
+    # A clock advanced by another task, which only runs if the waiting task yields.
+    class SharedClock:
+        def __init__(self) -> None:
+            self.value = datetime(2024, 1, 1, tzinfo=_UTC)
+
+        def now(self) -> hightime.datetime:
+            return self.value
+
+        async def sleep(self, delay: std_datetime.timedelta) -> None:
+            await asyncio.sleep(0)
+
+        async def spin(self, remaining: std_datetime.timedelta) -> None:
+            await asyncio.sleep(0)
+
+    clock = SharedClock()
+    deadline = datetime(2024, 1, 1, 0, 0, 0, 10500)
+
+    async def advance() -> None:
+        while clock.value < deadline.replace(tzinfo=_UTC):
+            clock.value += timedelta(us=1000)
+            await asyncio.sleep(0)
+
+    async def main() -> hightime.timedelta:
+        task = asyncio.ensure_future(advance())
+        lateness = await hightime.aio.sleep_until(deadline, clock, spin=timedelta(us=5000))
+        await task
+        return lateness
+
+    assert _run(main()) == timedelta(us=500)
+
+
+def test_sleep_until_real_clock() -> None:
+    clock = hightime.aio.Clock()
+    deadline = clock.now() + timedelta(ms=5)
+
+    lateness = _run(hightime.aio.sleep_until(deadline, clock))
+
+    assert timedelta() <= lateness < timedelta(s=1)
+    assert clock.now() >= deadline
+
+
+def test_ticker_exact_deadlines() -> None:
+    start = datetime(2024, 1, 1, tzinfo=_PLUS_2)
+    clock = hightime.aio.FakeClock(start, timedelta(ms=3))
+    period = timedelta(ys=333333333333333333333333)
+
+    ticks = _run(_ticks(hightime.aio.ticker(start, period, count=1000, clock=clock)))
+
+    assert [deadline for deadline, _ in ticks] == [start + i * period for i in range(1000)]
+    assert all(deadline.tzinfo is _PLUS_2 for deadline, _ in ticks)
+    assert ticks[0][1] == timedelta()
+    assert all(lateness == timedelta(ms=1) for _, lateness in ticks[1:])
+
+
+@pytest.mark.parametrize(
+    "skip_missed, expected",
+    [
+        (False, [(0, 0), (1, 15), (2, 5), (3, 0), (4, 0)]),
+        (True, [(0, 0), (3, 0), (4, 0)]),
+    ],
+)
+def test_ticker_missed(skip_missed: bool, expected: list[tuple[int, int]]) -> None:
+    start = datetime(2024, 1, 1)
+    period = timedelta(ms=10)
+    clock = hightime.aio.FakeClock(start)
+
+    async def main() -> list[tuple[hightime.datetime, hightime.timedelta]]:
+        ticks = []
+        async for tick in hightime.aio.ticker(
+            start, period, count=5, skip_missed=skip_missed, clock=clock
+        ):
+            ticks.append(tick)
+            if len(ticks) == 1:
+                clock.advance(timedelta(ms=25))
+        return ticks
+
+    ticks = _run(main())
+
+    assert ticks == [(start + i * period, timedelta(ms=ms)) for i, ms in expected]
+
+
+def test_ticker_invalid_period() -> None:
+    with pytest.raises(ValueError):
+        _run(_ticks(hightime.aio.ticker(datetime(2024, 1, 1), timedelta())))
+
+
+def test_ticker_invalid_spin() -> None:
+    with pytest.raises(ValueError):
+        _run(hightime.aio.sleep_until(datetime(2024, 1, 1), spin=timedelta(s=-1)))
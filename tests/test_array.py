@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import sys
+import zoneinfo
+
+import pytest
+
+import hightime
+from tests.shorthands import datetime, timedelta
+
+_UTC = std_datetime.timezone.utc
+_PLUS_ONE = std_datetime.timezone(std_datetime.timedelta(hours=1))
+
+_DATETIMES = [
+    datetime(1, 1, 1),
+    datetime(1969, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+    datetime(1970, 1, 1),
+    datetime(2024, 1, 1, fs=5, ys=7),
+    datetime(9999, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+]
+
+
+def test_datetime_array_roundtrip() -> None:
+    array = hightime.DatetimeArray(_DATETIMES)
+
+    assert len(array) == len(_DATETIMES)
+    assert list(array) == _DATETIMES
+    assert array.tolist() == _DATETIMES
+    assert all(isinstance(dt, hightime.datetime) for dt in array)
+    assert [array[i] for i in range(-len(_DATETIMES), len(_DATETIMES))] == _DATETIMES * 2
+
+
+def test_datetime_array_empty() -> None:
+    array = hightime.DatetimeArray()
+
+    assert len(array) == 0
+    assert list(array) == []
+    assert array.tobytes() == b""
+
+
+def test_datetime_array_index_error() -> None:
+    array = hightime.DatetimeArray(_DATETIMES)
+
+    with pytest.raises(IndexError):
+        array[len(_DATETIMES)]
+    with pytest.raises(IndexError):
+        array[-len(_DATETIMES) - 1]
+
+
+def test_datetime_array_aware_values_are_stored_in_utc() -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=-5))
+    array = hightime.DatetimeArray([datetime(2024, 1, 1, fs=1, tzinfo=tz)])
+
+    assert array[0] == datetime(2024, 1, 1, 5, fs=1)
+    assert array[0].tzinfo is None
+
+
+def test_datetime_array_tzinfo() -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=2))
+    array = hightime.DatetimeArray([datetime(2024, 1, 1, ys=1)], tzinfo=tz)
+
+    assert array.tzinfo is tz
+    assert array[0].tzinfo is tz
+    assert array[0] == datetime(2024, 1, 1, 2, ys=1, tzinfo=tz)
+
+
+def test_datetime_array_invalid_tzinfo() -> None:
+    with pytest.raises(TypeError):
+        hightime.DatetimeArray([], tzinfo="UTC")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        slice(None),
+        slice(1, 4),
+        slice(None, None, 2),
+        slice(None, None, -1),
+        slice(-2, 0, -2),
+        slice(10, 20),
+    ],
+)
+def test_datetime_array_slice(index: slice) -> None:
+    array = hightime.DatetimeArray(_DATETIMES)
+
+    view = array[index]
+
+    assert isinstance(view, hightime.DatetimeArray)
+    assert list(view) == _DATETIMES[index]
+    assert view == hightime.DatetimeArray(_DATETIMES[index])
+    assert view.tobytes() == hightime.DatetimeArray(_DATETIMES[index]).tobytes()
+    assert list(view[::-1]) == _DATETIMES[index][::-1]
+
+
+def test_datetime_array_frombuffer() -> None:
+    data = bytearray(hightime.DatetimeArray(_DATETIMES).tobytes())
+
+    array = hightime.DatetimeArray.frombuffer(data, tzinfo=_UTC)
+
+    assert list(array) == [dt.replace(tzinfo=_UTC) for dt in _DATETIMES]
+    # A view, not a copy
+    data[-16:] = bytes(16)
+    assert array[-1] == datetime(1970, 1, 1, tzinfo=_UTC)
+
+
+def test_datetime_array_frombuffer_partial_record() -> None:
+    with pytest.raises(ValueError):
+        hightime.DatetimeArray.frombuffer(bytes(17))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="PEP 688 requires Python 3.12")
+@pytest.mark.parametrize("index", [slice(None), slice(2, 5), slice(None, None, 2)])
+def test_datetime_array_buffer_protocol(index: slice) -> None:
+    array = hightime.DatetimeArray(_DATETIMES)[index]
+
+    with memoryview(array) as view:  # type: ignore[arg-type]
+        assert view.tobytes() == array.tobytes()
+
+
+def test_datetime_array_tobytes_layout() -> None:
+    array = hightime.DatetimeArray([datetime(1970, 1, 1, ys=1), datetime(1969, 12, 31, 23, 59)])
+
+    assert array.tobytes() == (1).to_bytes(16, "little", signed=True) + (-60 * 10**24).to_bytes(
+        16, "little", signed=True
+    )
+
+
+def test_datetime_array_eq() -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=2))
+
+    assert hightime.DatetimeArray(_DATETIMES) == hightime.DatetimeArray(_DATETIMES)
+    assert hightime.DatetimeArray(_DATETIMES) != hightime.DatetimeArray(_DATETIMES[1:])
+    assert hightime.DatetimeArray(_DATETIMES) != hightime.DatetimeArray(_DATETIMES, tzinfo=tz)
+    assert hightime.DatetimeArray(_DATETIMES) != _DATETIMES
+
+
+def test_datetime_array_repr() -> None:
+    assert repr(hightime.DatetimeArray(_DATETIMES[2:4], tzinfo=_UTC)) == (
+        "hightime.DatetimeArray(["
+        "hightime.datetime(1970, 1, 1, 0, 0, tzinfo=datetime.timezone.utc), "
+        "hightime.datetime(2024, 1, 1, 0, 0, 0, 0, 5, 7, tzinfo=datetime.timezone.utc)], "
+        "tzinfo=datetime.timezone.utc)"
+    )
+    assert repr(hightime.DatetimeArray(_DATETIMES[2:3] * 7)) == (
+        "hightime.DatetimeArray(["
+        + "hightime.datetime(1970, 1, 1, 0, 0), " * 3
+        + "..., "
+        + ", ".join(["hightime.datetime(1970, 1, 1, 0, 0)"] * 3)
+        + "])"
+    )
+
+
+@pytest.mark.parametrize(
+    "value, side, expected",
+    [
+        (datetime(2024, 1, 1), "left", 0),
+        (datetime(2024, 1, 1), "right", 3),
+        (datetime(2024, 1, 2), "left", 3),
+        (datetime(2024, 1, 2), "right", 4),
+        (datetime(2024, 1, 1, ys=1), "left", 3),
+        (datetime(2023, 12, 31), "left", 0),
+        (datetime(2025, 1, 1), "right", 5),
+        (datetime(2024, 1, 1, 1, tzinfo=_PLUS_ONE), "right", 3),
+    ],
+)
+def test_datetime_array_searchsorted(value: hightime.datetime, side: str, expected: int) -> None:
+    array = hightime.DatetimeArray(
+        [datetime(2024, 1, 1)] * 3 + [datetime(2024, 1, 2), datetime(2024, 1, 3)]
+    )
+
+    assert array.searchsorted(value, side=side) == expected  # type: ignore[arg-type]
+
+
+def test_datetime_array_searchsorted_invalid_side() -> None:
+    with pytest.raises(ValueError):
+        hightime.DatetimeArray().searchsorted(
+            datetime(2024, 1, 1), side="middle"  # type: ignore[arg-type]
+        )
+
+
+_EASTERN = zoneinfo.ZoneInfo("America/New_York")
+
+
+def test_datetime_array_iter_zoneinfo_matches_astimezone() -> None:
+    # Every 20 minutes across the 2024 DST transitions in both directions.
+    values = [
+        datetime(2024, month, day, tzinfo=_UTC) + timedelta(m=20 * i)
+        for month, day in [(3, 10), (11, 3)]
+        for i in range(36)
+    ]
+
+    result = list(hightime.DatetimeArray(values, _EASTERN))
+
+    expected = [std_datetime.datetime.astimezone(value, _EASTERN) for value in values]
+    assert [(dt.timetuple(), dt.fold) for dt in result] == [
+        (dt.timetuple(), dt.fold) for dt in expected
+    ]
+
+
+@pytest.mark.parametrize("key", ["Australia/Lord_Howe", "Europe/Dublin", "Africa/Casablanca"])
+@pytest.mark.parametrize("year", [1916, 2024, 2050])
+def test_datetime_array_iter_zoneinfo_year_matches_astimezone(key: str, year: int) -> None:
+    tzinfo = zoneinfo.ZoneInfo(key)
+    values = [datetime(year, 1, 1, tzinfo=_UTC) + timedelta(m=97 * i) for i in range(5433)]
+
+    result = list(hightime.DatetimeArray(values, tzinfo))
+
+    expected = [std_datetime.datetime.astimezone(value, tzinfo) for value in values]
+    assert [(dt.timetuple(), dt.fold) for dt in result] == [
+        (dt.timetuple(), dt.fold) for dt in expected
+    ]
+
+
+def test_datetime_array_iter_zoneinfo_wide_window() -> None:
+    values = [
+        datetime(100, 1, 1, tzinfo=_UTC),
+        datetime(2024, 7, 1, 12, ys=1, tzinfo=_UTC),
+        datetime(9000, 1, 1, tzinfo=_UTC),
+    ]
+
+    result = list(hightime.DatetimeArray(values, _EASTERN))
+
+    assert result == [value.astimezone(_EASTERN) for value in values]
+    assert [dt.utcoffset() for dt in result] == [
+        std_datetime.datetime.astimezone(value, _EASTERN).utcoffset() for value in values
+    ]
+
+
+def test_datetime_array_tz_localize_wide_window() -> None:
+    walls = [datetime(100, 1, 1), datetime(2024, 7, 1, 8, ys=1), datetime(9000, 7, 1)]
+
+    localized = hightime.DatetimeArray(walls).tz_localize(_EASTERN)
+
+    assert localized.tz_convert(None) == hightime.DatetimeArray(
+        [
+            datetime(100, 1, 1, 4, 56, 2),
+            datetime(2024, 7, 1, 12, ys=1),
+            datetime(9000, 7, 1, 4),
+        ]
+    )
+
+
+def test_parse_tzif_transitions() -> None:
+    from hightime._zonetable import _parse_tzif, _read_tzif
+
+    data = _read_tzif("America/New_York")
+    if data is None:
+        pytest.skip("no TZif file for America/New_York")
+
+    transitions = _parse_tzif(data)
+
+    assert transitions is not None
+    assert list(transitions) == sorted(transitions)
+    # 2024-03-10 07:00 UTC and 2024-11-03 06:00 UTC.
+    assert {1710054000, 1730613600} <= set(transitions)
+    assert _parse_tzif(b"not a TZif file") is None
+
+
+def test_datetime_array_tz_convert() -> None:
+    array = hightime.DatetimeArray([datetime(2024, 7, 1, 12, ys=5)])
+
+    converted = array.tz_convert(_EASTERN)
+
+    assert converted.tzinfo is _EASTERN
+    assert converted[0] == datetime(2024, 7, 1, 8, ys=5, tzinfo=_EASTERN)
+    assert converted.tobytes() == array.tobytes()
+    assert converted.tz_convert(None) == array
+
+
+@pytest.mark.parametrize(
+    "wall, ambiguous, nonexistent, expected",
+    [
+        (datetime(2024, 7, 1, 8), "raise", "raise", datetime(2024, 7, 1, 12)),
+        (datetime(2024, 11, 3, 1, 30), "earliest", "raise", datetime(2024, 11, 3, 5, 30)),
+        (datetime(2024, 11, 3, 1, 30), "latest", "raise", datetime(2024, 11, 3, 6, 30)),
+        (datetime(2024, 3, 10, 2, 30), "raise", "shift_forward", datetime(2024, 3, 10, 7)),
+        (
+            datetime(2024, 3, 10, 2, 30),
+            "raise",
+            "shift_backward",
+            datetime(2024, 3, 10, 6, 59, 59, 999999, 999999999, 999999999),
+        ),
+    ],
+)
+def test_datetime_array_tz_localize(
+    wall: hightime.datetime, ambiguous: str, nonexistent: str, expected: hightime.datetime
+) -> None:
+    array = hightime.DatetimeArray([wall])
+
+    localized = array.tz_localize(
+        _EASTERN, ambiguous=ambiguous, nonexistent=nonexistent  # type: ignore[arg-type]
+    )
+
+    assert localized.tzinfo is _EASTERN
+    assert localized.tz_convert(None)[0] == expected
+
+
+@pytest.mark.parametrize("wall", [datetime(2024, 11, 3, 1, 30), datetime(2024, 3, 10, 2, 30)])
+def test_datetime_array_tz_localize_raises(wall: hightime.datetime) -> None:
+    with pytest.raises(ValueError):
+        hightime.DatetimeArray([wall]).tz_localize(_EASTERN)
+
+
+@pytest.mark.parametrize("tzinfo", [_PLUS_ONE, _EASTERN])
+def test_datetime_array_tz_localize_roundtrip(tzinfo: std_datetime.tzinfo) -> None:
+    array = hightime.DatetimeArray([datetime(2024, 1, 1, 12, ys=1), datetime(2024, 7, 1, 12, fs=2)])
+
+    localized = array.tz_localize(tzinfo)
+
+    assert [dt.replace(tzinfo=None) for dt in localized] == list(array)
+    assert localized.tz_localize(None) == array
+
+
+def test_datetime_array_tz_localize_invalid() -> None:
+    naive = hightime.DatetimeArray([datetime(2024, 1, 1)])
+
+    with pytest.raises(ValueError):
+        naive.tz_localize(None)
+    with pytest.raises(ValueError):
+        naive.tz_localize(_UTC).tz_localize(_EASTERN)
+    with pytest.raises(ValueError):
+        naive.tz_localize(_EASTERN, ambiguous="first")  # type: ignore[arg-type]
+
+
+_TIMEDELTAS = [
+    timedelta(),
+    timedelta(ys=1),
+    timedelta(ys=-1),
+    timedelta(d=-999999999),
+    timedelta(d=999999999, s=86399, us=999999, fs=999999999, ys=999999999),
+]
+
+
+def test_timedelta_array_roundtrip() -> None:
+    array = hightime.TimedeltaArray(_TIMEDELTAS)
+
+    assert len(array) == len(_TIMEDELTAS)
+    assert array.tolist() == _TIMEDELTAS
+    assert all(isinstance(td, hightime.timedelta) for td in array)
+    assert hightime.TimedeltaArray.frombuffer(array.tobytes()) == array
+
+
+@pytest.mark.parametrize("index", [slice(None), slice(1, 4), slice(None, None, -2)])
+def test_timedelta_array_slice(index: slice) -> None:
+    array = hightime.TimedeltaArray(_TIMEDELTAS)
+
+    assert array[index].tolist() == _TIMEDELTAS[index]
+    assert array[index][-1] == _TIMEDELTAS[index][-1]
+
+
+def test_timedelta_array_sum() -> None:
+    values = [timedelta(s=1), timedelta(ys=1), timedelta(ms=-2)]
+
+    assert hightime.TimedeltaArray(values).sum() == timedelta(ms=998, ys=1)
+    assert hightime.TimedeltaArray().sum() == timedelta()
+
+
+def test_timedelta_array_eq_and_repr() -> None:
+    array = hightime.TimedeltaArray([timedelta(ys=1)])
+
+    assert array == hightime.TimedeltaArray([timedelta(ys=1)])
+    assert array != hightime.TimedeltaArray([timedelta(ys=2)])
+    assert array != hightime.DatetimeArray([datetime(1970, 1, 1, ys=1)])
+    assert repr(array) == "hightime.TimedeltaArray([hightime.timedelta(yoctoseconds=1)])"
+
+
+def test_timedelta_array_index_error() -> None:
+    with pytest.raises(IndexError):
+        hightime.TimedeltaArray()[0]
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import io
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator
+
+import pytest
+
+import hightime
+import hightime.bulk
+from tests.shorthands import datetime, timedelta
+
+_UTC = std_datetime.timezone.utc
+
+_DATETIMES = [datetime(2024, 2, 28, 23, 59) + timedelta(s=i, ms=i, ys=i) for i in range(200)]
+
+
+@pytest.fixture(scope="module")
+def executor() -> Iterator[ProcessPoolExecutor]:
+    with ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+def _text(datetimes: list[hightime.datetime]) -> bytes:
+    return "".join(dt.isoformat() + "\n" for dt in datetimes).encode("ascii")
+
+
+@pytest.mark.parametrize(
+    "data, chunk_size, expected",
+    [
+        (b"", 4, []),
+        (b"a\nbb\nccc\n", 1, [(0, 2), (2, 5), (5, 9)]),
+        (b"a\nbb\nccc\n", 3, [(0, 5), (5, 9)]),
+        (b"a\nbb\nccc", 100, [(0, 8)]),
+        (b"a\nbb\nccc", 5, [(0, 5), (5, 8)]),
+    ],
+)
+def test_line_chunks(data: bytes, chunk_size: int, expected: list[tuple[int, int]]) -> None:
+    assert hightime.bulk.line_chunks(data, chunk_size) == expected
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        (b"2024-01-02T03:04:05", datetime(2024, 1, 2, 3, 4, 5)),
+        (b"2024-01-02 03:04:05.5", datetime(2024, 1, 2, 3, 4, 5, 500000)),
+        (
+            b"2024-01-02T03:04:05.123456789012345678901234",
+            datetime(2024, 1, 2, 3, 4, 5, 123456, 789012345, 678901234),
+        ),
+        (b"2024-01-02T03:04:05Z", datetime(2024, 1, 2, 3, 4, 5)),
+        (b"2024-01-02T03:04:05.25-05:30", datetime(2024, 1, 2, 8, 34, 5, 250000)),
+        (b"2024-01-01T00:00:00+01:00", datetime(2023, 12, 31, 23)),
+        (b"  2024-01-02T03:04:05\r", datetime(2024, 1, 2, 3, 4, 5)),
+    ],
+)
+def test_parse_array_iso(line: bytes, expected: hightime.datetime) -> None:
+    assert list(hightime.bulk.parse_array(line, max_workers=1)) == [expected]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        b"2024-01-02",
+        b"2024-01-02T03:04",
+        b"2024-02-30T00:00:00",
+        b"2024-01-02T24:00:00",
+        b"2024-01-02T03:04:05.1234567890123456789012345",
+        b"2024-01-02T03:04:05+24:00",
+    ],
+)
+def test_parse_array_invalid(line: bytes) -> None:
+    with pytest.raises(ValueError):
+        hightime.bulk.parse_array(line, max_workers=1)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, 1000, hightime.bulk.DEFAULT_CHUNK_SIZE])
+def test_parse_chunks_in_order(executor: ProcessPoolExecutor, chunk_size: int) -> None:
+    data = _text(_DATETIMES)
+
+    chunks = list(hightime.bulk.parse_chunks(data, chunk_size=chunk_size, executor=executor))
+
+    assert len(chunks) == len(hightime.bulk.line_chunks(data, chunk_size))
+    assert [dt for chunk in chunks for dt in chunk] == _DATETIMES
+
+
+def test_parse_packed_from_path(executor: ProcessPoolExecutor, tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "times.txt"
+    path.write_bytes(b"\n" + _text(_DATETIMES) + b"\n")
+
+    packed = list(hightime.bulk.parse_packed(path, chunk_size=500, executor=executor))
+
+    assert b"".join(packed) == hightime.DatetimeArray(_DATETIMES).tobytes()
+
+
+def test_parse_empty_path(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "times.txt"
+    path.write_bytes(b"")
+
+    assert hightime.bulk.parse_array(path) == hightime.DatetimeArray()
+
+
+def test_parse_array_tzinfo() -> None:
+    array = hightime.bulk.parse_array(_text(_DATETIMES[:5]), tzinfo=_UTC, max_workers=1)
+
+    assert array.tzinfo is _UTC
+    assert list(array) == [dt.replace(tzinfo=_UTC) for dt in _DATETIMES[:5]]
+
+
+def test_parse_array_format() -> None:
+    data = b"02/01/2024 03:04:05.123456789\n"
+
+    array = hightime.bulk.parse_array(data, format="%d/%m/%Y %H:%M:%S.%9f", max_workers=1)
+
+    assert list(array) == [datetime(2024, 1, 2, 3, 4, 5, 123456, 789000000)]
+
+
+@pytest.mark.parametrize(
+    "datetimes", [_DATETIMES, hightime.DatetimeArray(_DATETIMES), iter(_DATETIMES)]
+)
+def test_format_lines_roundtrip(
+    executor: ProcessPoolExecutor, datetimes: Iterable[hightime.datetime] | hightime.DatetimeArray
+) -> None:
+    output = io.BytesIO()
+
+    count = hightime.bulk.format_lines(datetimes, output, chunk_size=7, executor=executor)
+
+    assert count == len(_DATETIMES)
+    assert output.getvalue() == _text(_DATETIMES)
+    assert list(hightime.bulk.parse_array(output.getvalue(), executor=executor)) == _DATETIMES
+
+
+def test_format_lines_to_path(executor: ProcessPoolExecutor, tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "times.txt"
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=2))
+
+    hightime.bulk.format_lines(_DATETIMES, path, tzinfo=tz, sep=" ", executor=executor)
+
+    lines = path.read_text().splitlines()
+    assert lines == [dt.replace(tzinfo=_UTC).astimezone(tz).isoformat(" ") for dt in _DATETIMES]
+    assert list(hightime.bulk.parse_array(path, executor=executor)) == _DATETIMES
+
+
+def test_format_lines_format() -> None:
+    output = io.BytesIO()
+
+    hightime.bulk.format_lines(_DATETIMES[:2], output, format="%H:%M:%S.%12f", max_workers=1)
+
+    assert output.getvalue() == b"23:59:00.000000000000\n23:59:01.001000000000\n"
+
+
+def test_format_lines_empty() -> None:
+    output = io.BytesIO()
+
+    assert hightime.bulk.format_lines([], output, max_workers=1) == 0
+    assert output.getvalue() == b""
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import struct
+from typing import Any
+
+import pytest
+
+import hightime
+import hightime.codecs
+from tests.shorthands import datetime, timedelta
+
+_UTC = std_datetime.timezone.utc
+
+
+@pytest.mark.parametrize(
+    "name, value, expected",
+    [
+        ("unix_ns", 0, datetime(1970, 1, 1, tzinfo=_UTC)),
+        ("unix_ns", 1704067200_000000001, datetime(2024, 1, 1, fs=1000000, tzinfo=_UTC)),
+        ("unix_ns", -1, datetime(1969, 12, 31, 23, 59, 59, 999999, 999000000, tzinfo=_UTC)),
+        ("ntp", 0, datetime(1900, 1, 1, tzinfo=_UTC)),
+        ("ntp", (3913056000 << 32) | (1 << 31), datetime(2024, 1, 1, us=500000, tzinfo=_UTC)),
+        # 2**-32 s = 232.83064365386962890625 ps
+        ("ntp", (3913056000 << 32) | 1, datetime(2024, 1, 1, fs=232830, ys=643653870, tzinfo=_UTC)),
+        # PTP and GPS time are ahead of UTC by the leap seconds (37 s and 18 s in 2024).
+        ("ptp", (1704067237, 0), datetime(2024, 1, 1, tzinfo=_UTC)),
+        (
+            "ptp",
+            (1704067237, 999999999),
+            datetime(2024, 1, 1, us=999999, fs=999000000, tzinfo=_UTC),
+        ),
+        ("gps", (0, 0), datetime(1980, 1, 6, tzinfo=_UTC)),
+        (
+            "gps",
+            (2295, 86418 * 10**9 + 1),
+            datetime(2024, 1, 1, fs=1000000, tzinfo=_UTC),
+        ),
+        ("lv", (0, 0), datetime(1904, 1, 1, tzinfo=_UTC)),
+        ("lv", (3786912000, 2**63), datetime(2024, 1, 1, us=500000, tzinfo=_UTC)),
+    ],
+)
+def test_codec_decode(name: str, value: Any, expected: hightime.datetime) -> None:
+    codec = hightime.codecs.lookup(name)
+    dt = codec.decode(value)
+    assert isinstance(dt, hightime.datetime)
+    assert dt == expected
+    assert dt.tzinfo is _UTC
+    assert codec.encode(dt) == value
+
+
+@pytest.mark.parametrize(
+    "name, to_scale",
+    [("ptp", hightime.datetime.to_tai), ("gps", hightime.datetime.to_gps)],
+)
+@pytest.mark.parametrize(
+    "dt",
+    [
+        datetime(2016, 12, 31, 23, 59, 59, tzinfo=_UTC),
+        datetime(2017, 1, 1, tzinfo=_UTC),
+        datetime(2017, 1, 1, fs=1000000, tzinfo=_UTC),
+    ],
+)
+def test_codec_applies_leap_seconds(name: str, to_scale: Any, dt: hightime.datetime) -> None:
+    codec = hightime.codecs.lookup(name)
+    value = codec.encode(dt)
+    epoch = hightime.datetime._from_epoch_ys(codec.epoch_ys)
+    assert codec.encode_timedelta(to_scale(dt) - epoch) == value
+    assert codec.decode(value) == dt
+    assert codec.decode_many(codec.encode_many([dt])) == [dt]
+
+
+def test_codec_decode_tz() -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=2))
+    dt = hightime.codecs.lookup("unix_ns").decode(1, tz=tz)
+    assert dt.tzinfo is tz
+    assert dt == datetime(1970, 1, 1, 2, fs=1000000, tzinfo=tz)
+
+
+@pytest.mark.parametrize(
+    "name, dt, expected",
+    [
+        # Rounds half to even
+        ("unix_ns", datetime(1970, 1, 1, fs=500000, tzinfo=_UTC), 0),
+        ("unix_ns", datetime(1970, 1, 1, fs=1500000, tzinfo=_UTC), 2),
+        ("unix_ns", datetime(1970, 1, 1, fs=1501000, tzinfo=_UTC), 2),
+        ("ptp", datetime(2024, 1, 1, 0, 0, 0, 999999, 999500000, tzinfo=_UTC), (1704067238, 0)),
+        ("gps", datetime(1980, 1, 12, 23, 59, 59, 999999, 999999999, 1, tzinfo=_UTC), (1, 0)),
+        ("ntp", datetime(1900, 1, 1, fs=116000, tzinfo=_UTC), 0),
+        ("ntp", datetime(1900, 1, 1, fs=117000, tzinfo=_UTC), 1),
+    ],
+)
+def test_codec_encode_rounds(name: str, dt: hightime.datetime, expected: Any) -> None:
+    assert hightime.codecs.lookup(name).encode(dt) == expected
+
+
+@pytest.mark.parametrize(
+    "name, dt",
+    [
+        ("ntp", datetime(1899, 12, 31, tzinfo=_UTC)),
+        ("ntp", datetime(2036, 2, 8, tzinfo=_UTC)),
+        ("ptp", datetime(1969, 12, 31, tzinfo=_UTC)),
+    ],
+)
+def test_codec_encode_out_of_range(name: str, dt: hightime.datetime) -> None:
+    with pytest.raises(OverflowError):
+        hightime.codecs.lookup(name).encode(dt)
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("ntp", -1),
+        ("ntp", 2**64),
+        ("ptp", (-1, 0)),
+        ("ptp", (0, 10**9)),
+        ("gps", (0, -1)),
+        ("gps", (0, 7 * 86400 * 10**9)),
+        ("lv", (0, 2**64)),
+    ],
+)
+def test_codec_decode_invalid(name: str, value: Any) -> None:
+    with pytest.raises(ValueError):
+        hightime.codecs.lookup(name).decode(value)
+
+
+@pytest.mark.parametrize(
+    "name, value, expected",
+    [
+        ("unix_ns", 1, timedelta(ns=1)),
+        ("unix_ns", -1, timedelta(ns=-1)),
+        ("ntp", 1 << 32, timedelta(s=1)),
+        ("ptp", (1, 1), timedelta(s=1, ns=1)),
+        ("gps", (1, 1), timedelta(w=1, ns=1)),
+        ("lv", (1, 2**63), timedelta(s=1.5)),
+    ],
+)
+def test_codec_timedelta(name: str, value: Any, expected: hightime.timedelta) -> None:
+    codec = hightime.codecs.lookup(name)
+    td = codec.decode_timedelta(value)
+    assert isinstance(td, hightime.timedelta)
+    assert td == expected
+    assert codec.encode_timedelta(td) == value
+
+
+_BULK_VALUES: dict[str, list[Any]] = {
+    "unix_ns": [0, 1, -1, 1704067200_000000001],
+    "ntp": [0, 1, (3913056000 << 32) | 1, 2**64 - 1],
+    "ptp": [(0, 0), (1, 1), (1704067200, 999999999), (2**33 + 5, 7)],
+    "gps": [(0, 0), (2295, 1), (3000, 7 * 86400 * 10**9 - 1)],
+    "lv": [(0, 0), (3786912000, 1), (-1, 2**64 - 1)],
+}
+
+
+@pytest.mark.parametrize(
+    "name, fmt",
+    [("unix_ns", "<q"), ("ntp", ">Q"), ("ptp", ">HII"), ("gps", "<Iq"), ("lv", "<Qq")],
+)
+def test_codec_bulk_roundtrip(name: str, fmt: str) -> None:
+    codec = hightime.codecs.lookup(name)
+    values = _BULK_VALUES[name]
+    fields: list[tuple[int, ...]]
+    if name == "ptp":
+        fields = [(s >> 32, s & 0xFFFFFFFF, ns) for s, ns in values]
+    elif name == "lv":
+        fields = [(f, s) for s, f in values]
+    else:
+        fields = [v if isinstance(v, tuple) else (v,) for v in values]
+    data = b"".join(struct.pack(fmt, *f) for f in fields)
+
+    dts = codec.decode_many(data)
+    assert dts == [codec.decode(value) for value in values]
+    assert codec.encode_many(dts) == data
+
+    tds = codec.decode_timedelta_many(memoryview(data))
+    assert tds == [codec.decode_timedelta(value) for value in values]
+    assert codec.encode_timedelta_many(tds) == data
+
+
+def test_codec_encode_many_out() -> None:
+    codec = hightime.codecs.lookup("unix_ns")
+    out = bytearray(24)
+    assert codec.encode_many([datetime(1970, 1, 1, fs=1000000, tzinfo=_UTC)], out=out) is out
+    assert out == struct.pack("<qqq", 1, 0, 0)
+    with pytest.raises(ValueError):
+        codec.encode_many([datetime(1970, 1, 1, tzinfo=_UTC)] * 4, out=out)
+
+
+def test_codec_decode_many_partial_record() -> None:
+    with pytest.raises(ValueError):
+        hightime.codecs.lookup("ptp").decode_many(bytes(11))
+
+
+def test_codec_names() -> None:
+    assert hightime.codecs.names() == ["gps", "lv", "ntp", "ptp", "unix_ns"]
+
+
+def test_codec_lookup_is_case_insensitive() -> None:
+    assert hightime.codecs.lookup("NTP") is hightime.codecs.lookup("ntp")
+
+
+def test_codec_lookup_unknown() -> None:
+    with pytest.raises(LookupError):
+        hightime.codecs.lookup("nope")
+
+
+def test_codec_register() -> None:
+    class MillisecondsCodec(hightime.codecs.UnixNanosecondsCodec):
+        name = "test_unix_ms"
+        record = struct.Struct("<q")
+
+        def to_ys(self, value: int) -> int:
+            return value * 10**21
+
+        def from_ys(self, ys: int) -> int:
+            return ys // 10**21
+
+    codec = MillisecondsCodec()
+    hightime.codecs.register(codec)
+    try:
+        assert hightime.codecs.lookup("test_unix_ms") is codec
+        assert codec.decode(1) == datetime(1970, 1, 1, us=1000, tzinfo=_UTC)
+        assert codec.decode_many(struct.pack("<q", 2)) == [
+            datetime(1970, 1, 1, us=2000, tzinfo=_UTC)
+        ]
+    finally:
+        hightime.codecs._REGISTRY.pop("test_unix_ms")
+
+
+def test_codec_register_invalid() -> None:
+    with pytest.raises(TypeError):
+        hightime.codecs.register(object())  # type: ignore[arg-type]
+
+
+def test_codec_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        hightime.codecs.Codec()  # type: ignore[abstract]
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import io
+import pickle
+import random
+
+import pytest
+
+import hightime
+import hightime.compress
+from tests.shorthands import datetime, timedelta
+
+_UTC = std_datetime.timezone.utc
+
+
+def _regular(count: int, period: hightime.timedelta) -> list[hightime.datetime]:
+    clock = hightime.SampleClock(datetime(2024, 1, 1), period)
+    return list(clock.iter_times(0, count))
+
+
+def _jittered(count: int) -> list[hightime.datetime]:
+    rng = random.Random(1234)
+    return [
+        datetime(2024, 1, 1) + timedelta(ms=i, ns=rng.randrange(-500, 500), ys=rng.randrange(10**9))
+        for i in range(count)
+    ]
+
+
+_SERIES = {
+    "empty": [],
+    "single": [datetime(2024, 1, 1, fs=1, ys=2)],
+    "regular": _regular(2000, timedelta(us=1)),
+    "jittered": _jittered(2000),
+    "unsorted": [
+        datetime(2024, 1, 3),
+        datetime(1, 1, 1),
+        datetime(9999, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+        datetime(1970, 1, 1),
+    ],
+    "repeated": [datetime(2024, 1, 1)] * 100,
+}
+
+
+@pytest.mark.parametrize("name", list(_SERIES))
+@pytest.mark.parametrize("block_size", [1, 7, hightime.compress.DEFAULT_BLOCK_SIZE])
+def test_compress_roundtrip(name: str, block_size: int) -> None:
+    series = _SERIES[name]
+
+    blocks = list(hightime.compress.encode(series, block_size))
+
+    assert len(blocks) == -(-len(series) // block_size)
+    assert list(hightime.compress.decode(b"".join(blocks))) == series
+    assert list(hightime.compress.decode(iter(blocks))) == series
+    assert list(hightime.compress.decode_array(blocks)) == series
+    assert list(hightime.compress.CompressedDatetimes(b"".join(blocks))) == series
+
+
+def test_compress_regular_series_is_small() -> None:
+    series = _SERIES["regular"]
+
+    data = hightime.compress.encode_bytes(series)
+
+    assert len(data) * 20 < len(pickle.dumps(series))
+    assert len(data) * 20 < sum(len(dt.isoformat()) for dt in series)
+
+
+def test_compress_encode_is_lazy() -> None:
+    def generate() -> object:
+        yield datetime(2024, 1, 1)
+        yield datetime(2024, 1, 2)
+        raise AssertionError("consumed too far")
+
+    encoder = hightime.compress.encode(generate(), block_size=2)  # type: ignore[arg-type]
+
+    assert list(hightime.compress.decode(next(encoder))) == [
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 2),
+    ]
+
+
+def test_compress_aware_values_are_stored_in_utc() -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=3))
+    data = hightime.compress.encode_bytes([datetime(2024, 1, 1, 3, ys=1, tzinfo=tz)])
+
+    assert list(hightime.compress.decode(data)) == [datetime(2024, 1, 1, ys=1)]
+    assert list(hightime.compress.decode(data, tzinfo=tz)) == [
+        datetime(2024, 1, 1, 3, ys=1, tzinfo=tz)
+    ]
+
+
+def test_compress_datetime_array() -> None:
+    array = hightime.DatetimeArray(_SERIES["jittered"], tzinfo=_UTC)
+
+    data = hightime.compress.encode_bytes(array)
+    result = hightime.compress.decode_array(data, tzinfo=_UTC)
+
+    assert result == array
+    assert hightime.compress.encode_bytes(array[::3]) == hightime.compress.encode_bytes(
+        _SERIES["jittered"][::3]
+    )
+
+
+def test_compress_decode_chunks_split_anywhere() -> None:
+    series = _SERIES["jittered"]
+    data = hightime.compress.encode_bytes(series, block_size=100)
+    stream = io.BytesIO(data)
+
+    assert list(hightime.compress.decode(iter(lambda: stream.read(13), b""))) == series
+
+
+@pytest.mark.parametrize("cut", [1, 5, -1])
+def test_compress_decode_truncated(cut: int) -> None:
+    data = hightime.compress.encode_bytes(_SERIES["jittered"][:10])
+
+    with pytest.raises(ValueError):
+        list(hightime.compress.decode(data[:cut]))
+    with pytest.raises(ValueError):
+        hightime.compress.CompressedDatetimes(data[:cut])
+
+
+def test_compress_decode_corrupt_length() -> None:
+    data = bytearray(hightime.compress.encode_bytes(_SERIES["jittered"][:10]))
+    data[0] -= 1
+
+    with pytest.raises(ValueError):
+        list(hightime.compress.decode(bytes(data)))
+
+
+def test_compress_invalid_block_size() -> None:
+    with pytest.raises(ValueError):
+        list(hightime.compress.encode([datetime(2024, 1, 1)], block_size=0))
+
+
+def test_compress_concatenated_streams() -> None:
+    first = _SERIES["regular"][:10]
+    second = _SERIES["jittered"][:10]
+
+    data = hightime.compress.encode_bytes(first) + hightime.compress.encode_bytes(second)
+
+    assert list(hightime.compress.decode(data)) == first + second
+
+
+def test_compressed_datetimes_random_access() -> None:
+    series = _SERIES["jittered"]
+    compressed = hightime.compress.CompressedDatetimes(
+        bytearray(hightime.compress.encode_bytes(series, block_size=64)), tzinfo=None
+    )
+
+    assert len(compressed) == len(series)
+    assert compressed.block_count == -(-len(series) // 64)
+    for index in [0, 1, 63, 64, 65, 1999, -1, -2000, 1000, 10]:
+        assert compressed[index] == series[index]
+    assert list(compressed[100:300:7]) == series[100:300:7]
+    assert list(compressed[::-1]) == series[::-1]
+    assert list(compressed.block(1)) == series[64:128]
+    assert compressed.to_array() == hightime.DatetimeArray(series)
+
+
+@pytest.mark.parametrize("index", [2000, -2001])
+def test_compressed_datetimes_index_error(index: int) -> None:
+    compressed = hightime.compress.CompressedDatetimes(
+        hightime.compress.encode_bytes(_SERIES["jittered"])
+    )
+
+    with pytest.raises(IndexError):
+        compressed[index]
+
+
+def test_compressed_datetimes_tzinfo() -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=-1))
+    compressed = hightime.compress.CompressedDatetimes(
+        hightime.compress.encode_bytes([datetime(2024, 1, 1)]), tzinfo=tz
+    )
+
+    assert compressed.tzinfo is tz
+    assert compressed[0] == datetime(2023, 12, 31, 23, tzinfo=tz)
+    assert compressed[:].tzinfo is tz
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import array
 import copy
 import datetime as std_datetime
 import pickle
+import struct
 from decimal import Decimal
-from typing import Any, SupportsIndex, Type
+from typing import Any, Literal, SupportsIndex, Type
 
 import pytest
 
@@ -230,6 +232,51 @@ def test_datetime_str(dt: hightime.datetime, expected: str) -> None:
     assert "{}".format(dt) == expected
 
 
+@pytest.mark.parametrize(
+    "fmt, expected",
+    [
+        ("%Y-%m-%d %H:%M:%S", "2020-04-20 15:10:33"),
+        ("%S.%f", "33.976508"),
+        ("%S.%1f", "33.9"),
+        ("%S.%3f", "33.976"),
+        ("%S.%9f", "33.976508569"),
+        ("%S.%12f", "33.976508569718"),
+        ("%S.%15f", "33.976508569718000"),
+        ("%S.%18f", "33.976508569718000529"),
+        ("%S.%21f", "33.976508569718000529850"),
+        ("%S.%24f", "33.976508569718000529850102"),
+        ("%9f%9f", "976508569976508569"),
+        ("%%9f", "%9f"),
+        ("%%%9f", "%976508569"),
+        ("no directives", "no directives"),
+        ("%H:%M %12f %%", "15:10 976508569718 %"),
+    ],
+)
+def test_datetime_strftime(fmt: str, expected: str) -> None:
+    dt = datetime(2020, 4, 20, 15, 10, 33, 976508, 569718000, 529850102)
+    assert dt.strftime(fmt) == expected
+    assert dt.strftime(fmt) == expected  # cached
+    assert format(dt, fmt) == expected
+    assert f"{dt:{fmt}}" == expected
+
+
+def test_datetime_strftime_zero_fraction() -> None:
+    assert datetime(2020, 4, 20).strftime("%24f") == "0" * 24
+
+
+@pytest.mark.parametrize("fmt", ["%0f", "%25f"])
+def test_datetime_strftime_invalid_digits(fmt: str) -> None:
+    with pytest.raises(ValueError):
+        datetime().strftime(fmt)
+
+
+def test_datetime_strftime_unrelated_type() -> None:
+    with pytest.raises(TypeError):
+        datetime().strftime(1)  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        datetime().__format__(1)  # type: ignore[arg-type]
+
+
 @pytest.mark.parametrize(
     "left, right, eq, lt",
     [
@@ -552,6 +599,31 @@ def test_datetime_astimezone_type() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "dt",
+    [
+        datetime(2024, 3, 10, 6, 59, 59, 999999, 999999999, 999999999, tzinfo=tzinfo(hours=0)),
+        datetime(2024, 3, 10, 7, tzinfo=tzinfo(hours=0)),
+        datetime(2024, 11, 3, 5, 30, ys=1, tzinfo=tzinfo(hours=0)),
+        datetime(2024, 11, 3, 6, 30, ys=1, tzinfo=tzinfo(hours=0)),
+        datetime(1900, 1, 1, tzinfo=tzinfo(hours=2)),
+        datetime(2040, 6, 1, fs=3, tzinfo=tzinfo(hours=-3)),
+    ],
+)
+@pytest.mark.parametrize("zone", ["America/New_York", "Europe/Dublin", "Australia/Lord_Howe"])
+def test_datetime_astimezone_zoneinfo(dt: hightime.datetime, zone: str) -> None:
+    import zoneinfo
+
+    tz = zoneinfo.ZoneInfo(zone)
+
+    result = dt.astimezone(tz)
+
+    expected = std_datetime.datetime.astimezone(dt, tz)
+    assert (result.timetuple(), result.fold) == (expected.timetuple(), expected.fold)
+    assert (result.femtosecond, result.yoctosecond) == (dt.femtosecond, dt.yoctosecond)
+    assert result == dt
+
+
 def test_datetime_replace() -> None:
     dt = datetime()
     assert dt == dt.replace()
@@ -711,3 +783,304 @@ def test_datetime_pickle_uses_public_package_name() -> None:
     dt_bytes = pickle.dumps(dt)
     assert b"hightime" in dt_bytes
     assert b"hightime._datetime" not in dt_bytes
+
+
+@pytest.mark.parametrize(
+    "date_string, fmt, expected",
+    [
+        (
+            "2024-01-02 03:04:05.123456789012",
+            "%Y-%m-%d %H:%M:%S.%12f",
+            datetime(2024, 1, 2, 3, 4, 5, 123456, 789012000),
+        ),
+        (
+            "2024-01-02T03:04:05.123456789012345678901234",
+            "%Y-%m-%dT%H:%M:%S.%24f",
+            datetime(2024, 1, 2, 3, 4, 5, 123456, 789012345, 678901234),
+        ),
+        ("05.1", "%S.%9f", datetime(1900, 1, 1, s=5, us=100000)),
+        ("05.000000001", "%S.%9f", datetime(1900, 1, 1, s=5, fs=1000000)),
+        ("0512", "%S%3f", datetime(1900, 1, 1, s=5, us=120000)),
+        (
+            "05.000000000000000000000001 +0100",
+            "%S.%24f %z",
+            datetime(
+                1900, 1, 1, s=5, ys=1, tzinfo=std_datetime.timezone(std_datetime.timedelta(hours=1))
+            ),
+        ),
+        ("24/032 05.5", "%y/%j %S.%3f", datetime(2024, 2, 1, s=5, us=500000)),
+        (
+            "05.5Z",
+            "%S.%9f%z",
+            datetime(1900, 1, 1, s=5, us=500000, tzinfo=std_datetime.timezone.utc),
+        ),
+        (
+            "05.5 -01:30",
+            "%S.%9f   %z",
+            datetime(
+                1900,
+                1,
+                1,
+                s=5,
+                us=500000,
+                tzinfo=std_datetime.timezone(-std_datetime.timedelta(hours=1, minutes=30)),
+            ),
+        ),
+        ("Jan 02 2024 3:04:05", "%b %d %Y %H:%M:%S", datetime(2024, 1, 2, 3, 4, 5)),
+    ],
+)
+def test_datetime_strptime(date_string: str, fmt: str, expected: hightime.datetime) -> None:
+    dt = hightime.datetime.strptime(date_string, fmt)
+    assert isinstance(dt, hightime.datetime)
+    assert dt == expected
+    assert dt.tzinfo == expected.tzinfo
+    assert hightime.datetime.strptime(date_string, fmt) == expected  # cached
+
+
+def test_datetime_strptime_roundtrips_strftime() -> None:
+    dt = datetime(2020, 4, 20, 15, 10, 33, 976508, 569718000, 529850102)
+    fmt = "%Y-%m-%d %H:%M:%S.%24f"
+    assert hightime.datetime.strptime(dt.strftime(fmt), fmt) == dt
+
+
+@pytest.mark.parametrize(
+    "date_string, fmt",
+    [
+        ("05.1234", "%S.%3f"),
+        ("05.", "%S.%9f"),
+        ("05.1 trailing", "%S.%9f"),
+        ("xx.1", "%S.%9f"),
+        ("05.1.2", "%S.%9f.%9f"),
+        ("05.1", "%S.%25f"),
+        ("Jan 05.1", "%b %S.%9f"),
+        ("05 05.1", "%S %S.%9f"),
+        ("30/02 05.1", "%d/%m %S.%9f"),
+    ],
+)
+def test_datetime_strptime_invalid(date_string: str, fmt: str) -> None:
+    with pytest.raises(ValueError):
+        hightime.datetime.strptime(date_string, fmt)
+
+
+def test_datetime_strptime_unrelated_type() -> None:
+    with pytest.raises(TypeError):
+        hightime.datetime.strptime(b"05.1", "%S.%9f")  # type: ignore[arg-type]
+    with pytest.raises(TypeError):
+        hightime.datetime.strptime("05.1", 1)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "date_strings",
+    [
+        ["03:04:05.000000000001", "03:04:06.5"],
+        "03:04:05.000000000001\n03:04:06.5\n",
+        b"03:04:05.000000000001\r\n03:04:06.5",
+        memoryview(b"03:04:05.000000000001\n03:04:06.5"),
+        iter(["03:04:05.000000000001", "03:04:06.5"]),
+    ],
+)
+def test_datetime_strptime_many(date_strings: Any) -> None:
+    assert hightime.datetime.strptime_many(date_strings, "%H:%M:%S.%12f") == [
+        datetime(1900, 1, 1, 3, 4, 5, fs=1000),
+        datetime(1900, 1, 1, 3, 4, 6, 500000),
+    ]
+
+
+def test_datetime_strptime_many_without_extended_directives() -> None:
+    assert hightime.datetime.strptime_many(["2024-01-02"], "%Y-%m-%d") == [datetime(2024, 1, 2)]
+
+
+_LV_EPOCH = hightime.datetime(1904, 1, 1, tzinfo=std_datetime.timezone.utc)
+_UTC = std_datetime.timezone.utc
+
+
+@pytest.mark.parametrize(
+    "seconds, fraction, expected",
+    [
+        (0, 0, _LV_EPOCH),
+        (3786912000, 0, datetime(2024, 1, 1, tzinfo=_UTC)),
+        (3786912000, 2**63, datetime(2024, 1, 1, us=500000, tzinfo=_UTC)),
+        (3786912000, 2**62, datetime(2024, 1, 1, us=250000, tzinfo=_UTC)),
+        # 2**-64 s = 54.210108624275221700372640043497085571289062500 zs
+        (3786912000, 1, datetime(2024, 1, 1, ys=54210, tzinfo=_UTC)),
+        (
+            3786912000,
+            2**64 - 1,
+            datetime(2024, 1, 1, 0, 0, 0, 999999, 999999999, 999945790, tzinfo=_UTC),
+        ),
+        (-1, 0, datetime(1903, 12, 31, 23, 59, 59, tzinfo=_UTC)),
+        (-2082844800, 0, datetime(1837, 12, 30, tzinfo=_UTC)),
+    ],
+)
+def test_datetime_from_lv_timestamp(
+    seconds: int, fraction: int, expected: hightime.datetime
+) -> None:
+    dt = hightime.datetime.from_lv_timestamp(seconds, fraction)
+    assert isinstance(dt, hightime.datetime)
+    assert dt == expected
+    assert dt.tzinfo is _UTC
+    assert dt.to_lv_timestamp() == (seconds, fraction)
+
+
+def test_datetime_from_lv_timestamp_tz() -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=-6))
+    dt = hightime.datetime.from_lv_timestamp(3786912000, 1, tz=tz)
+    assert dt.tzinfo is tz
+    assert dt == datetime(2023, 12, 31, 18, ys=54210, tzinfo=tz)
+
+
+def test_datetime_from_lv_timestamp_local() -> None:
+    dt = hightime.datetime.from_lv_timestamp(3786912000, 2**63, tz=None)
+    assert dt.tzinfo is None
+    assert dt == datetime(2024, 1, 1, us=500000, tzinfo=_UTC).astimezone().replace(tzinfo=None)
+    assert dt.to_lv_timestamp() == (3786912000, 2**63)
+
+
+@pytest.mark.parametrize("fraction", [-1, 2**64])
+def test_datetime_from_lv_timestamp_invalid_fraction(fraction: int) -> None:
+    with pytest.raises(ValueError):
+        hightime.datetime.from_lv_timestamp(0, fraction)
+
+
+@pytest.mark.parametrize(
+    "dt, expected",
+    [
+        # Rounds half to even to the nearest 2**-64 s
+        (datetime(2024, 1, 1, ys=27105, tzinfo=_UTC), (3786912000, 0)),
+        (datetime(2024, 1, 1, ys=27106, tzinfo=_UTC), (3786912000, 1)),
+        # Carries into the seconds
+        (
+            datetime(2024, 1, 1, 0, 0, 0, 999999, 999999999, 999999999, tzinfo=_UTC),
+            (3786912001, 0),
+        ),
+        (
+            datetime(2024, 1, 1, 1, tzinfo=std_datetime.timezone(std_datetime.timedelta(hours=1))),
+            (3786912000, 0),
+        ),
+    ],
+)
+def test_datetime_to_lv_timestamp(dt: hightime.datetime, expected: tuple[int, int]) -> None:
+    assert dt.to_lv_timestamp() == expected
+
+
+_LV_RECORDS = [
+    (3786912000, 0),
+    (3786912000, 1),
+    (3786912000, 2**63),
+    (3786912000, 2**64 - 1),
+    (-1, 12345),
+]
+
+
+@pytest.mark.parametrize(
+    "byteorder, fmt",
+    [("<", "<Qq"), (">", ">qQ")],
+)
+def test_datetime_from_lv_timestamps(byteorder: Literal["<", ">"], fmt: str) -> None:
+    if byteorder == "<":
+        data = b"".join(struct.pack(fmt, f, s) for s, f in _LV_RECORDS)
+    else:
+        data = b"".join(struct.pack(fmt, s, f) for s, f in _LV_RECORDS)
+
+    dts = hightime.datetime.from_lv_timestamps(data, byteorder=byteorder)
+    packed = hightime.datetime.to_lv_timestamps(dts, byteorder=byteorder)
+    assert dts == [hightime.datetime.from_lv_timestamp(s, f) for s, f in _LV_RECORDS]
+    assert packed == data
+
+
+def test_datetime_from_lv_timestamps_memoryview() -> None:
+    # Any buffer works, regardless of its item format.
+    words = array.array("Q", [2**63, 3786912000, 0, 3786912001])
+    assert hightime.datetime.from_lv_timestamps(memoryview(words)) == [
+        datetime(2024, 1, 1, us=500000, tzinfo=_UTC),
+        datetime(2024, 1, 1, s=1, tzinfo=_UTC),
+    ]
+
+
+def test_datetime_from_lv_timestamps_partial_record() -> None:
+    with pytest.raises(ValueError):
+        hightime.datetime.from_lv_timestamps(bytes(17))
+
+
+def test_datetime_from_lv_timestamps_invalid_byteorder() -> None:
+    with pytest.raises(ValueError):
+        hightime.datetime.from_lv_timestamps(bytes(16), byteorder="=")  # type: ignore[arg-type]
+
+
+def test_datetime_to_lv_timestamps_out() -> None:
+    dts = [hightime.datetime.from_lv_timestamp(s, f) for s, f in _LV_RECORDS]
+    out = bytearray(16 * len(dts) + 16)
+    assert hightime.datetime.to_lv_timestamps(dts, out=out) is out
+    assert bytes(out[:-16]) == hightime.datetime.to_lv_timestamps(dts)
+    assert bytes(out[-16:]) == bytes(16)
+
+    with pytest.raises(ValueError):
+        hightime.datetime.to_lv_timestamps(dts, out=bytearray(16))
+
+
+_SORTED_DATETIMES = [
+    datetime(1, 1, 1),
+    datetime(1969, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+    datetime(1970, 1, 1),
+    datetime(1970, 1, 1, ys=1),
+    datetime(2024, 1, 1, 1, tzinfo=std_datetime.timezone(std_datetime.timedelta(hours=2))),
+    datetime(2024, 1, 1),
+    datetime(2024, 1, 1, fs=1, tzinfo=std_datetime.timezone.utc),
+    datetime(9999, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+]
+
+
+@pytest.mark.parametrize(
+    "dt, expected",
+    [
+        (datetime(1970, 1, 1), "80000000000000000000000000000000"),
+        (datetime(1970, 1, 1, ys=1), "80000000000000000000000000000001"),
+        (
+            datetime(1969, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+            "7fffffffffffffffffffffffffffffff",
+        ),
+        (
+            datetime(1970, 1, 1, 1, tzinfo=std_datetime.timezone(std_datetime.timedelta(hours=1))),
+            "80000000000000000000000000000000",
+        ),
+    ],
+)
+def test_datetime_to_sort_key(dt: hightime.datetime, expected: str) -> None:
+    assert dt.to_sort_key().hex() == expected
+
+
+def test_datetime_sort_key_order() -> None:
+    keys = [dt.to_sort_key() for dt in _SORTED_DATETIMES]
+
+    assert all(len(key) == 16 for key in keys)
+    assert sorted(keys) == keys
+    assert sorted(_SORTED_DATETIMES[::-1], key=hightime.datetime.to_sort_key) == _SORTED_DATETIMES
+
+
+def test_datetime_from_sort_key() -> None:
+    utc = std_datetime.timezone.utc
+    for dt in _SORTED_DATETIMES:
+        key = dt.to_sort_key()
+
+        aware = hightime.datetime.from_sort_key(key, utc)
+        naive = hightime.datetime.from_sort_key(key)
+
+        assert aware == dt.replace(tzinfo=dt.tzinfo or utc)
+        assert aware.tzinfo is utc
+        assert naive == aware.replace(tzinfo=None)
+
+
+@pytest.mark.parametrize("key", [b"", bytes(15), bytes(17)])
+def test_datetime_from_sort_key_invalid_length(key: bytes) -> None:
+    with pytest.raises(ValueError):
+        hightime.datetime.from_sort_key(key)
+
+
+@pytest.mark.parametrize("make_input", [list, hightime.DatetimeArray])
+def test_datetime_to_sort_keys(make_input: Any) -> None:
+    keys = hightime.datetime.to_sort_keys(make_input(_SORTED_DATETIMES))
+
+    assert keys == [dt.to_sort_key() for dt in _SORTED_DATETIMES]
+    assert hightime.datetime.from_sort_keys(keys, std_datetime.timezone.utc) == [
+        hightime.datetime.from_sort_key(key, std_datetime.timezone.utc) for key in keys
+    ]
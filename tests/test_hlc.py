@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import threading
+from typing import Callable
+
+import pytest
+
+import hightime
+import hightime.hlc
+from tests.shorthands import datetime, timedelta
+
+_NS_2024 = 1704067200 * 10**9
+
+
+def _clock(*readings: int) -> Callable[[], int]:
+    return iter(readings).__next__
+
+
+def test_hlc_now_follows_physical_clock() -> None:
+    clock = hightime.hlc.Clock(_clock(_NS_2024, _NS_2024 + 3, _NS_2024 + 3, _NS_2024 - 1))
+
+    stamps = [clock.now() for _ in range(4)]
+
+    assert stamps == [
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 1, fs=3000000),
+        datetime(2024, 1, 1, fs=3000000, ys=1),
+        datetime(2024, 1, 1, fs=3000000, ys=2),
+    ]
+    assert clock.last == stamps[-1]
+
+
+@pytest.mark.parametrize(
+    "received, physical, expected",
+    [
+        # The received timestamp is ahead of both the clock and the physical time.
+        ((_NS_2024 + 10, 4), _NS_2024, (_NS_2024 + 10, 5)),
+        # The physical time is ahead of everything.
+        ((_NS_2024 - 10, 4), _NS_2024 + 20, (_NS_2024 + 20, 0)),
+        # The previous local timestamp is ahead of the received one.
+        ((_NS_2024 - 10, 4), _NS_2024 - 20, (_NS_2024, 1)),
+    ],
+)
+def test_hlc_update(received: tuple[int, int], physical: int, expected: tuple[int, int]) -> None:
+    clock = hightime.hlc.Clock(_clock(_NS_2024, physical))
+    clock.now()
+    nanoseconds, counter = received
+
+    result = clock.update(datetime(1970, 1, 1) + timedelta(ns=nanoseconds, ys=counter))
+
+    assert hightime.hlc.split(result) == expected
+
+
+def test_hlc_update_max_offset() -> None:
+    clock = hightime.hlc.Clock(_clock(_NS_2024, _NS_2024), max_offset=timedelta(ms=1))
+
+    assert clock.update(datetime(2024, 1, 1, us=1000)) == datetime(2024, 1, 1, us=1000, ys=1)
+    with pytest.raises(ValueError):
+        clock.update(datetime(2024, 1, 1, us=1001))
+    assert clock.last == datetime(2024, 1, 1, us=1000, ys=1)
+
+
+def test_hlc_keys() -> None:
+    clock = hightime.hlc.Clock(_clock(_NS_2024, _NS_2024))
+    other = hightime.hlc.Clock(_clock(_NS_2024 - 1))
+
+    key = clock.now_key()
+    received = other.update_key(key)
+    next_key = clock.update_key(received)
+
+    assert key < received < next_key
+    assert len(key) == 16
+    assert hightime.hlc.decode(key) == datetime(2024, 1, 1)
+    assert hightime.hlc.decode(next_key) == datetime(2024, 1, 1, ys=2)
+    assert hightime.hlc.encode(hightime.hlc.decode(received)) == received
+
+
+def test_hlc_split_aware() -> None:
+    plus_one = std_datetime.timezone(std_datetime.timedelta(hours=1))
+    dt = datetime(2024, 1, 1, 1, fs=2000000, ys=3, tzinfo=plus_one)
+
+    assert hightime.hlc.split(dt) == (_NS_2024 + 2, 3)
+
+
+def test_hlc_threads_unique() -> None:
+    clock = hightime.hlc.Clock(lambda: _NS_2024)
+    results: list[list[bytes]] = [[] for _ in range(8)]
+
+    def tick(result: list[bytes]) -> None:
+        for _ in range(1000):
+            result.append(clock.now_key())
+
+    threads = [threading.Thread(target=tick, args=(result,)) for result in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for result in results:
+        assert result == sorted(result)
+    assert len({key for result in results for key in result}) == 8000
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import platform
+import subprocess
+import sys
+
+import pytest
+
+# Generous, to avoid flakiness on slow CI machines. Importing hightime itself should take a few
+# milliseconds; the budget is meant to catch regressions such as expensive module-level
+# computations or heavyweight eager imports.
+_IMPORT_TIME_BUDGET_US = 250_000
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+@pytest.mark.parametrize("module", ["decimal", "fractions", "collections"])
+def test_import_does_not_import_module(module: str) -> None:
+    result = _run_python(f"import sys, hightime; print({module!r} in sys.modules)")
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.skipif(
+    platform.python_implementation() != "CPython", reason="-X importtime is CPython-specific"
+)
+def test_import_time_budget() -> None:
+    result = _run_python("import hightime", "-X", "importtime")
+    # Lines look like "import time:  self [us] | cumulative | imported package".
+    cumulative_us = [
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].strip() == "hightime"
+    ]
+    assert len(cumulative_us) == 1
+    assert cumulative_us[0] < _IMPORT_TIME_BUDGET_US
+
+
+def test_import_constants_are_exact() -> None:
+    result = _run_python(
+        "import hightime; "
+        "print(repr(hightime.datetime.min), repr(hightime.datetime.max), "
+        "repr(hightime.timedelta.min), repr(hightime.timedelta.max), "
+        "repr(hightime.timedelta.resolution), repr(hightime.datetime.resolution), sep='\\n')"
+    )
+    assert result.stdout.splitlines() == [
+        "hightime.datetime(1, 1, 1, 0, 0)",
+        "hightime.datetime(9999, 12, 31, 23, 59, 59, 999999, 999999999, 999999999)",
+        "hightime.timedelta(days=-999999999)",
+        "hightime.timedelta(days=999999999, seconds=86399, microseconds=999999, "
+        "femtoseconds=999999999, yoctoseconds=999999999)",
+        "hightime.timedelta(yoctoseconds=1)",
+        "hightime.timedelta(yoctoseconds=1)",
+    ]
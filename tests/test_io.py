@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import pathlib
+import zoneinfo
+
+import pytest
+
+import hightime
+import hightime.io
+from tests.shorthands import datetime, timedelta
+
+_UTC = std_datetime.timezone.utc
+
+_SORTED = [datetime(2024, 1, 1) + timedelta(ms=i, ys=i) for i in range(1000)]
+
+
+@pytest.fixture
+def path(tmp_path: pathlib.Path) -> pathlib.Path:
+    return tmp_path / "times.htc"
+
+
+def test_column_file_roundtrip(path: pathlib.Path) -> None:
+    with hightime.io.TimestampWriter(path) as writer:
+        writer.append(_SORTED[0])
+        writer.extend(_SORTED[1:500])
+        writer.extend(hightime.DatetimeArray(_SORTED[500:]))
+
+    with hightime.io.TimestampReader(path) as reader:
+        assert len(reader) == len(_SORTED)
+        assert list(reader) == _SORTED
+        assert reader.tzinfo is None
+        assert reader[0] == _SORTED[0]
+        assert reader[-1] == _SORTED[-1]
+        assert list(reader[10:20:3]) == _SORTED[10:20:3]
+        assert reader.array == hightime.DatetimeArray(_SORTED)
+
+
+def test_column_file_empty(path: pathlib.Path) -> None:
+    hightime.io.TimestampWriter(path).close()
+
+    with hightime.io.TimestampReader(path) as reader:
+        assert len(reader) == 0
+        assert reader.time_slice() == hightime.DatetimeArray()
+
+
+def test_column_file_append(path: pathlib.Path) -> None:
+    with hightime.io.TimestampWriter(path, tzinfo=_UTC) as writer:
+        writer.extend(_SORTED[:10])
+    with hightime.io.TimestampWriter(path) as writer:
+        assert writer.tzinfo is _UTC
+        writer.extend(_SORTED[10:20])
+    with hightime.io.TimestampWriter(path, tzinfo=_UTC) as writer:
+        writer.extend(_SORTED[20:30])
+
+    with hightime.io.TimestampReader(path) as reader:
+        assert list(reader) == [dt.replace(tzinfo=_UTC) for dt in _SORTED[:30]]
+
+
+def test_column_file_append_discards_partial_record(path: pathlib.Path) -> None:
+    with hightime.io.TimestampWriter(path) as writer:
+        writer.extend(_SORTED[:3])
+    with open(path, "ab") as file:
+        file.write(b"\x01" * 7)
+
+    with hightime.io.TimestampReader(path) as reader:
+        assert list(reader) == _SORTED[:3]
+    with hightime.io.TimestampWriter(path) as writer:
+        writer.append(_SORTED[3])
+    with hightime.io.TimestampReader(path) as reader:
+        assert list(reader) == _SORTED[:4]
+
+
+def test_column_file_append_tzinfo_mismatch(path: pathlib.Path) -> None:
+    hightime.io.TimestampWriter(path, tzinfo=_UTC).close()
+
+    with pytest.raises(ValueError):
+        hightime.io.TimestampWriter(
+            path, tzinfo=std_datetime.timezone(std_datetime.timedelta(hours=1))
+        )
+
+
+@pytest.mark.parametrize(
+    "tzinfo",
+    [
+        None,
+        _UTC,
+        std_datetime.timezone(std_datetime.timedelta(hours=5, minutes=30, microseconds=1)),
+        std_datetime.timezone(-std_datetime.timedelta(hours=8)),
+        zoneinfo.ZoneInfo("UTC"),
+    ],
+)
+def test_column_file_tzinfo(path: pathlib.Path, tzinfo: std_datetime.tzinfo | None) -> None:
+    with hightime.io.TimestampWriter(path, tzinfo=tzinfo) as writer:
+        writer.append(datetime(2024, 1, 1, fs=1))
+
+    with hightime.io.TimestampReader(path) as reader:
+        assert reader.tzinfo == tzinfo
+        expected = datetime(2024, 1, 1, fs=1, tzinfo=_UTC)
+        assert reader[0] == (expected.replace(tzinfo=None) if tzinfo is None else expected)
+        assert reader[0].tzinfo == tzinfo
+
+
+def test_column_file_unsupported_tzinfo(path: pathlib.Path) -> None:
+    class CustomZone(std_datetime.tzinfo):
+        def utcoffset(self, dt: std_datetime.datetime | None) -> std_datetime.timedelta:
+            return std_datetime.timedelta(0)
+
+        def dst(self, dt: std_datetime.datetime | None) -> std_datetime.timedelta:
+            return std_datetime.timedelta(0)
+
+        def tzname(self, dt: std_datetime.datetime | None) -> str:
+            return "Custom"
+
+    with pytest.raises(ValueError):
+        hightime.io.TimestampWriter(path, tzinfo=CustomZone())
+    assert not path.exists()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"HIGHTIME",
+        b"NOTHIGHT" + bytes(56),
+        b"HIGHTIME\x02\x00" + bytes(54),
+    ],
+)
+def test_column_file_invalid_header(path: pathlib.Path, data: bytes) -> None:
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError):
+        hightime.io.TimestampReader(path)
+
+
+def test_column_file_unsupported_unit(path: pathlib.Path) -> None:
+    hightime.io.TimestampWriter(path).close()
+    data = bytearray(path.read_bytes())
+    data[28] = 15
+
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        hightime.io.TimestampReader(path)
+
+
+def test_column_file_layout(path: pathlib.Path) -> None:
+    with hightime.io.TimestampWriter(path) as writer:
+        writer.append(datetime(1970, 1, 1, ys=1))
+
+    data = path.read_bytes()
+
+    assert data[:8] == b"HIGHTIME"
+    assert len(data) == 48 + 16
+    assert data[48:] == (1).to_bytes(16, "little")
+
+
+@pytest.mark.parametrize(
+    "start, stop, expected",
+    [
+        (None, None, slice(None)),
+        (_SORTED[10], _SORTED[20], slice(10, 20)),
+        (_SORTED[10] + timedelta(ys=1), _SORTED[20] + timedelta(ys=1), slice(11, 21)),
+        (datetime(2023, 1, 1), _SORTED[5], slice(0, 5)),
+        (_SORTED[995], None, slice(995, None)),
+        (_SORTED[20], _SORTED[10], slice(20, 20)),
+        (datetime(2025, 1, 1), None, slice(1000, None)),
+    ],
+)
+def test_column_file_time_slice(
+    path: pathlib.Path,
+    start: hightime.datetime | None,
+    stop: hightime.datetime | None,
+    expected: slice,
+) -> None:
+    with hightime.io.TimestampWriter(path) as writer:
+        writer.extend(_SORTED)
+
+    with hightime.io.TimestampReader(path) as reader:
+        assert list(reader.time_slice(start, stop)) == _SORTED[expected]
+
+
+def test_column_file_array_outlives_reader(path: pathlib.Path) -> None:
+    with hightime.io.TimestampWriter(path) as writer:
+        writer.extend(_SORTED[:10])
+
+    with hightime.io.TimestampReader(path) as reader:
+        view = reader[2:4]
+
+    assert list(view) == _SORTED[2:4]
+    assert len(reader) == 0
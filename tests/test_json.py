@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import json
+from typing import Any
+
+import pytest
+
+import hightime
+import hightime.json
+from tests.shorthands import datetime, timedelta
+
+_UTC = std_datetime.timezone.utc
+_PLUS_2 = std_datetime.timezone(std_datetime.timedelta(hours=2))
+
+_DATETIMES = [
+    datetime(1, 1, 1),
+    datetime(1969, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+    datetime(1970, 1, 1),
+    datetime(2024, 1, 2, 3, 4, 5, 600000),
+    datetime(2024, 1, 2, 3, 4, 5, 6, 7),
+    datetime(2024, 1, 2, 3, 4, 5, 6, 7, 8),
+    datetime(9999, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+]
+
+_TIMEDELTAS = [
+    timedelta(),
+    timedelta(ys=1),
+    timedelta(s=-1),
+    timedelta(d=1, s=2, us=3, fs=4, ys=5),
+]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (datetime(2024, 1, 1, fs=5), '"2024-01-01T00:00:00.000000000000005"'),
+        (datetime(2024, 1, 1, tzinfo=_PLUS_2), '"2024-01-01T00:00:00+02:00"'),
+        (timedelta(ms=1500), '"PT1.500S"'),
+        ([datetime(2024, 1, 1)], '["2024-01-01T00:00:00"]'),
+    ],
+)
+def test_default(value: object, expected: str) -> None:
+    assert json.dumps(value, default=hightime.json.default) == expected
+
+
+@pytest.mark.parametrize(
+    "style, value, expected",
+    [
+        ("ns", datetime(1970, 1, 1, 0, 0, 1, fs=1500000), 1000000002),
+        ("ns", datetime(1970, 1, 1, 1, tzinfo=_PLUS_2), -3600 * 10**9),
+        ("ns", timedelta(ns=-5), -5),
+        ("lv", datetime(2024, 1, 1, 0, 0, 0, 500000, tzinfo=_UTC), [3786912000, 2**63]),
+        ("lv", timedelta(s=-1, ms=250), [-1, 2**62]),
+    ],
+)
+def test_make_default(style: Any, value: object, expected: object) -> None:
+    encode = hightime.json.make_default(style)
+
+    assert json.loads(json.dumps(value, default=encode)) == expected
+
+
+@pytest.mark.parametrize("style", ["xml", "iso8601"])
+def test_invalid_style(style: Any) -> None:
+    with pytest.raises(ValueError):
+        hightime.json.make_default(style)
+    with pytest.raises(ValueError):
+        hightime.json.dumps_many([], style)
+
+
+def test_default_unsupported_type() -> None:
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=hightime.json.default)
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=hightime.json.make_default("ns"))
+
+
+def test_object_hook_roundtrip() -> None:
+    value = {
+        "t": datetime(2024, 1, 2, 3, 4, 5, 6, 7, 8),
+        "aware": datetime(2024, 1, 2, 3, tzinfo=_PLUS_2),
+        "dt": timedelta(d=1, ys=1),
+        "name": "Probe 1",
+        "period": "PT",
+        "date": "2024-01-02 has no time",
+        "nested": [{"t": datetime(2024, 1, 1)}],
+    }
+
+    result = json.loads(
+        json.dumps(value, default=hightime.json.default), object_hook=hightime.json.object_hook
+    )
+
+    assert result == {**value, "aware": datetime(2024, 1, 2, 1, tzinfo=_UTC)}
+    assert result["aware"].tzinfo is _UTC
+    assert type(result["t"]) is hightime.datetime
+    assert type(result["dt"]) is hightime.timedelta
+
+
+def test_make_object_hook_keys_and_tz() -> None:
+    text = '{"t": "2024-01-01T00:00:00", "u": "2024-01-01T00:00:00", "dt": "PT1S", "x": null}'
+
+    result = json.loads(
+        text,
+        object_hook=hightime.json.make_object_hook(
+            datetime_keys={"t", "x"}, timedelta_keys={"dt"}, tz=_PLUS_2
+        ),
+    )
+
+    assert result == {
+        "t": datetime(2024, 1, 1, 2, tzinfo=_PLUS_2),
+        "u": "2024-01-01T00:00:00",
+        "dt": timedelta(s=1),
+        "x": None,
+    }
+    assert result["t"].tzinfo is _PLUS_2
+
+
+def test_make_object_hook_keys_invalid_value() -> None:
+    hook = hightime.json.make_object_hook(datetime_keys={"t"})
+
+    with pytest.raises(ValueError):
+        json.loads('{"t": "tomorrow"}', object_hook=hook)
+
+
+# Values that the "ns" and "lv" styles represent exactly.
+_EXACT_VALUES = {
+    "ns": (datetime(2024, 1, 2, 3, 4, 5, 6, fs=7000000), timedelta(ns=-123456789)),
+    "lv": (datetime(2024, 1, 2, 3, 4, 5, 250000), timedelta(s=-2, ms=125)),
+}
+
+
+@pytest.mark.parametrize("style", ["ns", "lv"])
+def test_make_object_hook_numeric_roundtrip(style: Any) -> None:
+    value = dict(zip(["t", "dt"], _EXACT_VALUES[style]))
+    text = json.dumps(value, default=hightime.json.make_default(style))
+
+    hook = hightime.json.make_object_hook(style, datetime_keys=["t"], timedelta_keys=["dt"])
+
+    assert json.loads(text, object_hook=hook) == value
+
+
+def test_make_object_hook_numeric_requires_keys() -> None:
+    with pytest.raises(ValueError):
+        hightime.json.make_object_hook("ns")
+
+
+@pytest.mark.parametrize("make_input", [list, hightime.DatetimeArray])
+def test_dumps_many_iso_matches_isoformat(make_input: Any) -> None:
+    text = hightime.json.dumps_many(make_input(_DATETIMES))
+
+    assert json.loads(text) == [dt.isoformat() for dt in _DATETIMES]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [dt.replace(tzinfo=_UTC) for dt in _DATETIMES],
+        hightime.DatetimeArray(_DATETIMES, tzinfo=_UTC),
+        [datetime(2024, 1, 1, tzinfo=_PLUS_2), datetime(2024, 1, 1)],
+        hightime.DatetimeArray(_DATETIMES[2:-1], tzinfo=_PLUS_2),
+    ],
+)
+def test_dumps_many_iso_aware(values: Any) -> None:
+    assert json.loads(hightime.json.dumps_many(values)) == [dt.isoformat() for dt in values]
+
+
+@pytest.mark.parametrize("style", ["iso", "ns", "lv"])
+def test_dumps_many_loads_many_roundtrip(style: Any) -> None:
+    if style == "iso":
+        datetimes = _DATETIMES
+        timedeltas = _TIMEDELTAS
+    else:
+        dt, td = _EXACT_VALUES[style]
+        datetimes = [dt, dt + td, datetime(1970, 1, 1), datetime(1903, 12, 31)]
+        timedeltas = [td, -td, timedelta()]
+
+    text = hightime.json.dumps_many(datetimes, style)
+    deltas_text = hightime.json.dumps_many(timedeltas, style)
+
+    assert hightime.json.loads_many(text, style=style) == datetimes
+    assert hightime.json.loads_many(text, style=style, tz=_UTC) == [
+        dt.replace(tzinfo=_UTC) for dt in datetimes
+    ]
+    assert hightime.json.loads_many(deltas_text, "timedelta", style) == timedeltas
+
+
+def test_dumps_many_empty() -> None:
+    assert hightime.json.dumps_many([]) == "[]"
+    assert hightime.json.loads_many("[]") == []
+
+
+def test_loads_many_aware_iso_is_converted_to_utc() -> None:
+    text = '["2024-01-01T02:00:00+02:00", "2024-01-01T00:00:00"]'
+
+    result = hightime.json.loads_many(text)
+
+    # Compare the reprs, which include the tzinfo.
+    assert repr(result) == repr([datetime(2024, 1, 1, tzinfo=_UTC), datetime(2024, 1, 1)])
+    hooked = json.loads(
+        '{"aware": "2024-01-01T02:00:00+02:00", "naive": "2024-01-01T00:00:00"}',
+        object_hook=hightime.json.object_hook,
+    )
+    assert repr(result) == repr([hooked["aware"], hooked["naive"]])
+
+
+@pytest.mark.parametrize("text, kind", [('{"t": 1}', "datetime"), ("[]", "date")])
+def test_loads_many_invalid(text: str, kind: Any) -> None:
+    with pytest.raises(ValueError):
+        hightime.json.loads_many(text, kind)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import heapq
+import random
+from typing import Iterator
+
+import pytest
+
+import hightime
+from tests.shorthands import datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1)
+_PLUS_ONE = std_datetime.timezone(std_datetime.timedelta(hours=1))
+
+
+def _to_datetime(key: int) -> hightime.datetime:
+    return _EPOCH + timedelta(ys=key)
+
+
+def test_merge_matches_heapq_merge() -> None:
+    rng = random.Random(1)
+    streams = [
+        sorted(datetime(2024, 1, 1) + timedelta(ys=rng.randrange(10**9)) for _ in range(50))
+        for _ in range(7)
+    ]
+
+    merged = list(hightime.merge(streams))
+
+    assert [item for _, item in merged] == list(heapq.merge(*streams))
+    assert all(_to_datetime(key) == item for key, item in merged)
+
+
+def test_merge_offsets() -> None:
+    streams = [
+        [datetime(2024, 1, 1, 0, 0, 1), datetime(2024, 1, 1, 0, 0, 3)],
+        [datetime(2024, 1, 1, 0, 0, 1, ys=1)],
+    ]
+
+    merged = list(hightime.merge(streams, offsets=[timedelta(), timedelta(s=1, ys=-1)]))
+
+    assert [(_to_datetime(key), item) for key, item in merged] == [
+        (datetime(2024, 1, 1, 0, 0, 1), streams[0][0]),
+        (datetime(2024, 1, 1, 0, 0, 2), streams[1][0]),
+        (datetime(2024, 1, 1, 0, 0, 3), streams[0][1]),
+    ]
+
+
+def test_merge_key_and_ties() -> None:
+    streams = [
+        [("a", datetime(2024, 1, 1, 1, tzinfo=_PLUS_ONE)), ("b", datetime(2024, 1, 2))],
+        [("c", datetime(2024, 1, 1)), ("d", datetime(2024, 1, 2))],
+    ]
+
+    merged = hightime.merge(streams, key=lambda event: event[1])
+
+    assert [name for _, (name, _) in merged] == ["a", "c", "b", "d"]
+
+
+def test_merge_is_lazy() -> None:
+    consumed = []
+
+    def stream(name: str) -> Iterator[hightime.datetime]:
+        for second in range(3):
+            consumed.append((name, second))
+            yield datetime(2024, 1, 1, 0, 0, second)
+
+    merged = hightime.merge([stream("a"), stream("b")])
+    next(merged)
+
+    assert consumed == [("a", 0), ("b", 0)]
+
+
+@pytest.mark.parametrize("streams", [[], [[]], [[], [datetime(2024, 1, 1)], []]])
+def test_merge_empty_streams(streams: list[list[hightime.datetime]]) -> None:
+    assert [item for _, item in hightime.merge(streams)] == [
+        item for stream in streams for item in stream
+    ]
+
+
+def test_merge_unsorted_stream() -> None:
+    merged = hightime.merge([[datetime(2024, 1, 2), datetime(2024, 1, 1)]])
+
+    with pytest.raises(ValueError):
+        list(merged)
+
+
+def test_merge_offsets_length() -> None:
+    with pytest.raises(ValueError):
+        list(hightime.merge([[datetime(2024, 1, 1)]], offsets=[timedelta(), timedelta()]))
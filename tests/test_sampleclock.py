@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import decimal
+import fractions
+import itertools
+from typing import Any
+
+import pytest
+
+import hightime
+from tests.shorthands import datetime, timedelta
+
+_UTC = std_datetime.timezone.utc
+
+
+@pytest.mark.parametrize(
+    "kwargs, n, expected",
+    [
+        ({"dt": timedelta(us=1)}, 10**10, datetime(2024, 1, 1, 2, 46, 40)),
+        (
+            {"dt": timedelta(ys=1)},
+            -1,
+            datetime(2023, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+        ),
+        ({"rate": 3}, 1, datetime(2024, 1, 1, 0, 0, 0, 333333, 333333333, 333333333)),
+        ({"rate": 3}, 2, datetime(2024, 1, 1, 0, 0, 0, 666666, 666666666, 666666667)),
+        ({"rate": 3}, 3 * 10**10, datetime(2024, 1, 1) + timedelta(s=10**10)),
+        ({"rate": fractions.Fraction(10**24, 3)}, 3, datetime(2024, 1, 1, ys=9)),
+        ({"rate": decimal.Decimal("2.5")}, 1, datetime(2024, 1, 1, us=400000)),
+        ({"rate": 0.5}, 1, datetime(2024, 1, 1, 0, 0, 2)),
+    ],
+)
+def test_sample_clock_time_of(kwargs: dict[str, Any], n: int, expected: hightime.datetime) -> None:
+    clock = hightime.SampleClock(datetime(2024, 1, 1), **kwargs)
+
+    assert clock.time_of(n) == expected
+    assert clock.index_of(expected) == n
+    assert clock.index_of(expected, rounding="exact") == n
+
+
+@pytest.mark.parametrize("n, expected_ys", [(1, 0), (2, 1), (3, 2), (5, 2), (7, 4)])
+def test_sample_clock_time_of_rounds_half_to_even(n: int, expected_ys: int) -> None:
+    clock = hightime.SampleClock(datetime(2024, 1, 1), rate=2 * 10**24)
+
+    assert clock.time_of(n) == datetime(2024, 1, 1, ys=expected_ys)
+
+
+def test_sample_clock_time_of_does_not_accumulate_error() -> None:
+    clock = hightime.SampleClock(datetime(2024, 1, 1), rate=fractions.Fraction(1, 3))
+
+    assert clock.time_of(3 * 10**10) == datetime(2024, 1, 1) + timedelta(s=9 * 10**10)
+
+
+def test_sample_clock_tzinfo() -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=2))
+    clock = hightime.SampleClock(datetime(2024, 1, 1, tzinfo=tz), dt=timedelta(h=1))
+
+    assert clock.time_of(1).tzinfo is tz
+    assert clock.time_of(1) == datetime(2024, 1, 1, 1, tzinfo=tz)
+    assert clock.times(0, 2).tzinfo is tz
+    assert clock.index_of(datetime(2024, 1, 1, 1, tzinfo=_UTC)) == 3
+
+
+@pytest.mark.parametrize(
+    "t, rounding, expected",
+    [
+        (datetime(2024, 1, 1, 0, 0, 0, 400000), "nearest", 1),
+        (datetime(2024, 1, 1, 0, 0, 0, 400000), "floor", 1),
+        (datetime(2024, 1, 1, 0, 0, 0, 400000), "ceil", 2),
+        (datetime(2024, 1, 1, 0, 0, 0, 500000), "nearest", 2),
+        (datetime(2024, 1, 1, 0, 0, 0, 166666, 666666666, 666666666), "nearest", 0),
+        (datetime(2024, 1, 1, 0, 0, 0, 166666, 666666666, 666666667), "nearest", 1),
+        (datetime(2023, 12, 31, 23, 59, 59, 900000), "floor", -1),
+        (datetime(2023, 12, 31, 23, 59, 59, 900000), "ceil", 0),
+        # time_of(1) is rounded up to ...333333333; floor/ceil/exact follow the rounded times.
+        (datetime(2024, 1, 1, 0, 0, 0, 333333, 333333333, 333333333), "floor", 1),
+        (datetime(2024, 1, 1, 0, 0, 0, 333333, 333333333, 333333332), "floor", 0),
+        (datetime(2024, 1, 1, 0, 0, 0, 666666, 666666666, 666666667), "ceil", 2),
+        (datetime(2024, 1, 1, 0, 0, 0, 666666, 666666666, 666666668), "ceil", 3),
+    ],
+)
+def test_sample_clock_index_of(t: hightime.datetime, rounding: Any, expected: int) -> None:
+    clock = hightime.SampleClock(datetime(2024, 1, 1), rate=3)
+
+    assert clock.index_of(t, rounding=rounding) == expected
+
+
+def test_sample_clock_index_of_not_exact() -> None:
+    clock = hightime.SampleClock(datetime(2024, 1, 1), rate=3)
+
+    with pytest.raises(ValueError):
+        clock.index_of(datetime(2024, 1, 1, us=1), rounding="exact")
+
+
+def test_sample_clock_index_of_invalid_rounding() -> None:
+    clock = hightime.SampleClock(datetime(2024, 1, 1), rate=3)
+
+    with pytest.raises(ValueError):
+        clock.index_of(datetime(2024, 1, 1), rounding="up")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"dt": timedelta(ns=7)},
+        {"rate": 3},
+        {"rate": fractions.Fraction(10**24, 7)},
+        {"rate": 2 * 10**24},
+        {"rate": 48000.5},
+    ],
+)
+@pytest.mark.parametrize("start, stop", [(0, 50), (-20, 5), (10**11, 10**11 + 30), (5, 5)])
+def test_sample_clock_times(kwargs: dict[str, Any], start: int, stop: int) -> None:
+    clock = hightime.SampleClock(datetime(2024, 1, 1, fs=3), **kwargs)
+    expected = [clock.time_of(n) for n in range(start, stop)]
+
+    array = clock.times(start, stop)
+
+    assert isinstance(array, hightime.DatetimeArray)
+    assert list(array) == expected
+    assert list(clock.iter_times(start, stop)) == expected
+    assert list(itertools.islice(clock.iter_times(start), stop - start)) == expected
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, exception",
+    [
+        ((datetime(2024, 1, 1),), {}, TypeError),
+        ((datetime(2024, 1, 1), timedelta(s=1)), {"rate": 1}, TypeError),
+        ((std_datetime.datetime(2024, 1, 1), timedelta(s=1)), {}, TypeError),
+        ((datetime(2024, 1, 1), 1), {}, TypeError),
+        ((datetime(2024, 1, 1), timedelta()), {}, ValueError),
+        ((datetime(2024, 1, 1), timedelta(s=-1)), {}, ValueError),
+        ((datetime(2024, 1, 1),), {"rate": 0}, ValueError),
+        ((datetime(2024, 1, 1),), {"rate": -1.5}, ValueError),
+    ],
+)
+def test_sample_clock_invalid(
+    args: tuple[Any, ...], kwargs: dict[str, Any], exception: type[Exception]
+) -> None:
+    with pytest.raises(exception):
+        hightime.SampleClock(*args, **kwargs)
+
+
+def test_sample_clock_properties() -> None:
+    clock = hightime.SampleClock(datetime(2024, 1, 1), rate=3)
+
+    assert clock.t0 == datetime(2024, 1, 1)
+    assert clock.rate == 3
+    assert clock.dt == timedelta(us=333333, fs=333333333, ys=333333333)
+    assert hightime.SampleClock(datetime(2024, 1, 1), timedelta(ms=2)).rate == 500
+
+
+def test_sample_clock_eq_and_hash() -> None:
+    by_dt = hightime.SampleClock(datetime(2024, 1, 1), timedelta(ms=2))
+    by_rate = hightime.SampleClock(datetime(2024, 1, 1), rate=500)
+
+    assert by_dt == by_rate
+    assert hash(by_dt) == hash(by_rate)
+    assert by_dt != hightime.SampleClock(datetime(2024, 1, 1), rate=501)
+
+
+def test_sample_clock_repr() -> None:
+    assert repr(hightime.SampleClock(datetime(2024, 1, 1), timedelta(ms=2))) == (
+        "hightime.SampleClock(hightime.datetime(2024, 1, 1, 0, 0), "
+        "dt=hightime.timedelta(microseconds=2000))"
+    )
+    assert repr(hightime.SampleClock(datetime(2024, 1, 1), rate=3)) == (
+        "hightime.SampleClock(hightime.datetime(2024, 1, 1, 0, 0), rate=Fraction(3, 1))"
+    )
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import pickle
+import sys
+
+import pytest
+
+import hightime
+import hightime.shared
+from tests.shorthands import datetime, timedelta
+
+_UTC = std_datetime.timezone.utc
+
+_DATETIMES = [datetime(2024, 1, 1) + timedelta(ms=i, ys=i) for i in range(100)]
+
+
+def _first_and_count(chunk: hightime.DatetimeArray) -> tuple[hightime.datetime, int]:
+    return chunk[0], len(chunk)
+
+
+@pytest.mark.parametrize(
+    "datetimes", [_DATETIMES, hightime.DatetimeArray(_DATETIMES), hightime.DatetimeArray()]
+)
+def test_create_shared(datetimes: list[hightime.datetime] | hightime.DatetimeArray) -> None:
+    with hightime.shared.create_shared(datetimes) as shared:
+        assert len(shared) == len(datetimes)
+        assert list(shared) == list(datetimes)
+        assert shared.array == hightime.DatetimeArray(datetimes)
+        assert shared.tzinfo is None
+
+
+def test_create_shared_tzinfo() -> None:
+    with hightime.shared.create_shared(_DATETIMES, tzinfo=_UTC) as shared:
+        assert shared.tzinfo is _UTC
+        assert shared[0] == _DATETIMES[0].replace(tzinfo=_UTC)
+        assert list(shared[10:20:3]) == [dt.replace(tzinfo=_UTC) for dt in _DATETIMES[10:20:3]]
+
+
+def test_attach_shared() -> None:
+    with hightime.shared.create_shared(_DATETIMES, tzinfo=_UTC) as shared:
+        attached = hightime.shared.attach_shared(shared.name)
+        try:
+            assert attached.name == shared.name
+            assert attached.tzinfo is _UTC
+            assert attached.array == shared.array
+        finally:
+            attached.close()
+
+
+def test_shared_pickles_by_name() -> None:
+    with hightime.shared.create_shared(_DATETIMES) as shared:
+        data = pickle.dumps(shared)
+        assert len(data) < 100
+
+        attached = pickle.loads(data)
+        try:
+            assert list(attached) == _DATETIMES
+        finally:
+            attached.close()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="PEP 688 requires Python 3.12")
+def test_shared_buffer_protocol() -> None:
+    with hightime.shared.create_shared(_DATETIMES) as shared:
+        with memoryview(shared) as view:  # type: ignore[arg-type]
+            assert view.tobytes() == hightime.DatetimeArray(_DATETIMES).tobytes()
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 30, 100, 1000])
+def test_map_chunks(chunk_size: int | None) -> None:
+    size = chunk_size or 1
+    results = hightime.shared.map_chunks(
+        _first_and_count, _DATETIMES, chunk_size=chunk_size, max_workers=2
+    )
+
+    assert sum(count for _, count in results) == len(_DATETIMES)
+    if chunk_size is None:
+        # About four chunks per worker.
+        assert len(results) == 8
+    else:
+        assert results == [
+            (_DATETIMES[i], min(size, len(_DATETIMES) - i)) for i in range(0, len(_DATETIMES), size)
+        ]
+
+
+def test_map_chunks_shared_input() -> None:
+    with hightime.shared.create_shared(_DATETIMES, tzinfo=_UTC) as shared:
+        results = hightime.shared.map_chunks(_first_and_count, shared, chunk_size=50, max_workers=2)
+
+        assert results == [
+            (_DATETIMES[0].replace(tzinfo=_UTC), 50),
+            (_DATETIMES[50].replace(tzinfo=_UTC), 50),
+        ]
+        # The caller's block is left in place.
+        assert len(shared) == len(_DATETIMES)
+
+
+def test_map_chunks_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError):
+        hightime.shared.map_chunks(_first_and_count, _DATETIMES, chunk_size=0)
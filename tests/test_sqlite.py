@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import sqlite3
+from typing import Iterator
+
+import pytest
+
+import hightime
+import hightime.sqlite
+from tests.shorthands import datetime, timedelta
+
+_UTC = std_datetime.timezone.utc
+
+_DATETIMES = [
+    datetime(1, 1, 1),
+    datetime(1969, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+    datetime(1970, 1, 1),
+    datetime(1970, 1, 1, ys=1),
+    datetime(2024, 1, 1, fs=1),
+    datetime(2024, 1, 1, fs=1, ys=1),
+    datetime(9999, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+]
+
+_TIMEDELTAS = [
+    -timedelta(days=999999999),
+    timedelta(s=-1),
+    timedelta(ys=-1),
+    timedelta(),
+    timedelta(ys=1),
+    timedelta(days=999999999),
+]
+
+
+@pytest.fixture
+def connection() -> Iterator[sqlite3.Connection]:
+    connection = sqlite3.connect(":memory:", detect_types=sqlite3.PARSE_DECLTYPES)
+    hightime.sqlite.register(connection)
+    connection.execute("CREATE TABLE t (id INTEGER, ts HIGHTIME, delta HIGHTIME_TIMEDELTA)")
+    connection.execute("CREATE INDEX t_ts ON t (ts)")
+    yield connection
+    connection.close()
+
+
+def test_datetime_roundtrip(connection: sqlite3.Connection) -> None:
+    connection.executemany("INSERT INTO t (ts) VALUES (?)", [(dt,) for dt in _DATETIMES])
+
+    rows = connection.execute("SELECT ts FROM t").fetchall()
+
+    assert [ts for (ts,) in rows] == _DATETIMES
+    assert all(type(ts) is hightime.datetime for (ts,) in rows)
+
+
+def test_timedelta_roundtrip(connection: sqlite3.Connection) -> None:
+    connection.executemany("INSERT INTO t (delta) VALUES (?)", [(td,) for td in _TIMEDELTAS])
+
+    rows = connection.execute("SELECT delta FROM t").fetchall()
+
+    assert [delta for (delta,) in rows] == _TIMEDELTAS
+
+
+@pytest.mark.parametrize("column, values", [("ts", _DATETIMES), ("delta", _TIMEDELTAS)])
+def test_blobs_sort_in_order(
+    connection: sqlite3.Connection, column: str, values: list[object]
+) -> None:
+    connection.executemany(f"INSERT INTO t ({column}) VALUES (?)", [(v,) for v in values[::-1]])
+
+    rows = connection.execute(f"SELECT {column} FROM t ORDER BY {column}").fetchall()
+
+    assert [value for (value,) in rows] == values
+
+
+def test_aware_datetimes_are_stored_in_utc(connection: sqlite3.Connection) -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=-5))
+    connection.execute("INSERT INTO t (ts) VALUES (?)", (datetime(2024, 1, 1, 7, tzinfo=tz),))
+
+    assert connection.execute("SELECT ts FROM t").fetchone() == (datetime(2024, 1, 1, 12),)
+
+
+def test_register_tzinfo(connection: sqlite3.Connection) -> None:
+    connection.execute("INSERT INTO t (ts) VALUES (?)", (datetime(2024, 1, 1),))
+    hightime.sqlite.register(tzinfo=_UTC)
+    try:
+        (ts,) = connection.execute("SELECT ts FROM t").fetchone()
+    finally:
+        hightime.sqlite.register()
+
+    assert ts == datetime(2024, 1, 1, tzinfo=_UTC)
+    assert ts.tzinfo is _UTC
+
+
+def test_range_query_uses_index(connection: sqlite3.Connection) -> None:
+    sql = "SELECT ts FROM t WHERE ts BETWEEN ? AND ?"
+    connection.executemany("INSERT INTO t (ts) VALUES (?)", [(dt,) for dt in _DATETIMES])
+
+    rows = connection.execute(sql, (_DATETIMES[2], _DATETIMES[4])).fetchall()
+    plan = connection.execute("EXPLAIN QUERY PLAN " + sql, (_DATETIMES[2], _DATETIMES[4]))
+
+    assert [ts for (ts,) in rows] == _DATETIMES[2:5]
+    assert any("t_ts" in row[-1] for row in plan)
+
+
+def test_executemany_columns(connection: sqlite3.Connection) -> None:
+    hightime.sqlite.executemany(
+        connection,
+        "INSERT INTO t VALUES (?, ?, ?)",
+        range(len(_DATETIMES)),
+        hightime.DatetimeArray(_DATETIMES),
+        [timedelta(ys=i) for i in range(len(_DATETIMES))],
+    )
+
+    rows = connection.execute("SELECT * FROM t ORDER BY id").fetchall()
+
+    assert rows == [(i, dt, timedelta(ys=i)) for i, dt in enumerate(_DATETIMES)]
+
+
+@pytest.mark.parametrize("detect_types", [0, sqlite3.PARSE_DECLTYPES])
+def test_fetch_array(detect_types: int) -> None:
+    connection = sqlite3.connect(":memory:", detect_types=detect_types)
+    hightime.sqlite.register(connection)
+    connection.execute("CREATE TABLE t (ts HIGHTIME)")
+    hightime.sqlite.executemany(
+        connection, "INSERT INTO t VALUES (?)", hightime.DatetimeArray(_DATETIMES)
+    )
+
+    array = hightime.sqlite.fetch_array(connection.execute("SELECT ts FROM t"), tzinfo=_UTC)
+
+    assert array == hightime.DatetimeArray(_DATETIMES, tzinfo=_UTC)
+    connection.close()
+
+
+@pytest.mark.parametrize(
+    "sql, params, expected",
+    [
+        (
+            "SELECT hightime_isoformat(?)",
+            (datetime(2024, 1, 2, 3, fs=5),),
+            "2024-01-02T03:00:00.000000000000005",
+        ),
+        ("SELECT hightime_isoformat(NULL)", (), None),
+        ("SELECT hightime_unix_seconds(?)", (datetime(1970, 1, 1, 0, 0, 1, 500000),), 1.5),
+        (
+            "SELECT hightime_isoformat(hightime_from_isoformat(?))",
+            ("2024-01-02T03:04:05.5+01:00",),
+            "2024-01-02T02:04:05.500000",
+        ),
+        (
+            "SELECT hightime_isoformat(hightime_add(?, ?))",
+            (datetime(2024, 1, 1), timedelta(ys=-1)),
+            "2023-12-31T23:59:59.999999999999999999999999",
+        ),
+    ],
+)
+def test_sql_functions(
+    connection: sqlite3.Connection, sql: str, params: tuple[object, ...], expected: object
+) -> None:
+    assert connection.execute(sql, params).fetchone() == (expected,)
+
+
+def test_sql_diff(connection: sqlite3.Connection) -> None:
+    connection.execute("INSERT INTO t (ts) VALUES (?)", (datetime(2024, 1, 1, ys=5),))
+
+    (delta,) = connection.execute(
+        "SELECT hightime_diff(ts, ?) FROM t", (datetime(2024, 1, 1),)
+    ).fetchone()
+
+    assert hightime.timedelta.from_sort_key(delta) == timedelta(ys=5)
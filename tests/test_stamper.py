@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import threading
+
+import pytest
+
+import hightime
+from tests.shorthands import datetime
+
+_PLUS_ONE = std_datetime.timezone(std_datetime.timedelta(hours=1))
+_NS_2024 = 1704067200 * 10**9
+
+
+def test_monotonic_stamper_tiebreak() -> None:
+    readings = iter([_NS_2024, _NS_2024, _NS_2024 + 1, _NS_2024 - 5, _NS_2024 + 7])
+    stamper = hightime.MonotonicStamper(clock=readings.__next__)
+
+    stamps = [stamper.now() for _ in range(5)]
+
+    assert stamps == [
+        datetime(2024, 1, 1),
+        datetime(2024, 1, 1, ys=1),
+        datetime(2024, 1, 1, fs=1000000),
+        datetime(2024, 1, 1, fs=1000000, ys=1),
+        datetime(2024, 1, 1, fs=7000000),
+    ]
+
+
+def test_monotonic_stamper_tzinfo() -> None:
+    stamper = hightime.MonotonicStamper(_PLUS_ONE, clock=lambda: _NS_2024)
+
+    stamp = stamper.now()
+
+    assert stamper.tzinfo is _PLUS_ONE
+    assert stamp.tzinfo is _PLUS_ONE
+    assert stamp == datetime(2024, 1, 1, 1, tzinfo=_PLUS_ONE)
+
+
+def test_monotonic_stamper_now_many() -> None:
+    stamper = hightime.MonotonicStamper(clock=lambda: _NS_2024)
+
+    first = stamper.now()
+    many = stamper.now_many(3)
+    last = stamper.now()
+
+    assert list(many) == [datetime(2024, 1, 1, ys=ys) for ys in (1, 2, 3)]
+    assert first < many[0] and many[-1] < last
+    assert len(stamper.now_many(0)) == 0
+    with pytest.raises(ValueError):
+        stamper.now_many(-1)
+
+
+def test_monotonic_stamper_system_clock() -> None:
+    stamper = hightime.MonotonicStamper()
+
+    stamps = [stamper.now() for _ in range(1000)]
+
+    assert all(a < b for a, b in zip(stamps, stamps[1:]))
+
+
+def test_monotonic_stamper_threads_unique() -> None:
+    stamper = hightime.MonotonicStamper(clock=lambda: _NS_2024)
+    thread_count = 8
+    per_thread = 2000
+    barrier = threading.Barrier(thread_count)
+    results: list[list[int]] = [[] for _ in range(thread_count)]
+
+    def stamp(result: list[int]) -> None:
+        barrier.wait()
+        for _ in range(per_thread):
+            result.append(stamper._next_ys(1))
+
+    threads = [threading.Thread(target=stamp, args=(result,)) for result in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for result in results:
+        assert all(a < b for a, b in zip(result, result[1:]))
+    stamps = {ys for result in results for ys in result}
+    assert len(stamps) == thread_count * per_thread
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+import hightime
+from tests.shorthands import timedelta
+
+
+def _clock(*readings: int) -> Iterator[int]:
+    return iter(readings)
+
+
+def _stopwatch(laps: list[int], capacity: int = 1024) -> hightime.Stopwatch:
+    stopwatch = hightime.Stopwatch(capacity)
+    for ns in laps:
+        stopwatch.record_ns(ns)
+    return stopwatch
+
+
+def test_stopwatch_context_manager() -> None:
+    stopwatch = hightime.Stopwatch(clock=_clock(100, 350, 1000, 1001).__next__)
+
+    with stopwatch:
+        pass
+    with stopwatch:
+        pass
+
+    assert stopwatch.laps().tolist() == [timedelta(ns=250), timedelta(ns=1)]
+    assert stopwatch.last == timedelta(ns=1)
+    assert stopwatch.count == len(stopwatch) == 2
+
+
+def test_stopwatch_start_stop() -> None:
+    stopwatch = hightime.Stopwatch(clock=_clock(5, 12).__next__)
+
+    stopwatch.start()
+    stopwatch.stop()
+
+    assert stopwatch.last == timedelta(ns=7)
+    with pytest.raises(RuntimeError):
+        stopwatch.stop()
+
+
+def test_stopwatch_decorator() -> None:
+    stopwatch = hightime.Stopwatch(clock=_clock(0, 10, 20, 50).__next__)
+
+    @stopwatch
+    def double(value: int) -> int:
+        if value < 0:
+            raise ValueError(value)
+        return 2 * value
+
+    assert double(3) == 6
+    with pytest.raises(ValueError):
+        double(-1)
+    assert double.__name__ == "double"
+    assert stopwatch.laps().tolist() == [timedelta(ns=10), timedelta(ns=30)]
+
+
+def test_stopwatch_ring_buffer() -> None:
+    stopwatch = _stopwatch(list(range(1, 11)), capacity=4)
+
+    assert stopwatch.count == 10
+    assert len(stopwatch) == 4
+    assert stopwatch.laps().tolist() == [timedelta(ns=ns) for ns in range(7, 11)]
+
+    stopwatch.reset()
+
+    assert len(stopwatch) == 0
+    assert stopwatch.last is None
+
+
+def test_stopwatch_summary() -> None:
+    summary = _stopwatch([4, 1, 2, 3, 10]).summary()
+
+    assert summary == {
+        "count": 5,
+        "total": timedelta(ns=20),
+        "min": timedelta(ns=1),
+        "max": timedelta(ns=10),
+        "mean": timedelta(ns=4),
+        "stdev": timedelta(ns=3, fs=162277, ys=660168379),
+        "p50": timedelta(ns=3),
+        "p90": timedelta(ns=10),
+        "p99": timedelta(ns=10),
+    }
+
+
+def test_stopwatch_summary_empty() -> None:
+    summary = hightime.Stopwatch().summary()
+
+    assert summary["count"] == 0
+    assert summary["mean"] is None
+
+
+@pytest.mark.parametrize(
+    "laps, bins, expected",
+    [
+        ([], 3, []),
+        ([5, 5], 2, [(5, 6, 2), (6, 7, 0)]),
+        ([0, 1, 2, 3, 4, 5, 6], 3, [(0, 2, 2), (2, 4, 2), (4, 6, 3)]),
+    ],
+)
+def test_stopwatch_histogram(
+    laps: list[int], bins: int, expected: list[tuple[int, int, int]]
+) -> None:
+    histogram = _stopwatch(laps).histogram(bins)
+
+    assert histogram == [
+        (timedelta(ns=low), timedelta(ns=high), count) for low, high, count in expected
+    ]
+
+
+def test_stopwatch_report() -> None:
+    report = _stopwatch([1, 1, 2]).report(bins=1, width=4)
+
+    assert report.splitlines()[0] == "count: 3"
+    assert report.splitlines()[-1] == (
+        "[0:00:00.000000001000000, 0:00:00.000000002000000)        3 ####"
+    )
+
+
+@pytest.mark.parametrize("capacity", [0, -1])
+def test_stopwatch_invalid_capacity(capacity: int) -> None:
+    with pytest.raises(ValueError):
+        hightime.Stopwatch(capacity)
+
+
+def test_timer() -> None:
+    with hightime.timer(clock=_clock(1000, 2500).__next__) as t:
+        pass
+
+    assert t.last == timedelta(us=1, ns=500)
+    assert t.capacity == 1
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import array
+import datetime as std_datetime
+import fractions
+from typing import Any
+
+import pytest
+
+import hightime
+from tests.shorthands import datetime, timedelta
+
+_T0 = datetime(2024, 1, 1)
+
+
+def test_tick_timebase_convert() -> None:
+    timebase = hightime.TickTimebase(_T0, 1000, rate=10**7)
+
+    assert timebase.convert(1000) == _T0
+    assert timebase.convert(1001) == _T0 + timedelta(ns=100)
+    assert timebase.convert(999) == _T0 - timedelta(ns=100)
+
+
+@pytest.mark.parametrize(
+    "ticks, expected",
+    [
+        ([0xFFFFFFFF, 0, 1], [0xFFFFFFFF, 0x100000000, 0x100000001]),
+        ([0, 0x7FFFFFFF, 0xFFFFFFFE, 1], [0, 0x7FFFFFFF, 0xFFFFFFFE, 0x100000001]),
+        # Less than half the range backwards is a late value, not a rollover.
+        ([10, 5], [10, 5]),
+        ([0xFFFFFFF0, 0x10, 0xFFFFFFFF], [0xFFFFFFF0, 0x100000010, 0xFFFFFFFF]),
+    ],
+)
+def test_tick_timebase_unwrap(ticks: list[int], expected: list[int]) -> None:
+    scalar = hightime.TickTimebase(_T0, ticks[0], rate=1, counter_bits=32)
+    vector = hightime.TickTimebase(_T0, ticks[0], rate=1, counter_bits=32)
+
+    assert [scalar.unwrap(tick) for tick in ticks] == expected
+    assert vector.unwrap_many(ticks) == expected
+
+
+def test_tick_timebase_unwrap_many_continues_stream() -> None:
+    timebase = hightime.TickTimebase(_T0, 0, rate=1, counter_bits=8)
+
+    assert timebase.unwrap_many(range(0, 256, 100)) == [0, 100, 200]
+    assert timebase.unwrap_many(array.array("B", [44, 144])) == [300, 400]
+    assert timebase.unwrap(0) == 512
+
+
+@pytest.mark.parametrize(
+    "tick, exception", [(-1, ValueError), (2**32, ValueError), (1.0, TypeError)]
+)
+def test_tick_timebase_invalid_tick(tick: Any, exception: type[Exception]) -> None:
+    timebase = hightime.TickTimebase(_T0, 0, rate=1, counter_bits=32)
+
+    with pytest.raises(exception):
+        timebase.convert(tick)
+
+
+def test_tick_timebase_unwrap_many_rejects_float() -> None:
+    timebase = hightime.TickTimebase(_T0, 0, rate=1, counter_bits=8)
+
+    with pytest.raises(TypeError):
+        timebase.unwrap_many([10, 20.5])
+
+    assert timebase.unwrap(30) == 30
+
+
+def test_tick_timebase_unwrap_many_invalid_tick_keeps_state() -> None:
+    timebase = hightime.TickTimebase(_T0, 0, rate=1, counter_bits=8)
+
+    with pytest.raises(ValueError):
+        timebase.unwrap_many([10, 20, 256])
+
+    assert timebase.unwrap(30) == 30
+
+
+@pytest.mark.parametrize("counter_bits", [0, -1, 1.5])
+def test_tick_timebase_invalid_counter_bits(counter_bits: Any) -> None:
+    with pytest.raises(ValueError):
+        hightime.TickTimebase(_T0, 0, rate=1, counter_bits=counter_bits)
+
+
+def test_tick_timebase_convert_many() -> None:
+    timebase = hightime.TickTimebase(_T0, 0xFFFE, rate=3, counter_bits=16)
+    ticks = [0xFFFE, 0xFFFF, 0, 1, 2]
+    expected = [hightime.SampleClock(_T0, rate=3).time_of(n) for n in range(len(ticks))]
+
+    result = timebase.convert_many(ticks)
+
+    assert isinstance(result, hightime.DatetimeArray)
+    assert list(result) == expected
+
+
+def test_tick_timebase_reanchor() -> None:
+    timebase = hightime.TickTimebase(_T0, 0, rate=1000, counter_bits=20)
+    assert timebase.convert(60000) == _T0 + timedelta(s=60)
+
+    # The device clock turns out to run slightly fast.
+    timebase.reanchor(datetime(2024, 1, 1, 0, 1, 5), 65001)
+    timebase.reanchor(datetime(2024, 1, 1, 0, 2), 120000, rate=fractions.Fraction(999))
+
+    assert timebase.segments == [
+        (0, _T0, 1000),
+        (65001, datetime(2024, 1, 1, 0, 1, 5), 1000),
+        (120000, datetime(2024, 1, 1, 0, 2), 999),
+    ]
+    assert timebase.time_of(65000) == _T0 + timedelta(s=65)
+    assert timebase.time_of(65001) == datetime(2024, 1, 1, 0, 1, 5)
+    assert timebase.time_of(65002) == datetime(2024, 1, 1, 0, 1, 5, 1000)
+    assert timebase.time_of(120999) == datetime(2024, 1, 1, 0, 2, 1)
+    assert timebase.time_of(-1000) == _T0 - timedelta(s=1)
+    assert list(timebase.convert_many([120999, 130000])) == [
+        datetime(2024, 1, 1, 0, 2, 1),
+        timebase.time_of(130000),
+    ]
+    ticks = [65000, 65001, 0, 121998]
+    assert list(hightime.DatetimeArray._from_ys(timebase._iter_ys(ticks))) == [
+        timebase.time_of(tick) for tick in ticks
+    ]
+
+
+def test_tick_timebase_reanchor_must_move_forward() -> None:
+    timebase = hightime.TickTimebase(_T0, 100, rate=1000, counter_bits=16)
+
+    with pytest.raises(ValueError):
+        timebase.reanchor(_T0, 50)
+    with pytest.raises(ValueError):
+        timebase.reanchor(_T0, 200, rate=0)
+    with pytest.raises(TypeError):
+        timebase.reanchor(_T0, 200.0)  # type: ignore[arg-type]
+
+    assert timebase.unwrap(150) == 150
+    assert len(timebase.segments) == 1
+
+
+def test_tick_timebase_tzinfo() -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=1))
+    timebase = hightime.TickTimebase(datetime(2024, 1, 1, tzinfo=tz), 0, rate=1)
+
+    assert timebase.convert(1) == datetime(2024, 1, 1, 0, 0, 1, tzinfo=tz)
+    assert timebase.convert(1).tzinfo is tz
+    assert timebase.convert_many([2]).tzinfo is tz
+
+
+def test_tick_timebase_repr() -> None:
+    assert repr(hightime.TickTimebase(_T0, 5, rate=10, counter_bits=32)) == (
+        "hightime.TickTimebase(hightime.datetime(2024, 1, 1, 0, 0), 5, "
+        "rate=Fraction(10, 1), counter_bits=32)"
+    )
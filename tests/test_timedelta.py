@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import copy
 import datetime
+import decimal
 import pickle
+from decimal import Decimal
+from fractions import Fraction
 from typing import Any
 
 import pytest
@@ -162,6 +165,60 @@ def test_timedelta_precision_total_seconds(td: hightime.timedelta, expected: flo
     assert float(td.precision_total_seconds()) == expected
 
 
+@pytest.mark.parametrize(
+    "td, expected",
+    [
+        (timedelta(), "0"),
+        (timedelta(d=1), "86400"),
+        (timedelta(s=-1), "-1"),
+        (timedelta(us=1), "0.000001"),
+        (timedelta(ys=5), "5E-24"),
+        (timedelta(ys=-5), "-5E-24"),
+        (timedelta(us=3, fs=-7), "0.000002999999993"),
+        (timedelta(d=1, s=2, us=3, fs=4, ys=5), "86402.000003000000004000000005"),
+        (hightime.timedelta.max, "86399999999999.999999999999999999999999"),
+        (hightime.timedelta.min, "-86399999913600"),
+    ],
+)
+def test_timedelta_precision_total_seconds_is_exact(td: hightime.timedelta, expected: str) -> None:
+    result = td.precision_total_seconds()
+    assert isinstance(result, Decimal)
+    assert str(result) == expected
+
+
+def test_timedelta_precision_total_seconds_ignores_current_context() -> None:
+    td = timedelta(d=1, s=2, us=3, fs=4, ys=5)
+    with decimal.localcontext() as ctx:
+        ctx.prec = 5
+        assert str(td.precision_total_seconds()) == "86402.000003000000004000000005"
+
+
+def test_timedelta_precision_total_seconds_many() -> None:
+    tds = [timedelta(d=1), timedelta(ys=5), datetime.timedelta(microseconds=1)]
+    assert hightime.timedelta.precision_total_seconds_many(tds) == [
+        Decimal("86400"),
+        Decimal("5E-24"),
+        Decimal("0.000001"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "td, expected",
+    [
+        (timedelta(), Fraction(0)),
+        (timedelta(d=1), Fraction(86400)),
+        (timedelta(ys=1), Fraction(1, 10**24)),
+        (timedelta(ys=-1), Fraction(-1, 10**24)),
+        (timedelta(s=1, ys=1), Fraction(10**24 + 1, 10**24)),
+        (hightime.timedelta.max, Fraction(86400 * 10**33 - 1, 10**24)),
+    ],
+)
+def test_timedelta_total_seconds_fraction(td: hightime.timedelta, expected: Fraction) -> None:
+    result = td.total_seconds_fraction()
+    assert isinstance(result, Fraction)
+    assert result == expected
+
+
 @pytest.mark.parametrize(
     "td, middle_part",
     [
@@ -231,6 +288,239 @@ def test_timedelta_str(td: hightime.timedelta, expected: str) -> None:
     assert str(td) == expected
 
 
+@pytest.mark.parametrize(
+    "td",
+    [
+        timedelta(),
+        timedelta(d=1),
+        timedelta(d=-1),
+        timedelta(d=2, s=2, us=3),
+        timedelta(s=2, us=0, fs=40),
+        timedelta(d=1, s=2, us=3, fs=4, ys=5),
+        timedelta(ys=-1),
+        hightime.timedelta.min,
+        hightime.timedelta.max,
+    ],
+)
+def test_timedelta_fromstr_roundtrip(td: hightime.timedelta) -> None:
+    result = hightime.timedelta.fromstr(str(td))
+    assert isinstance(result, hightime.timedelta)
+    assert result == td
+
+
+def test_timedelta_fromstr_std_format() -> None:
+    assert hightime.timedelta.fromstr(str(datetime.timedelta(-3, 5, 7))) == timedelta(-3, 5, 7)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "1 day",
+        "1:2:3",
+        "0:60:00",
+        "0:00:00.",
+        "1 day 0:00:00",
+        "0:00:00.1234567890123456789012345",
+    ],
+)
+def test_timedelta_fromstr_invalid(value: str) -> None:
+    with pytest.raises(ValueError):
+        hightime.timedelta.fromstr(value)
+
+
+def test_timedelta_fromstr_many() -> None:
+    strings = b"0:00:01\n1 day, 0:00:00.000000000000000000000001"
+    assert hightime.timedelta.fromstr_many(strings) == [timedelta(s=1), timedelta(d=1, ys=1)]
+
+
+@pytest.mark.parametrize(
+    "td, expected",
+    [
+        (timedelta(), "PT0S"),
+        (timedelta(d=1), "P1D"),
+        (timedelta(h=1), "PT1H"),
+        (timedelta(m=1), "PT1M"),
+        (timedelta(s=1), "PT1S"),
+        (timedelta(d=1, h=2, m=3, s=4), "P1DT2H3M4S"),
+        (timedelta(d=1, s=4), "P1DT4S"),
+        (timedelta(h=1, s=4), "PT1H4S"),
+        (timedelta(ms=1), "PT0.001S"),
+        (timedelta(us=10), "PT0.000010S"),
+        (timedelta(ns=1), "PT0.000000001S"),
+        (timedelta(fs=40), "PT0.000000000000040S"),
+        (timedelta(ys=1), "PT0.000000000000000000000001S"),
+        (timedelta(d=1, h=2, ys=5), "P1DT2H0.000000000000000000000005S"),
+        (timedelta(s=-1), "-PT1S"),
+        (timedelta(ys=-1), "-PT0.000000000000000000000001S"),
+        (timedelta(d=-1, h=23), "-PT1H"),
+        (
+            hightime.timedelta.max,
+            "P999999999DT23H59M59.999999999999999999999999S",
+        ),
+        (hightime.timedelta.min, "-P999999999D"),
+    ],
+)
+def test_timedelta_isoformat(td: hightime.timedelta, expected: str) -> None:
+    assert td.isoformat() == expected
+    assert hightime.timedelta.fromisoformat(expected) == td
+
+
+@pytest.mark.parametrize(
+    "timespec, expected",
+    [
+        ("seconds", "-P1DT2H3M4S"),
+        ("milliseconds", "-P1DT2H3M4.567S"),
+        ("microseconds", "-P1DT2H3M4.567890S"),
+        ("nanoseconds", "-P1DT2H3M4.567890123S"),
+        ("picoseconds", "-P1DT2H3M4.567890123456S"),
+        ("femtoseconds", "-P1DT2H3M4.567890123456789S"),
+        ("attoseconds", "-P1DT2H3M4.567890123456789012S"),
+        ("zeptoseconds", "-P1DT2H3M4.567890123456789012345S"),
+        ("yoctoseconds", "-P1DT2H3M4.567890123456789012345678S"),
+    ],
+)
+def test_timedelta_isoformat_timespec(timespec: str, expected: str) -> None:
+    td = -timedelta(d=1, h=2, m=3, s=4, us=567890, fs=123456789, ys=12345678)
+    assert td.isoformat(timespec=timespec) == expected
+
+
+def test_timedelta_isoformat_timespec_shows_seconds() -> None:
+    assert timedelta(h=1).isoformat(timespec="milliseconds") == "PT1H0.000S"
+    assert timedelta(d=1).isoformat(timespec="seconds") == "P1D"
+
+
+def test_timedelta_isoformat_invalid_timespec() -> None:
+    with pytest.raises(ValueError):
+        timedelta().isoformat(timespec="hours")
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("P1W", timedelta(w=1)),
+        ("P1.5D", timedelta(d=1, h=12)),
+        ("PT0.5H", timedelta(m=30)),
+        ("PT0,5M", timedelta(s=30)),
+        ("+PT1S", timedelta(s=1)),
+        ("-P1DT1S", timedelta(d=-1, s=-1)),
+        ("PT0.1S", timedelta(ms=100)),
+        ("PT1.0000000000000000000000005S", timedelta(s=1)),
+        ("PT1.0000000000000000000000015S", timedelta(s=1, ys=2)),
+        ("P0D", timedelta()),
+        ("PT36H", timedelta(d=1, h=12)),
+    ],
+)
+def test_timedelta_fromisoformat(value: str, expected: hightime.timedelta) -> None:
+    result = hightime.timedelta.fromisoformat(value)
+    assert isinstance(result, hightime.timedelta)
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "value", ["", "P", "PT", "P1Y", "P1M", "1D", "P1DT", "PT1S1M", "P-1D", "PT.5S", "pt1s", " PT1S"]
+)
+def test_timedelta_fromisoformat_invalid(value: str) -> None:
+    with pytest.raises(ValueError):
+        hightime.timedelta.fromisoformat(value)
+
+
+def test_timedelta_fromisoformat_unrelated_type() -> None:
+    with pytest.raises(TypeError):
+        hightime.timedelta.fromisoformat(b"PT1S")  # type: ignore[arg-type]
+
+
+def test_timedelta_isoformat_many_roundtrip() -> None:
+    tds = [timedelta(d=i, fs=i, ys=-i) for i in range(-5, 5)]
+    strings = hightime.timedelta.isoformat_many(tds)
+    assert strings == [td.isoformat() for td in tds]
+    assert hightime.timedelta.fromisoformat_many(strings) == tds
+    assert hightime.timedelta.fromisoformat_many("\n".join(strings)) == tds
+    assert hightime.timedelta.fromisoformat_many("\n".join(strings).encode()) == tds
+
+
+def test_timedelta_isoformat_many_timespec() -> None:
+    assert hightime.timedelta.isoformat_many(
+        [timedelta(ns=1), datetime.timedelta(seconds=1)], timespec="nanoseconds"
+    ) == ["PT0.000000001S", "PT1.000000000S"]
+
+
+@pytest.mark.parametrize(
+    "td, format_spec, expected",
+    [
+        (timedelta(s=1), "", "0:00:01"),
+        (timedelta(s=1), "s", "1"),
+        (timedelta(s=1), ".3s", "1.000"),
+        (timedelta(us=1, fs=500), "s", "0.0000010000005"),
+        (timedelta(us=1, fs=500), ".12s", "0.000001000000"),
+        (timedelta(us=1, fs=500), ".13", "0.0000010000005"),
+        (timedelta(us=1, fs=500), "ns", "1000.0005"),
+        (timedelta(us=1, fs=500), ".2us", "1.00"),
+        (timedelta(ys=1), "ms", "0.000000000000000000001"),
+        (timedelta(ys=1), "ys", "1"),
+        (timedelta(zs=1), ".1ys", "1000.0"),
+        (timedelta(as_=1), "zs", "1000"),
+        (timedelta(fs=1), "as", "1000"),
+        (timedelta(ps=1), "fs", "1000"),
+        (timedelta(ns=1), "ps", "1000"),
+        (timedelta(d=1), "s", "86400"),
+        (timedelta(d=1), ".1fsf", "86400000000000000000.0"),
+        # Rounding is half to even
+        (timedelta(us=2.5), ".0us", "2"),
+        (timedelta(us=3.5), ".0us", "4"),
+        (timedelta(ys=-5), ".0zs", "-0"),
+        # Sign
+        (timedelta(s=1), "+s", "+1"),
+        (timedelta(s=1), " s", " 1"),
+        (timedelta(s=1), "-s", "1"),
+        (timedelta(s=-1), "+s", "-1"),
+        (timedelta(s=-1, ys=-1), "ys", "-1000000000000000000000001"),
+        # Width and alignment
+        (timedelta(ms=1), "10.3ms", "     1.000"),
+        (timedelta(ms=1), "<10.3ms", "1.000     "),
+        (timedelta(ms=1), "*^9.3ms", "**1.000**"),
+        (timedelta(ms=-1), "+>8ms", "++++++-1"),
+        (timedelta(us=-1234567), "010.3s", "-00001.235"),
+        (timedelta(ms=-1500), "08.1s", "-00001.5"),
+        (timedelta(ms=1500), "+08.1s", "+00001.5"),
+        (timedelta(ms=-1500), "<08.1s", "-1.50000"),
+        (timedelta(ms=-1500), "=8.1s", "-    1.5"),
+        (timedelta(ms=-1500), "*=+8.1s", "-****1.5"),
+        (timedelta(ms=1500), "*= 8.1s", " ****1.5"),
+        (timedelta(ms=-1500), "03.1s", "-1.5"),
+        # Engineering notation
+        (timedelta(), "e", "0e+00"),
+        (timedelta(), ".3e", "0.000e+00"),
+        (timedelta(s=1), "e", "1e+00"),
+        (timedelta(us=1, fs=500), "e", "1.0000005e-06"),
+        (timedelta(us=1, fs=500), "+.3e", "+1.000e-06"),
+        (timedelta(us=-12), ".1e", "-12.0e-06"),
+        (timedelta(ys=1), "e", "1e-24"),
+        (timedelta(ys=5), ".2e", "5.00e-24"),
+        (timedelta(d=3), "e", "259.2e+03"),
+        (timedelta(ms=999.9996), ".3e", "1.000e+00"),
+        (timedelta(ms=999.9996), ".3mse", "1.000e+03"),
+        (timedelta(ys=999999), ".2zse", "1.00e+03"),
+        (timedelta(ns=123456), "use", "123.456e+00"),
+    ],
+)
+def test_timedelta_format(td: hightime.timedelta, format_spec: str, expected: str) -> None:
+    assert format(td, format_spec) == expected
+    assert f"{td:{format_spec}}" == expected
+    assert format(td, format_spec) == expected  # cached
+
+
+@pytest.mark.parametrize("format_spec", ["x", "%S", "hs", ".s.", "10=s", "ee", ".3f.3"])
+def test_timedelta_format_invalid(format_spec: str) -> None:
+    with pytest.raises(ValueError):
+        format(timedelta(s=1), format_spec)
+
+
+def test_timedelta_format_unrelated_type() -> None:
+    with pytest.raises(TypeError):
+        timedelta(s=1).__format__(1)  # type: ignore[arg-type]
+
+
 @pytest.mark.parametrize(
     "left, right, eq, lt",
     [
@@ -768,3 +1058,44 @@ def test_timedelta_pickle_uses_public_package_name() -> None:
     td_bytes = pickle.dumps(td)
     assert b"hightime" in td_bytes
     assert b"hightime._timedelta" not in td_bytes
+
+
+_SORTED_TIMEDELTAS = [
+    hightime.timedelta.min,
+    timedelta(s=-1),
+    timedelta(ys=-1),
+    timedelta(),
+    timedelta(ys=1),
+    timedelta(d=1, s=2, us=3, fs=4, ys=5),
+    hightime.timedelta.max,
+]
+
+
+@pytest.mark.parametrize(
+    "td, expected",
+    [
+        (timedelta(), "80000000000000000000000000000000"),
+        (timedelta(ys=1), "80000000000000000000000000000001"),
+        (timedelta(ys=-1), "7fffffffffffffffffffffffffffffff"),
+        (datetime.timedelta(microseconds=1), "80000000000000000de0b6b3a7640000"),
+    ],
+)
+def test_timedelta_to_sort_key(td: datetime.timedelta, expected: str) -> None:
+    assert hightime.timedelta.to_sort_key(td).hex() == expected  # type: ignore[arg-type]
+
+
+def test_timedelta_sort_key_roundtrip() -> None:
+    keys = hightime.timedelta.to_sort_keys(_SORTED_TIMEDELTAS)
+
+    assert keys == [td.to_sort_key() for td in _SORTED_TIMEDELTAS]
+    assert sorted(keys) == keys
+    assert hightime.timedelta.from_sort_keys(keys) == _SORTED_TIMEDELTAS
+    assert [hightime.timedelta.from_sort_key(key) for key in keys] == _SORTED_TIMEDELTAS
+    assert (
+        sorted(_SORTED_TIMEDELTAS[::-1], key=hightime.timedelta.to_sort_key) == _SORTED_TIMEDELTAS
+    )
+
+
+def test_timedelta_from_sort_key_invalid_length() -> None:
+    with pytest.raises(ValueError):
+        hightime.timedelta.from_sort_key(bytes(8))
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import datetime as std_datetime
+import pathlib
+from collections.abc import Iterator
+
+import pytest
+
+import hightime
+import hightime.codecs
+import hightime.timescales
+from tests.shorthands import datetime
+
+_UTC = std_datetime.timezone.utc
+
+
+@pytest.fixture
+def restore_leap_seconds() -> Iterator[None]:
+    yield
+    hightime.timescales.reset_leap_seconds()
+
+
+@pytest.mark.parametrize(
+    "utc, tai",
+    [
+        (datetime(1970, 1, 1), datetime(1970, 1, 1, 0, 0, 10)),
+        (datetime(1972, 1, 1), datetime(1972, 1, 1, 0, 0, 10)),
+        (datetime(1980, 1, 6), datetime(1980, 1, 6, 0, 0, 19)),
+        (datetime(2016, 12, 31, 23, 59, 59), datetime(2017, 1, 1, 0, 0, 35)),
+        (
+            datetime(2016, 12, 31, 23, 59, 59, 999999, 999999999, 999999999),
+            datetime(2017, 1, 1, 0, 0, 35, 999999, 999999999, 999999999),
+        ),
+        (datetime(2017, 1, 1), datetime(2017, 1, 1, 0, 0, 37)),
+        (datetime(2024, 1, 1, fs=1, ys=1), datetime(2024, 1, 1, 0, 0, 37, fs=1, ys=1)),
+    ],
+)
+def test_datetime_to_tai(utc: hightime.datetime, tai: hightime.datetime) -> None:
+    result = utc.to_tai()
+    assert isinstance(result, hightime.datetime)
+    assert result.tzinfo is None
+    assert result == tai
+    assert hightime.datetime.from_tai(tai, tz=None) == utc
+
+
+def test_datetime_to_tai_aware() -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=-5))
+    assert datetime(2023, 12, 31, 19, tzinfo=tz).to_tai() == datetime(2024, 1, 1, 0, 0, 37)
+
+
+@pytest.mark.parametrize(
+    "tai, utc",
+    [
+        # Inside the 2016-12-31 leap second, which maps to the repeated 23:59:59.
+        (datetime(2017, 1, 1, 0, 0, 36), datetime(2016, 12, 31, 23, 59, 59)),
+        (datetime(2017, 1, 1, 0, 0, 36, 500000), datetime(2016, 12, 31, 23, 59, 59, 500000)),
+        (datetime(2017, 1, 1, 0, 0, 35, 500000), datetime(2016, 12, 31, 23, 59, 59, 500000)),
+        (datetime(2017, 1, 1, 0, 0, 37), datetime(2017, 1, 1)),
+    ],
+)
+def test_datetime_from_tai_leap_second(tai: hightime.datetime, utc: hightime.datetime) -> None:
+    assert hightime.datetime.from_tai(tai) == utc.replace(tzinfo=_UTC)
+
+
+def test_datetime_from_tai_tz() -> None:
+    tz = std_datetime.timezone(std_datetime.timedelta(hours=2))
+    result = hightime.datetime.from_tai(datetime(2024, 1, 1, 0, 0, 37, fs=5), tz=tz)
+    assert result.tzinfo is tz
+    assert result == datetime(2024, 1, 1, 2, fs=5, tzinfo=tz)
+
+
+@pytest.mark.parametrize(
+    "utc, gps",
+    [
+        (datetime(1980, 1, 6), datetime(1980, 1, 6)),
+        (datetime(2017, 1, 1), datetime(2017, 1, 1, 0, 0, 18)),
+        (datetime(2024, 1, 1, ys=7), datetime(2024, 1, 1, 0, 0, 18, ys=7)),
+    ],
+)
+def test_datetime_to_gps(utc: hightime.datetime, gps: hightime.datetime) -> None:
+    assert utc.to_gps() == gps
+    assert hightime.datetime.from_gps(gps) == utc.replace(tzinfo=_UTC)
+
+
+def test_datetime_gps_codec_with_time_scale() -> None:
+    gps_codec = hightime.codecs.lookup("gps")
+    utc = datetime(2024, 1, 1, tzinfo=_UTC)
+    value = gps_codec.encode(utc)
+    assert value == (2295, 86418 * 10**9)
+    assert gps_codec.decode(value) == utc
+    assert gps_codec.decode_timedelta(value) == utc.to_gps() - datetime(1980, 1, 6)
+
+
+_MANY_UTC = [
+    datetime(2016, 12, 31, 23, 59, 58),
+    datetime(2016, 12, 31, 23, 59, 59, 999999),
+    datetime(2017, 1, 1),
+    datetime(2017, 1, 1, 0, 0, 1),
+    datetime(1999, 1, 1),
+    datetime(1960, 1, 1),
+    datetime(2024, 6, 1, fs=123, ys=456),
+]
+
+
+def test_datetime_to_tai_many() -> None:
+    assert hightime.datetime.to_tai_many(_MANY_UTC) == [dt.to_tai() for dt in _MANY_UTC]
+
+
+def test_datetime_to_gps_many() -> None:
+    assert hightime.datetime.to_gps_many(iter(_MANY_UTC)) == [dt.to_gps() for dt in _MANY_UTC]
+
+
+def test_datetime_from_tai_many() -> None:
+    tai = [dt.to_tai() for dt in _MANY_UTC] + [datetime(2017, 1, 1, 0, 0, 36, 500000)]
+    assert hightime.datetime.from_tai_many(tai) == [hightime.datetime.from_tai(dt) for dt in tai]
+    assert hightime.datetime.from_tai_many(tai, tz=None) == _MANY_UTC + [
+        datetime(2016, 12, 31, 23, 59, 59, 500000)
+    ]
+
+
+def test_datetime_from_gps_many() -> None:
+    gps = hightime.datetime.to_gps_many(_MANY_UTC)
+    assert hightime.datetime.from_gps_many(gps, tz=None) == _MANY_UTC
+
+
+def test_tai_minus_utc() -> None:
+    assert hightime.timescales.tai_minus_utc(datetime(1900, 1, 1)) == 10
+    assert hightime.timescales.tai_minus_utc(datetime(2012, 6, 30, 23, 59, 59)) == 34
+    assert hightime.timescales.tai_minus_utc(datetime(2012, 7, 1)) == 35
+
+
+def test_leap_seconds() -> None:
+    table = hightime.timescales.leap_seconds()
+    assert len(table) == 28
+    assert table[-1] == (datetime(2017, 1, 1, tzinfo=_UTC), 37)
+    assert all(b[1] - a[1] == 1 for a, b in zip(table, table[1:]))
+
+
+_LEAP_SECONDS_LIST = """\
+#	Updated through IERS Bulletin C 99
+#$	 3913697760
+#@	3960057600
+#
+2272060800	10	# 1 Jan 1972
+3692217600	37	# 1 Jan 2017
+4102444800	38	# 1 Jan 2030 (not a real leap second)
+#h	0123 4567 89ab cdef 0123
+"""
+
+
+@pytest.mark.usefixtures("restore_leap_seconds")
+def test_load_leap_seconds(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "leap-seconds.list"
+    path.write_text(_LEAP_SECONDS_LIST)
+
+    expiration = hightime.timescales.load_leap_seconds(path)
+
+    assert expiration == datetime(2025, 6, 28, tzinfo=_UTC)
+    assert [offset for _, offset in hightime.timescales.leap_seconds()] == [10, 37, 38]
+    assert datetime(2030, 1, 1).to_tai() == datetime(2030, 1, 1, 0, 0, 38)
+    assert datetime(2016, 6, 1).to_tai() == datetime(2016, 6, 1, 0, 0, 10)
+
+    hightime.timescales.reset_leap_seconds()
+    assert datetime(2030, 1, 1).to_tai() == datetime(2030, 1, 1, 0, 0, 37)
+
+
+@pytest.mark.usefixtures("restore_leap_seconds")
+def test_load_leap_seconds_empty(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "leap-seconds.list"
+    path.write_text("# nothing here\n")
+
+    with pytest.raises(ValueError):
+        hightime.timescales.load_leap_seconds(path)
+
+    assert hightime.timescales.tai_minus_utc(datetime(2024, 1, 1)) == 37